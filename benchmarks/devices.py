@@ -0,0 +1,234 @@
+"""Integration benchmark against local Hue bridge and Tuya cloud stand-ins.
+
+    python main.py benchmark devices [--ops N] [--latency-ms MS]
+        [--jitter-ms MS] [--error-rate R] [--seed N] [--output devices.json]
+
+Runs the real commands and hooks — HueTurnOnLights, HueTurnOffLights,
+HueHook entering command mode and restoring the lights afterwards,
+TuyaPressKeyInfraredAC, and a whole "turn on" gesture (hook, command,
+restore) — through phue and tinytuya against the stand-ins in
+``benchmarks.standins``, each ``N`` times in a row.
+
+Reports per-operation latency, failures, operations per second and how
+many HTTP requests each operation made, by route.  ``--latency-ms``
+models the network and device: every request pays it, so round trips
+per command are what dominates.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import time
+from collections import Counter
+from typing import Callable, NamedTuple
+
+import tinytuya
+from phue import Bridge
+
+import bus
+import context
+import integrations
+from benchmarks.standins import FaultProfile, HueBridgeStandIn, TuyaCloudStandIn
+from commands.hue_turn_off_lights import HueTurnOffLights
+from commands.hue_turn_on_lights import HueTurnOnLights
+from commands.tuya_press_key_infrared_ac import TuyaPressKeyInfraredAC
+from hooks.hue_hook import HueHook
+from stats import summarize
+
+DEFAULT_OPS = 50
+LIGHT_IDS = [5, 6]
+COLOR = {"hue": 14922, "sat": 144, "bri": 254, "transitiontime": 20}
+HOOK_PARAMS = {
+    "light_ids": LIGHT_IDS,
+    "hue": 46920,
+    "sat": 254,
+    "bri": 254,
+    "transition": 4,
+}
+AC_DEVICE = "standin_ac"
+_AC = {
+    "type": "infrared_ac",
+    "id": "standin-remote",
+    "gateway_id": "standin-gateway",
+    "category_id": 5,
+    "remote_index": 1,
+}
+
+
+class Scenario(NamedTuple):
+    name: str
+    run: Callable[[], None]
+    setup: Callable[[], None] | None = None  # untimed, before each run
+
+
+def build_scenarios(hook: HueHook) -> list[Scenario]:
+    turn_on = HueTurnOnLights(LIGHT_IDS, COLOR)
+    turn_off = HueTurnOffLights(LIGHT_IDS)
+    press = TuyaPressKeyInfraredAC(AC_DEVICE, "power")
+
+    def settle() -> None:
+        bus.emit("command_mode_settled")
+
+    def gesture() -> None:
+        # What the controller does for one held "turn on" gesture.
+        hook.on_enter_command_mode()
+        hook.on_exit_command_mode()
+        turn_on.execute()
+        settle()
+
+    return [
+        Scenario("hue_turn_on", turn_on.execute),
+        Scenario("hue_turn_off", turn_off.execute),
+        Scenario("hue_hook_enter", hook.on_enter_command_mode, settle),
+        Scenario("hue_hook_settle", settle, hook.on_enter_command_mode),
+        Scenario("tuya_press_key", press.execute),
+        Scenario("hue_on_gesture", gesture, turn_off.execute),
+    ]
+
+
+def measure(scenario: Scenario, servers: list, ops: int) -> dict:
+    """Run ``scenario`` ``ops`` times, counting the requests each run made.
+
+    ``errors`` are runs that raised; a failed request the client library
+    swallowed only shows up in ``failed_requests``.
+    """
+    latencies = []
+    routes: Counter = Counter()
+    requests = []
+    failed_requests = 0
+    errors = []
+    setup_errors = 0
+    for _ in range(ops):
+        if scenario.setup is not None:
+            try:
+                scenario.setup()
+            except Exception:
+                setup_errors += 1
+        before = [len(server.requests) for server in servers]
+        start = time.perf_counter()
+        try:
+            scenario.run()
+        except Exception as exc:
+            errors.append(f"{type(exc).__name__}: {exc}")
+        latencies.append((time.perf_counter() - start) * 1000)
+        made = [
+            request
+            for server, n in zip(servers, before)
+            for request in server.requests[n:]
+        ]
+        requests.append(len(made))
+        failed_requests += sum(request.failed for request in made)
+        routes.update(request.route for request in made)
+    total = sum(latencies) / 1000
+    return {
+        "name": scenario.name,
+        "ops": ops,
+        "errors": len(errors),
+        "first_error": errors[0] if errors else None,
+        "setup_errors": setup_errors,
+        # Injected failures; more than ``errors`` means some went unnoticed.
+        "failed_requests": failed_requests,
+        "latency_ms": summarize(latencies),
+        "ops_per_second": ops / total if total else float("inf"),
+        "requests_per_op": summarize(requests),
+        "first_op_requests": requests[0] if requests else 0,
+        "routes_per_op": {route: n / ops for route, n in sorted(routes.items())},
+    }
+
+
+@contextlib.contextmanager
+def standins(faults: FaultProfile, seed: int = 0):
+    """Start both stand-ins and point phue, tinytuya, ``context`` and
+    the Tuya device config at them.  Yields ``(hue, tuya)`` servers."""
+    hue_server = HueBridgeStandIn(LIGHT_IDS, faults, seed=seed).start()
+    tuya_server = TuyaCloudStandIn(faults, seed=seed + 1).start()
+    saved_bundle = os.environ.get("REQUESTS_CA_BUNDLE")
+    # integrations.yaml is swapped out for this process only.
+    saved_integrations = integrations._cache
+    try:
+        os.environ["REQUESTS_CA_BUNDLE"] = tuya_server.cert_path
+        integrations._cache = {"tuya": {"devices": {AC_DEVICE: _AC}}}
+        context.register(
+            "hue_bridge",
+            Bridge(
+                hue_server.host,
+                username=HueBridgeStandIn.username,
+                config_file_path=os.devnull,
+            ),
+        )
+        # tuya.get_cloud() would fetch a token from the real cloud before
+        # urlhost can be redirected; starting with a stale token makes the
+        # first request renew it from the stand-in instead.
+        cloud = tinytuya.Cloud(
+            apiRegion="us",
+            apiKey="standin-key",
+            apiSecret="standin-secret",
+            initial_token="stale",
+        )
+        cloud.urlhost = tuya_server.host
+        context.register("tuya_cloud", cloud)
+        yield hue_server, tuya_server
+    finally:
+        integrations._cache = saved_integrations
+        if saved_bundle is None:
+            os.environ.pop("REQUESTS_CA_BUNDLE", None)
+        else:
+            os.environ["REQUESTS_CA_BUNDLE"] = saved_bundle
+        hue_server.close()
+        tuya_server.close()
+
+
+def run(
+    ops: int = DEFAULT_OPS,
+    faults: FaultProfile | None = None,
+    seed: int = 0,
+) -> list[dict]:
+    faults = faults or FaultProfile()
+    print(
+        f"[benchmark] {ops} op(s) per scenario; every request takes "
+        f"{faults.latency_ms:g} +/- {faults.jitter_ms:g} ms, "
+        f"{faults.error_rate:.0%} fail\n"
+    )
+    print(
+        f"{'scenario':<18}{'errors':>7}{'5xx':>5}{'p50 ms':>9}{'p95 ms':>9}"
+        f"{'p99 ms':>9}{'ops/s':>8}{'req/op':>8}"
+    )
+    rows = []
+    # phue logs every error response; they are counted instead.
+    phue_logger = logging.getLogger("phue")
+    saved_level = phue_logger.level
+    phue_logger.setLevel(logging.CRITICAL)
+    try:
+        with standins(faults, seed) as servers, open(os.devnull, "w") as devnull:
+            for scenario in build_scenarios(HueHook(HOOK_PARAMS)):
+                # Commands and hooks print as they go; keep the table readable.
+                with contextlib.redirect_stdout(devnull):
+                    row = measure(scenario, list(servers), ops)
+                rows.append(row)
+                _print_row(row)
+    finally:
+        phue_logger.setLevel(saved_level)
+    return rows
+
+
+def _print_row(row: dict) -> None:
+    latency = row["latency_ms"]
+    print(
+        f"{row['name']:<18}{row['errors']:>7}{row['failed_requests']:>5}"
+        f"{latency['p50']:>9.1f}"
+        f"{latency['p95']:>9.1f}{latency['p99']:>9.1f}"
+        f"{row['ops_per_second']:>8.1f}{row['requests_per_op']['mean']:>8.2f}"
+    )
+    for route, per_op in row["routes_per_op"].items():
+        print(f"    {per_op:>6.2f} x {route}")
+    if row["first_error"]:
+        print(f"    first error: {row['first_error']}")
+
+
+def save(rows: list[dict], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump({"scenarios": rows}, f, indent=2)
+        f.write("\n")
@@ -0,0 +1,153 @@
+"""Microbenchmarks of the pure-Python per-hand hot path.
+
+    python main.py benchmark micro [--ops N] [--repeat R] [--hands K]
+        [--noise S] [--dropout P] [--seed N] [--output micro.json]
+
+Times ``recognize``, ``GestureController._pick_gesture``,
+``neck_y_for_hand`` (what ``PoseDetector.neck_y_for_hand`` delegates
+to) and ``GestureController.handle_frame`` over synthetic landmarks from
+``gestures.synthetic``: the default wake-then-command script with
+``K`` people in view.  Needs neither MediaPipe nor OpenCV.
+
+Each case runs ``N`` operations ``R`` times and reports the best run, as
+``timeit`` does.  Ops/s per hand-frame is what sizes a deployment: one
+camera at 30 fps with two people in view needs 60 hand-frames/s.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import time
+from typing import Callable, NamedTuple
+
+import config
+from controller import GestureController
+from engine.replay import ReplayRegistry
+from gestures import synthetic
+from gestures.gating import PoseGate
+from gestures.pose_match import neck_y_for_hand
+from gestures.recognizer import recognize
+from state_machine import StateMachine
+
+DEFAULT_OPS = 200_000
+DEFAULT_REPEAT = 5
+
+
+class Case(NamedTuple):
+    name: str
+    run: Callable[[int], None]  # performs that many operations
+    hands_per_op: float
+
+
+def build_cases(frames: list[synthetic.SyntheticFrame], fps: float) -> list[Case]:
+    """One Case per hot-path function, all fed from ``frames``."""
+    hands = [lm for frame in frames for lm in frame.hands]
+    if not hands:
+        raise ValueError("The synthetic stream has no hands")
+    hand_lists = [frame.hands for frame in frames]
+    wrists = [
+        (lm[0].x, lm[0].y, frame.pose_result)
+        for frame in frames
+        for lm in frame.hands
+    ]
+    gate = PoseGate(config.POSE_WRIST_MATCH_THRESHOLD)
+    # handle_frame sees what gating lets through, as it would live.
+    raised = [gate.raised_hands(frame.hands, frame.pose_result) for frame in frames]
+    timestamps = [frame.timestamp for frame in frames]
+    period = len(frames) / fps
+    threshold = config.POSE_WRIST_MATCH_THRESHOLD
+    picker = GestureController(StateMachine(), ReplayRegistry(), [])
+
+    def run_recognize(ops: int) -> None:
+        n = len(hands)
+        for i in range(ops):
+            recognize(hands[i % n])
+
+    def run_pick_gesture(ops: int) -> None:
+        pick = picker._pick_gesture
+        n = len(hand_lists)
+        for i in range(ops):
+            pick(hand_lists[i % n])
+
+    def run_neck_y(ops: int) -> None:
+        n = len(wrists)
+        for i in range(ops):
+            x, y, pose = wrists[i % n]
+            neck_y_for_hand(x, y, pose, threshold)
+
+    def run_handle_frame(ops: int) -> None:
+        controller = GestureController(
+            StateMachine(), ReplayRegistry(), [], clock=None
+        )
+        handle = controller.handle_frame
+        n = len(frames)
+        for i in range(ops):
+            lap, j = divmod(i, n)
+            # Each lap replays the script later, so time keeps moving on.
+            handle(timestamps[j] + lap * period, raised[j])
+
+    return [
+        Case("recognize", run_recognize, 1.0),
+        Case("_pick_gesture", run_pick_gesture, len(hands) / len(frames)),
+        Case("neck_y_for_hand", run_neck_y, 1.0),
+        Case("handle_frame", run_handle_frame, sum(map(len, raised)) / len(frames)),
+    ]
+
+
+def measure(case: Case, ops: int, repeat: int) -> dict:
+    """Best of ``repeat`` runs of ``ops`` operations."""
+    best = float("inf")
+    # State transitions and timeouts print; keep that off the terminal.
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            case.run(ops)
+            best = min(best, time.perf_counter() - start)
+    ops_per_second = ops / best if best else float("inf")
+    return {
+        "name": case.name,
+        "ops": ops,
+        "repeat": repeat,
+        "best_seconds": best,
+        "ops_per_second": ops_per_second,
+        "ns_per_op": best / ops * 1e9,
+        "hand_frames_per_second": ops_per_second * case.hands_per_op,
+    }
+
+
+def run(
+    ops: int = DEFAULT_OPS,
+    repeat: int = DEFAULT_REPEAT,
+    hands: int = 1,
+    noise: float = 0.002,
+    dropout: float = 0.0,
+    seed: int = 0,
+    fps: float = 30.0,
+) -> list[dict]:
+    frames = list(
+        synthetic.stream(
+            fps=fps, hands=hands, noise=noise, dropout=dropout, seed=seed
+        )
+    )
+    print(
+        f"[benchmark] {len(frames)} synthetic frame(s), {hands} hand(s) in view, "
+        f"noise {noise}, dropout {dropout}; best of {repeat} x {ops} op(s)\n"
+    )
+    print(f"{'function':<18}{'ops/s':>12}{'ns/op':>10}{'hand-frames/s':>16}")
+    rows = []
+    for case in build_cases(frames, fps):
+        row = measure(case, ops, repeat)
+        rows.append(row)
+        print(
+            f"{row['name']:<18}{row['ops_per_second']:>12,.0f}"
+            f"{row['ns_per_op']:>10,.0f}{row['hand_frames_per_second']:>16,.0f}"
+        )
+    return rows
+
+
+def save(rows: list[dict], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump({"cases": rows}, f, indent=2)
+        f.write("\n")
@@ -0,0 +1,107 @@
+"""Per-variant model latency benchmark.
+
+    python main.py benchmark models [video] [frames]
+
+Runs every downloaded hand and pose model variant over frames from a
+video (``demo.mp4`` by default), with the model loaded from a path and
+from a shared buffer, and prints load time and per-frame latency.
+"""
+
+from __future__ import annotations
+
+import time
+
+import cv2
+
+import config
+from gestures.detector import HandDetector
+from gestures.frame import PreparedFrame
+from gestures.models import HAND_MODELS, POSE_MODELS
+from gestures.pose_detector import PoseDetector
+from stats import summarize
+
+DEFAULT_VIDEO = "demo.mp4"
+DEFAULT_FRAMES = 100
+
+
+def load_frames(path: str, limit: int) -> list:
+    """Read up to ``limit`` frames, resized to the configured capture size."""
+    cap = cv2.VideoCapture(path)
+    frames = []
+    while len(frames) < limit:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        frames.append(cv2.resize(frame, (config.FRAME_WIDTH, config.FRAME_HEIGHT)))
+    cap.release()
+    if not frames:
+        raise RuntimeError(f"No frames could be read from {path}")
+    return frames
+
+
+def _build(kind: str, variant: str, use_buffer: bool):
+    if kind == "hand":
+        return HandDetector(
+            max_hands=config.MEDIAPIPE_MAX_HANDS,
+            min_detection_confidence=config.MEDIAPIPE_MIN_DETECTION_CONFIDENCE,
+            min_tracking_confidence=config.MEDIAPIPE_MIN_TRACKING_CONFIDENCE,
+            model_variant=variant,
+            use_model_buffer=use_buffer,
+            delegate=config.INFERENCE_DELEGATE,
+        )
+    return PoseDetector(
+        max_poses=config.MEDIAPIPE_MAX_HANDS,
+        model_variant=variant,
+        use_model_buffer=use_buffer,
+        delegate=config.INFERENCE_DELEGATE,
+    )
+
+
+def bench_variant(kind: str, variant: str, use_buffer: bool, frames: list) -> dict:
+    start = time.perf_counter()
+    detector = _build(kind, variant, use_buffer)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    latencies = []
+    try:
+        for frame in frames:
+            prepared = PreparedFrame(frame)
+            start = time.perf_counter()
+            detector.process(prepared)
+            latencies.append((time.perf_counter() - start) * 1000)
+    finally:
+        detector.close()
+
+    return {"load_ms": load_ms, **summarize(latencies)}
+
+
+def run(video: str = DEFAULT_VIDEO, frame_count: int = DEFAULT_FRAMES) -> list[dict]:
+    frames = load_frames(video, frame_count)
+    print(
+        f"[benchmark] {len(frames)} frame(s) from {video} at "
+        f"{config.FRAME_WIDTH}x{config.FRAME_HEIGHT}, "
+        f"delegate={config.INFERENCE_DELEGATE}\n"
+    )
+    print(
+        f"{'model':<12}{'load':<8}{'load ms':>9}{'mean ms':>9}"
+        f"{'p50 ms':>9}{'p95 ms':>9}"
+    )
+
+    rows = []
+    for kind, models in (("hand", HAND_MODELS), ("pose", POSE_MODELS)):
+        for variant in models:
+            for use_buffer in (False, True):
+                try:
+                    row = bench_variant(kind, variant, use_buffer, frames)
+                except FileNotFoundError:
+                    print(f"{kind + '/' + variant:<12}not downloaded — skipping")
+                    break
+                row.update(kind=kind, variant=variant, use_buffer=use_buffer)
+                rows.append(row)
+                print(
+                    f"{kind + '/' + variant:<12}"
+                    f"{'buffer' if use_buffer else 'path':<8}"
+                    f"{row['load_ms']:>9.1f}{row['mean']:>9.2f}"
+                    f"{row['p50']:>9.2f}{row['p95']:>9.2f}"
+                )
+    return rows
@@ -0,0 +1,365 @@
+"""End-to-end pipeline benchmark over a recorded video.
+
+    python main.py benchmark pipeline [video] [--frames N]
+        [--variant NAME [KEY=VALUE ...]] ... [--output run.json]
+        [--baseline base.json [--max-regression PCT]]
+
+Plays a video (``demo.mp4`` by default) through the real pipeline — the
+configured engine, hand detector, gate model, raised-hand gate,
+``recognize``, GestureController and hooks — as fast as it decodes, on
+the file's timestamps.  Commands resolve to ReplayRegistry stand-ins, so
+no device is touched, and the GUI is always off.
+
+Each FrameProcessor step (and the capture read) is timed on whichever
+thread runs it: wall-clock latency with ``perf_counter`` and CPU time
+with ``thread_time``.  Work done outside this process (multiprocess
+workers) or inside MediaPipe's own threads (the live-stream engine) only
+shows up in the frame rate.
+
+Every ``--variant`` reruns the video with its config.yaml keys overridden
+(``engine=pipelined``, ``hand_roi_enabled=true``...) and the variants are
+printed side by side.  ``--output`` writes the results as JSON;
+``--baseline`` compares against such a file, variant by variant.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from contextlib import contextmanager
+
+import cv2
+import yaml
+
+import bus
+import config
+from capture.sources import VideoFileSource
+from controller import GestureController
+from engine.processor import FrameProcessor
+from engine.replay import ReplayRegistry
+from gestures import gating
+from gestures.gate_scheduler import GateModelScheduler
+from hooks import build_from_yaml as build_hooks
+from modes import start
+from state_machine import StateMachine
+from stats import summarize
+
+DEFAULT_VIDEO = "demo.mp4"
+DEFAULT_GESTURES = "gestures.yaml"
+STAGES = (
+    "read",
+    "pace",
+    "prepare",
+    "check_motion",
+    "detect_hands",
+    "update_gate_results",
+    "gate",
+    "control",
+    "render",
+)
+
+
+def parse_overrides(pairs: list[str]) -> dict:
+    """``["engine=pipelined", "hand_roi_enabled=true"]`` to config
+    attributes, with values parsed as YAML."""
+    overrides = {}
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        name = key.strip().upper()
+        if not sep or not hasattr(config, name):
+            raise ValueError(f"Expected <config key>=<value>, got '{pair}'")
+        overrides[name] = yaml.safe_load(value)
+    return overrides
+
+
+@contextmanager
+def overridden_config(overrides: dict):
+    """Set config attributes for the duration of the block."""
+    saved = {name: getattr(config, name) for name in overrides}
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(config, name, value)
+
+
+class StageTimer:
+    """Times calls to methods it wraps, per thread, in milliseconds."""
+
+    def __init__(self) -> None:
+        self.samples: dict[str, tuple[list[float], list[float]]] = {}
+
+    def wrap(self, obj, method: str, stage: str | None = None) -> None:
+        """Replace ``obj.method`` with a timed version of itself."""
+        fn = getattr(obj, method)
+        wall, cpu = self.samples.setdefault(stage or method, ([], []))
+
+        def timed(*args, **kwargs):
+            cpu_start = time.thread_time()
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                wall.append((time.perf_counter() - start) * 1000)
+                cpu.append((time.thread_time() - cpu_start) * 1000)
+
+        setattr(obj, method, timed)
+
+    def count(self, stage: str) -> int:
+        return len(self.samples.get(stage, ((), ()))[0])
+
+    def summary(self) -> dict[str, dict]:
+        """``summarize`` of latency and CPU time for every stage that ran."""
+        return {
+            stage: {"latency_ms": summarize(wall), "cpu_ms": summarize(cpu)}
+            for stage, (wall, cpu) in self.samples.items()
+            if wall
+        }
+
+
+def _limit_frames(cap: VideoFileSource, limit: int) -> None:
+    read = cap.read
+
+    def limited():
+        if cap.frames_read >= limit:
+            return False, None
+        return read()
+
+    cap.read = limited
+
+
+def run_variant(
+    video: str,
+    name: str,
+    overrides: dict,
+    frame_limit: int | None = None,
+    gestures_path: str | None = DEFAULT_GESTURES,
+) -> dict:
+    """Play ``video`` through the pipeline with ``overrides`` applied,
+    with the hooks configured in ``gestures_path`` (None: no hooks)."""
+    with overridden_config({**overrides, "GUI_ENABLED": False}):
+        result = _run(video, frame_limit, gestures_path)
+    return {
+        "name": name,
+        "overrides": {key.lower(): value for key, value in overrides.items()},
+        **result,
+    }
+
+
+def _run(video: str, frame_limit: int | None, gestures_path: str | None) -> dict:
+    cap = VideoFileSource(video)
+    if not cap.isOpened():
+        raise RuntimeError(f"Cannot open {video}")
+    if frame_limit is not None:
+        _limit_frames(cap, frame_limit)
+    actual = {
+        "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+    }
+
+    hand_gate = gating.build_from_config()
+    hand_kwargs = start.hand_detector_kwargs()
+    gate_model_kwargs = gating.gate_model_kwargs(hand_gate.model_kind)
+    detector, gate_model, ring, workers = start.build_inference(
+        hand_gate, hand_kwargs, gate_model_kwargs, actual
+    )
+
+    sm = StateMachine()
+    hooks = build_hooks(gestures_path, set()) if gestures_path else []
+    # File time is the only clock, as with ``start --source``.
+    controller = GestureController(sm, ReplayRegistry(), hooks, clock=None)
+    processor = FrameProcessor(
+        detector,
+        gate_model,
+        hand_gate,
+        sm,
+        controller,
+        hooks,
+        False,
+        motion_gate=start.build_motion_gate(),
+        gate_scheduler=GateModelScheduler(
+            config.GATE_MODEL_MAX_AGE_FRAMES, config.GATE_MODEL_MAX_WRIST_SHIFT
+        ),
+        mirror_landmarks=config.MIRROR_LANDMARKS,
+        frame_pool=start.build_frame_pool(),
+        duty_cycle=start.build_duty_cycle(),
+        governor=start.build_governor(),
+    )
+
+    timer = StageTimer()
+    timer.wrap(cap, "read")
+    for stage in STAGES[1:]:
+        timer.wrap(processor, stage)
+
+    commands: list[list] = []
+
+    def on_dispatch(now: float, gesture: str) -> None:
+        commands.append([round(now, 3), gesture])
+
+    bus.on("command_dispatched", on_dispatch)
+    cpu_start = time.process_time()
+    started = time.perf_counter()
+    try:
+        start.run_engine(cap, processor, hand_kwargs, gate_model_kwargs, workers, ring)
+    finally:
+        wall = time.perf_counter() - started
+        cpu = time.process_time() - cpu_start
+        bus.off("command_dispatched", on_dispatch)
+        if workers is not None:
+            workers.close()
+            ring.close()
+        if detector is not None:
+            detector.close()
+        if gate_model is not None:
+            gate_model.close()
+        cap.release()
+
+    processed = timer.count("control")
+    return {
+        "engine": config.ENGINE,
+        "frames_read": cap.frames_read,
+        "frames_processed": processed,
+        "video_seconds": cap.frame_time or 0.0,
+        "wall_seconds": wall,
+        "fps": processed / wall if wall else 0.0,
+        "cpu_seconds": cpu,
+        "cpu_percent": cpu / wall * 100 if wall else 0.0,
+        "commands": commands,
+        "stages": timer.summary(),
+    }
+
+
+def compare(results: dict, baseline: dict) -> list[dict]:
+    """Changes from ``baseline`` to ``results``, for every variant present
+    in both: frame rate and each stage's p50/p95 latency.
+
+    ``regression_pct`` is positive when the run got worse.
+    """
+    previous = {variant["name"]: variant for variant in baseline["variants"]}
+    rows = []
+    for variant in results["variants"]:
+        before = previous.get(variant["name"])
+        if before is None:
+            continue
+        metrics = [("fps", before["fps"], variant["fps"], -1)]
+        for stage, stats in variant["stages"].items():
+            old = before["stages"].get(stage)
+            if old is None:
+                continue
+            for pct in ("p50", "p95"):
+                metrics.append(
+                    (
+                        f"{stage} {pct}",
+                        old["latency_ms"][pct],
+                        stats["latency_ms"][pct],
+                        1,
+                    )
+                )
+        for metric, old_value, new_value, worse in metrics:
+            change = (new_value - old_value) / old_value * 100 if old_value else 0.0
+            rows.append(
+                {
+                    "variant": variant["name"],
+                    "metric": metric,
+                    "baseline": old_value,
+                    "current": new_value,
+                    "change_pct": change,
+                    "regression_pct": change * worse,
+                }
+            )
+    return rows
+
+
+def print_variant(result: dict) -> None:
+    print(
+        f"[benchmark] {result['name']} (engine={result['engine']}): "
+        f"{result['frames_processed']}/{result['frames_read']} frame(s) in "
+        f"{result['wall_seconds']:.1f} s, {result['fps']:.1f} fps, "
+        f"cpu {result['cpu_percent']:.0f}%, {len(result['commands'])} command(s)"
+    )
+    print(
+        f"  {'stage':<20}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+        f"{'cpu p50':>9}{'cpu p95':>9}"
+    )
+    for stage, stats in result["stages"].items():
+        latency, cpu = stats["latency_ms"], stats["cpu_ms"]
+        print(
+            f"  {stage:<20}{latency['p50']:>9.2f}{latency['p95']:>9.2f}"
+            f"{latency['p99']:>9.2f}{cpu['p50']:>9.2f}{cpu['p95']:>9.2f}"
+        )
+
+
+def print_side_by_side(variants: list[dict]) -> None:
+    """Frame rate, CPU and each stage's p95 latency, one column per variant."""
+    names = [variant["name"][:12] for variant in variants]
+    print(f"\n{'p95 ms':<20}" + "".join(f"{name:>13}" for name in names))
+    print(f"{'fps':<20}" + "".join(f"{v['fps']:>13.1f}" for v in variants))
+    print(f"{'cpu %':<20}" + "".join(f"{v['cpu_percent']:>13.0f}" for v in variants))
+    for stage in STAGES:
+        cells = []
+        for variant in variants:
+            stats = variant["stages"].get(stage)
+            cells.append(
+                f"{stats['latency_ms']['p95']:>13.2f}" if stats else f"{'-':>13}"
+            )
+        if any(cell.strip() != "-" for cell in cells):
+            print(f"{stage:<20}" + "".join(cells))
+
+
+def print_comparison(rows: list[dict]) -> None:
+    print(
+        f"\n{'variant':<14}{'metric':<26}{'baseline':>10}{'current':>10}"
+        f"{'change':>9}"
+    )
+    for row in rows:
+        print(
+            f"{row['variant'][:13]:<14}{row['metric']:<26}{row['baseline']:>10.2f}"
+            f"{row['current']:>10.2f}{row['change_pct']:>+8.1f}%"
+        )
+
+
+def run(
+    video: str = DEFAULT_VIDEO,
+    variants: list[tuple[str, dict]] | None = None,
+    frame_limit: int | None = None,
+    gestures_path: str | None = DEFAULT_GESTURES,
+) -> dict:
+    """Benchmark each ``(name, overrides)`` variant in turn.
+
+    Without a ``gestures_path`` file (the repo only ships the sample) the
+    pipeline runs without hooks.
+    """
+    variants = variants or [("current", {})]
+    if gestures_path and not os.path.exists(gestures_path):
+        print(f"[benchmark] {gestures_path} not found, running without hooks")
+        gestures_path = None
+    elif gestures_path:
+        print(f"[benchmark] Hooks from {gestures_path}")
+    results = {
+        "video": video,
+        "frame_limit": frame_limit,
+        "gestures": gestures_path,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "variants": [],
+    }
+    for name, overrides in variants:
+        result = run_variant(video, name, overrides, frame_limit, gestures_path)
+        results["variants"].append(result)
+        print_variant(result)
+    if len(results["variants"]) > 1:
+        print_side_by_side(results["variants"])
+    return results
+
+
+def save(results: dict, path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+
+
+def load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
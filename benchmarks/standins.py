@@ -0,0 +1,316 @@
+"""Local stand-ins for the Hue bridge and the Tuya cloud.
+
+Each serves the slice of the real HTTP API that ``integrations/hue.py``
+(through phue) and ``integrations/tuya.py`` (through tinytuya) use, on
+127.0.0.1, so commands and hooks can run unmodified without devices:
+
+- HueBridgeStandIn: ``GET /api/<user>/lights``, ``GET .../lights/<id>``,
+  ``PUT .../lights/<id>/state`` and ``GET .../config``, over plain HTTP
+  like a real bridge.  Pass ``address`` as phue's bridge IP.
+- TuyaCloudStandIn: ``GET /v1.0/token``, the infrared remote ``keys``
+  and ``command`` endpoints and ``GET /v1.0/devices/<id>``.  tinytuya
+  only speaks HTTPS, so this one serves TLS with a throwaway
+  self-signed certificate; point ``REQUESTS_CA_BUNDLE`` at ``cert_path``
+  and ``Cloud.urlhost`` at ``host``.
+
+A FaultProfile adds latency, jitter and errors to every request: a
+failed request changes nothing and gets the service's own error body
+with a 503.
+Every request is logged as a ServedRequest naming the route it hit, for
+counting round trips per command.
+"""
+
+from __future__ import annotations
+
+import datetime
+import ipaddress
+import json
+import os
+import random
+import re
+import ssl
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import NamedTuple
+
+
+@dataclass(frozen=True)
+class FaultProfile:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0  # uniform, +/- around latency_ms
+    error_rate: float = 0.0  # fraction of requests that fail
+
+
+class ServedRequest(NamedTuple):
+    method: str
+    route: str  # e.g. "PUT /lights/{id}/state"
+    status: int
+    failed: bool  # an injected error
+
+
+class StandInServer:
+    """A threaded HTTP server on 127.0.0.1 that delays, fails and logs
+    requests per its FaultProfile.  Subclasses implement ``route`` and
+    ``handle``."""
+
+    name = "stand-in"
+
+    def __init__(
+        self, faults: FaultProfile | None = None, port: int = 0, seed: int = 0
+    ) -> None:
+        self.faults = faults or FaultProfile()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests: list[ServedRequest] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self._server.server_address[:2]
+
+    @property
+    def host(self) -> str:
+        """``host:port``, as phue's IP or tinytuya's ``urlhost``."""
+        return "%s:%d" % self.address
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name=self.name, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def route(self, path: str) -> str:
+        """``path`` with IDs replaced by placeholders, for counting."""
+        raise NotImplementedError
+
+    def handle(self, method: str, path: str, body, headers) -> tuple[int, object]:
+        """Return ``(status, json_body)`` for one request that succeeds."""
+        raise NotImplementedError
+
+    def error_body(self, path: str) -> object:
+        """What the service sends back when it fails."""
+        raise NotImplementedError
+
+    def _serve(self, handler: BaseHTTPRequestHandler) -> None:
+        length = int(handler.headers.get("Content-Length") or 0)
+        raw = handler.rfile.read(length) if length else b""
+        body = json.loads(raw) if raw else None
+        path = handler.path.split("?", 1)[0]
+
+        with self._lock:
+            delay = self.faults.latency_ms + self._rng.uniform(
+                -self.faults.jitter_ms, self.faults.jitter_ms
+            )
+            failed = self._rng.random() < self.faults.error_rate
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        with self._lock:
+            if failed:
+                status, payload = 503, self.error_body(path)
+            else:
+                status, payload = self.handle(
+                    handler.command, path, body, handler.headers
+                )
+            route = f"{handler.command} {self.route(path)}"
+            self.requests.append(ServedRequest(handler.command, route, status, failed))
+
+        data = json.dumps(payload).encode()
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(data)))
+        handler.end_headers()
+        handler.wfile.write(data)
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server._serve(self)
+
+            do_PUT = do_POST = do_DELETE = do_GET
+
+            def log_message(self, format, *args):
+                pass  # one line per request would flood the console
+
+        return Handler
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+
+
+_HUE_LIGHT = re.compile(r"^/api/[^/]+/lights/(\d+)(/state)?/?$")
+
+
+class HueBridgeStandIn(StandInServer):
+    name = "hue-standin"
+    username = "standin"
+
+    def __init__(
+        self,
+        light_ids=(5, 6),
+        faults: FaultProfile | None = None,
+        port: int = 0,
+        seed: int = 0,
+    ) -> None:
+        super().__init__(faults, port, seed)
+        self.lights = {
+            str(lid): {
+                "name": f"Stand-in light {lid}",
+                "type": "Extended color light",
+                "state": {
+                    "on": False,
+                    "bri": 254,
+                    "hue": 8418,
+                    "sat": 140,
+                    "ct": 366,
+                    "colormode": "ct",
+                    "reachable": True,
+                },
+            }
+            for lid in light_ids
+        }
+
+    def route(self, path):
+        path = re.sub(r"^/api/[^/]+", "", path).rstrip("/")
+        return re.sub(r"/\d+", "/{id}", path)
+
+    def handle(self, method, path, body, headers):
+        match = _HUE_LIGHT.match(path)
+        if match:
+            lid, is_state = match.groups()
+            light = self.lights.get(lid)
+            if light is None:
+                return 200, self._error(3, path, "not available")
+            if is_state and method == "PUT":
+                state = light["state"]
+                state.update({k: v for k, v in body.items() if k != "transitiontime"})
+                if "hue" in body or "sat" in body:
+                    state["colormode"] = "hs"
+                elif "ct" in body:
+                    state["colormode"] = "ct"
+                return 200, [
+                    {"success": {f"/lights/{lid}/state/{k}": v}}
+                    for k, v in body.items()
+                ]
+            return 200, light
+        if re.match(r"^/api/[^/]+/lights/?$", path):
+            return 200, self.lights
+        if re.match(r"^/api/[^/]+/config/?$", path):
+            return 200, {"name": "Stand-in bridge"}
+        return 404, self._error(4, path, "method not available")
+
+    def error_body(self, path):
+        return self._error(901, path, "Internal error, 503")
+
+    @staticmethod
+    def _error(kind: int, path: str, description: str) -> list:
+        return [{"error": {"type": kind, "address": path, "description": description}}]
+
+
+_LOCALHOST = ipaddress.ip_address("127.0.0.1")
+TOKEN = "standin-token"
+_TUYA_REMOTE = re.compile(r"^/v2\.0/infrareds/[^/]+/remotes/[^/]+/(keys|command)$")
+
+
+class TuyaCloudStandIn(StandInServer):
+    name = "tuya-standin"
+
+    def __init__(
+        self,
+        faults: FaultProfile | None = None,
+        port: int = 0,
+        seed: int = 0,
+    ) -> None:
+        super().__init__(faults, port, seed)
+        self.commands: list[dict] = []
+        self._cert_dir = tempfile.TemporaryDirectory(prefix="tuya-standin-")
+        self.cert_path, key_path = _self_signed_cert(self._cert_dir.name)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(self.cert_path, key_path)
+        self._server.socket = context.wrap_socket(
+            self._server.socket, server_side=True
+        )
+
+    def route(self, path):
+        return re.sub(r"(infrareds|remotes|devices)/[^/]+", r"\1/{id}", path)
+
+    def handle(self, method, path, body, headers):
+        if path == "/v1.0/token":
+            result = {"access_token": TOKEN, "expire_time": 7200}
+            return 200, self._ok(result)
+        if headers.get("access_token") != TOKEN:
+            return 200, {"success": False, "code": 1010, "msg": "token invalid"}
+        match = _TUYA_REMOTE.match(path)
+        if match and match.group(1) == "command":
+            self.commands.append(body)
+            return 200, self._ok(True)
+        if match:
+            keys = [{"key": "power", "key_id": 1, "key_name": "Power"}]
+            return 200, self._ok({"key_list": keys})
+        if path.startswith("/v1.0/devices/"):
+            return 200, self._ok({"uid": "standin"})
+        return 404, {"success": False, "code": 1108, "msg": "uri path invalid"}
+
+    def error_body(self, path):
+        return {"success": False, "code": 500, "msg": "system error, please retry"}
+
+    @staticmethod
+    def _ok(result) -> dict:
+        return {"success": True, "result": result, "t": int(time.time() * 1000)}
+
+    def close(self) -> None:
+        super().close()
+        self._cert_dir.cleanup()
+
+
+def _self_signed_cert(directory: str) -> tuple[str, str]:
+    """Write a certificate and key for 127.0.0.1; return their paths.
+
+    ``cryptography`` is already a tinytuya dependency.
+    """
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=5))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.IPAddress(_LOCALHOST)]), critical=False
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(
+            key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+    return cert_path, key_path
@@ -3,6 +3,18 @@
     import bus
     bus.on("lights_changed", lambda light_ids: ...)
     bus.emit("lights_changed", light_ids=[4, 5])
+
+Events:
+    state_changed           old, new             every StateMachine transition
+    gesture_changed         now, gesture         the controller's gesture changed
+    wake_started            now, gesture         a wake gesture started being held
+    gesture_hold_started    now, gesture         a command gesture started being held
+    command_dispatched      now, gesture         a held gesture's command is about to run
+    command_executed        now, gesture, error  a command ran; error is None or
+                                                 the failure message
+    command_mode_timed_out  now                  command mode ended unused
+    command_mode_settled                         after either of the above
+    lights_changed          light_ids            a Hue command changed lights
 """
 
 from __future__ import annotations
@@ -0,0 +1,87 @@
+"""Open a camera with explicit latency-related settings.
+
+Drivers are free to ignore any property, so after setting them we read
+back what was actually negotiated and log both.  ``buffer_size: 1`` and
+an MJPG FOURCC are what usually get USB webcams below 100 ms of
+buffering; V4L2 is the only Linux backend that honours BUFFERSIZE.
+"""
+
+from __future__ import annotations
+
+import cv2
+
+BACKENDS = {
+    "any": cv2.CAP_ANY,
+    "v4l2": cv2.CAP_V4L2,
+    "gstreamer": cv2.CAP_GSTREAMER,
+    "ffmpeg": cv2.CAP_FFMPEG,
+    "dshow": cv2.CAP_DSHOW,
+    "msmf": cv2.CAP_MSMF,
+    "avfoundation": cv2.CAP_AVFOUNDATION,
+}
+
+
+def fourcc_to_str(value: float) -> str:
+    """Decode ``CAP_PROP_FOURCC`` into its four characters ("" if unset)."""
+    code = int(value)
+    if code <= 0:
+        return ""
+    return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4))
+
+
+def open_camera(
+    source: int | str,
+    width: int | None = None,
+    height: int | None = None,
+    backend: str = "any",
+    fourcc: str | None = None,
+    buffer_size: int | None = None,
+    fps: float | None = None,
+) -> cv2.VideoCapture:
+    """Open ``source`` (camera index or path) and request the given settings.
+
+    FOURCC is set before the resolution because some V4L2 drivers only
+    offer high resolutions in MJPG.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unknown capture backend '{backend}', expected one of {list(BACKENDS)}"
+        )
+    cap = cv2.VideoCapture(source, BACKENDS[backend])
+    if fourcc:
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+    if width:
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    if height:
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    if buffer_size is not None:
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)
+    if fps:
+        cap.set(cv2.CAP_PROP_FPS, fps)
+    return cap
+
+
+def negotiated(cap: cv2.VideoCapture) -> dict:
+    """What the driver actually accepted.  Unsupported properties read -1 or 0."""
+    return {
+        "backend": cap.getBackendName() if cap.isOpened() else "",
+        "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        "fourcc": fourcc_to_str(cap.get(cv2.CAP_PROP_FOURCC)),
+        "buffer_size": int(cap.get(cv2.CAP_PROP_BUFFERSIZE)),
+        "fps": cap.get(cv2.CAP_PROP_FPS),
+    }
+
+
+def log_negotiated(cap: cv2.VideoCapture, requested: dict) -> dict:
+    """Print the negotiated settings, flagging any the driver changed."""
+    actual = negotiated(cap)
+    parts = []
+    for key, value in actual.items():
+        wanted = requested.get(key)
+        if wanted is not None and wanted != value:
+            parts.append(f"{key}={value} (requested {wanted})")
+        else:
+            parts.append(f"{key}={value}")
+    print("[capture] " + " ".join(parts))
+    return actual
@@ -0,0 +1,118 @@
+"""LatestFrameReader — reads a cv2.VideoCapture on its own thread.
+
+Only the newest frame is kept.  If the consumer is slower than the
+camera, older frames are overwritten (and counted as dropped) instead of
+piling up in the driver buffer, so every ``read()`` returns the freshest
+frame available.
+
+A stall — a slow first frame after opening, a USB hiccup — is waited
+out: ``read()`` only reports the end of the stream once the underlying
+capture has ended or closed, or the reader was released.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import numpy as np
+
+
+class LatestFrameReader:
+    def __init__(self, cap, read_timeout: float | None = 1.0) -> None:
+        self._cap = cap
+        # How often a waiting read() checks that the capture is still open.
+        self._read_timeout = read_timeout
+
+        self._cond = threading.Condition()
+        self._frame: np.ndarray | None = None
+        self._grabbed_at = 0.0
+        self._returned_grabbed_at: float | None = None
+        self._seq = 0
+        self._consumed_seq = 0
+        self._dropped = 0
+        self._running = False
+        self._ended = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the last frame returned by ``read()``."""
+        return self._consumed_seq
+
+    @property
+    def frame_timestamp(self) -> float | None:
+        """``time.monotonic()`` at which the last returned frame was grabbed."""
+        return self._returned_grabbed_at
+
+    @property
+    def dropped_frames(self) -> int:
+        """Frames captured but overwritten before anyone read them."""
+        return self._dropped
+
+    def isOpened(self) -> bool:
+        return self._cap.isOpened()
+
+    def start(self) -> "LatestFrameReader":
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, name="capture-reader", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        try:
+            while self._running:
+                ok, frame = self._cap.read()
+                if not ok:
+                    return
+                self._publish(frame, time.monotonic())
+        finally:
+            self._end()
+
+    def _publish(self, frame: np.ndarray, grabbed_at: float) -> None:
+        """Make ``frame`` the newest one, counting the one it replaces if unread."""
+        with self._cond:
+            if self._seq > self._consumed_seq:
+                self._dropped += 1
+            self._frame = frame
+            self._grabbed_at = grabbed_at
+            self._seq += 1
+            self._cond.notify_all()
+
+    def _end(self) -> None:
+        with self._cond:
+            self._ended = True
+            self._cond.notify_all()
+
+    def read(self) -> tuple[bool, np.ndarray | None]:
+        """Block until a frame newer than the last one read is available.
+
+        Mirrors ``cv2.VideoCapture.read()``: returns ``(False, None)`` once
+        the underlying capture has ended or closed, or the reader was
+        released.  Waiting longer than ``read_timeout`` seconds for a frame
+        is not an error; the capture is checked and the wait goes on.
+        """
+        with self._cond:
+            while not self._cond.wait_for(
+                lambda: self._seq > self._consumed_seq
+                or self._ended
+                or not self._running,
+                timeout=self._read_timeout,
+            ):
+                if not self.isOpened():
+                    break
+            if self._seq <= self._consumed_seq:
+                return False, None
+            self._consumed_seq = self._seq
+            self._returned_grabbed_at = self._grabbed_at
+            return True, self._frame
+
+    def release(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=self._read_timeout)
+        self._cap.release()
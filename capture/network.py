@@ -0,0 +1,155 @@
+"""NetworkStreamSource — an IP camera (RTSP or HTTP MJPEG) as a frame source.
+
+Frames are decoded on a dedicated thread with LatestFrameReader's
+newest-frame-wins semantics.  When the stream cannot be opened or stops
+delivering, the thread reconnects with exponential backoff; meanwhile
+``read()`` simply waits, so the listener keeps running through a camera
+reboot or a network blip.
+
+Two numbers describe how the stream is doing:
+
+- decode fps: frames decoded per second over the last ``window`` frames
+- lag: how old the newest frame already was when ``read()`` returned it;
+  a growing lag means the consumer, not the network, is the bottleneck
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Callable
+
+import cv2
+import numpy as np
+
+from capture.latest_frame import LatestFrameReader
+from stats import summarize
+
+
+def open_stream(url: str, timeout_ms: int = 5000) -> cv2.VideoCapture:
+    """Open ``url`` with FFmpeg, bounding how long connects and reads may block."""
+    return cv2.VideoCapture(
+        url,
+        cv2.CAP_FFMPEG,
+        [
+            cv2.CAP_PROP_OPEN_TIMEOUT_MSEC,
+            timeout_ms,
+            cv2.CAP_PROP_READ_TIMEOUT_MSEC,
+            timeout_ms,
+        ],
+    )
+
+
+class NetworkStreamSource(LatestFrameReader):
+    def __init__(
+        self,
+        url: str,
+        timeout_ms: int = 5000,
+        backoff_initial: float = 0.5,
+        backoff_max: float = 10.0,
+        window: int = 100,
+        opener: Callable[[str, int], object] = open_stream,
+    ) -> None:
+        # read() waits through reconnects instead of reporting the end.
+        super().__init__(None, read_timeout=None)
+        self.url = url
+        self._timeout_ms = timeout_ms
+        self._backoff_initial = backoff_initial
+        self._backoff_max = backoff_max
+        self._opener = opener
+        self._decoded_at: deque = deque(maxlen=window)
+        self._lag: deque = deque(maxlen=window)
+        self._shape: tuple | None = None
+        self.reconnects = 0
+
+    def isOpened(self) -> bool:
+        # Connection problems are retried, never fatal.
+        return True
+
+    def _run(self) -> None:
+        delay = self._backoff_initial
+        try:
+            while self._running:
+                if self._cap is None:
+                    cap = self._opener(self.url, self._timeout_ms)
+                    if not cap.isOpened():
+                        cap.release()
+                        print(
+                            f"[network] Cannot open {self.url}, "
+                            f"retrying in {delay:.1f} s"
+                        )
+                        delay = self._back_off(delay)
+                        continue
+                    self._cap = cap
+                    print(f"[network] Connected to {self.url}")
+
+                ok, frame = self._cap.read()
+                if not ok:
+                    self._cap.release()
+                    self._cap = None
+                    self.reconnects += 1
+                    print(f"[network] Stream lost, reconnecting in {delay:.1f} s")
+                    delay = self._back_off(delay)
+                    continue
+
+                # Only a stream that actually delivers resets the backoff.
+                delay = self._backoff_initial
+                decoded_at = time.monotonic()
+                self._decoded_at.append(decoded_at)
+                self._shape = frame.shape
+                self._publish(frame, decoded_at)
+        finally:
+            # Like LatestFrameReader._run: an opener or read() that raises
+            # must still end the stream, or read() would wait forever.
+            if self._cap is not None:
+                self._cap.release()
+                self._cap = None
+            self._end()
+
+    def _back_off(self, delay: float) -> float:
+        """Wait ``delay`` seconds, or until released; return the next delay."""
+        with self._cond:
+            self._cond.wait_for(lambda: not self._running, timeout=delay)
+        return min(delay * 2, self._backoff_max)
+
+    def wait_for_frame(self, timeout: float | None = None) -> tuple[int, int] | None:
+        """Block until the first frame is decoded; its ``(height, width)``.
+
+        None if ``timeout`` passed first.
+        """
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._shape is not None or self._ended or not self._running,
+                timeout=timeout,
+            )
+        return None if self._shape is None else self._shape[:2]
+
+    def read(self) -> tuple[bool, np.ndarray | None]:
+        ok, frame = super().read()
+        if ok:
+            self._lag.append((time.monotonic() - self.frame_timestamp) * 1000)
+        return ok, frame
+
+    @property
+    def decode_fps(self) -> float:
+        decoded_at = list(self._decoded_at)
+        if len(decoded_at) < 2 or decoded_at[-1] == decoded_at[0]:
+            return 0.0
+        return (len(decoded_at) - 1) / (decoded_at[-1] - decoded_at[0])
+
+    def stats(self) -> dict:
+        """Decode fps, ``summarize`` of the lag in ms, and reconnect count."""
+        return {
+            "decode_fps": self.decode_fps,
+            "lag_ms": summarize(list(self._lag)),
+            "reconnects": self.reconnects,
+        }
+
+    def release(self) -> None:
+        # The decode thread owns the capture and releases it on its way out;
+        # a read blocked on a dead socket ends within timeout_ms.
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=self._timeout_ms / 1000)
@@ -0,0 +1,88 @@
+"""Frame sources — where the engines get their frames from.
+
+A frame source is anything with the ``cv2.VideoCapture`` subset the
+engines use: ``read()``, ``isOpened()`` and ``release()``, and optionally
+``grab()``.  Cameras are opened with ``open_camera``; recordings with
+VideoFileSource.
+
+Sources that play a recording also report ``frame_time``, the timestamp
+of the last frame read in seconds from the start of the file.  Engines
+hand it to the controller instead of ``time.monotonic()`` so holds and
+timeouts follow the recording and a replay behaves the same on every
+run, however fast the machine decodes it.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+import cv2
+import numpy as np
+
+
+def frame_time(cap) -> float | None:
+    """The source's timestamp for its last frame; None for live sources."""
+    return getattr(cap, "frame_time", None)
+
+
+class VideoFileSource:
+    """Plays a video file as fast as it decodes, or ``paced`` to its timestamps.
+
+    Paced playback sleeps until each frame's timestamp, measured from the
+    first frame, has elapsed on ``clock``, like a camera would deliver it.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        paced: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.path = path
+        self._cap = cv2.VideoCapture(path)
+        self._paced = paced
+        self._clock = clock
+        self._sleep = sleep
+        fps = self._cap.get(cv2.CAP_PROP_FPS)
+        self._frame_interval = 1.0 / fps if fps and fps > 0 else 1.0 / 30
+        self._started_at: float | None = None
+        self.frame_time: float | None = None
+        self.frames_read = 0
+
+    def isOpened(self) -> bool:
+        return self._cap.isOpened()
+
+    def get(self, prop: int) -> float:
+        return self._cap.get(prop)
+
+    def read(self) -> tuple[bool, np.ndarray | None]:
+        ok, frame = self._cap.read()
+        if ok:
+            self._advance()
+        return ok, frame
+
+    def grab(self) -> bool:
+        """Skip a frame; it still takes its place on the timeline."""
+        ok = self._cap.grab()
+        if ok:
+            self._advance()
+        return ok
+
+    def _advance(self) -> None:
+        t = self._cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+        if self.frame_time is not None and t <= self.frame_time:
+            # Containers without usable timestamps: assume the nominal rate.
+            t = self.frame_time + self._frame_interval
+        self.frame_time = t
+        self.frames_read += 1
+        if self._paced:
+            if self._started_at is None:
+                self._started_at = self._clock() - t
+            delay = self._started_at + t - self._clock()
+            if delay > 0:
+                self._sleep(delay)
+
+    def release(self) -> None:
+        self._cap.release()
@@ -0,0 +1,63 @@
+"""TimedCapture — measures per-frame capture latency.
+
+Wraps anything with a ``read()`` (a ``cv2.VideoCapture``, a
+LatestFrameReader, a file or a synthetic source) and records, per frame:
+
+- ``read``: how long ``read()`` blocked, in ms
+- ``interval``: time between consecutive frames, in ms
+- ``age``: how old the frame already was when returned, in ms — only for
+  sources that expose ``frame_timestamp`` (the threaded reader does)
+
+Only the most recent ``window`` samples are kept.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Callable
+
+from stats import summarize
+
+
+class TimedCapture:
+    def __init__(
+        self,
+        cap,
+        window: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._cap = cap
+        self._clock = clock
+        self._last_return: float | None = None
+        self.samples: dict[str, deque] = {
+            name: deque(maxlen=window) for name in ("read", "interval", "age")
+        }
+
+    def read(self):
+        start = self._clock()
+        ok, frame = self._cap.read()
+        end = self._clock()
+        if not ok:
+            return ok, frame
+
+        self.samples["read"].append((end - start) * 1000)
+        if self._last_return is not None:
+            self.samples["interval"].append((end - self._last_return) * 1000)
+        self._last_return = end
+        captured_at = getattr(self._cap, "frame_timestamp", None)
+        if captured_at is not None:
+            self.samples["age"].append((end - captured_at) * 1000)
+        return ok, frame
+
+    def summary(self) -> dict[str, dict]:
+        """``summarize`` of each non-empty sample series."""
+        return {
+            name: summarize(list(values))
+            for name, values in self.samples.items()
+            if values
+        }
+
+    def __getattr__(self, name):
+        # isOpened(), release(), dropped_frames, ... of the wrapped source.
+        return getattr(self._cap, name)
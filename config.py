@@ -16,6 +16,19 @@ CAMERA_INDEX: int = _data["camera_index"]
 FRAME_WIDTH: int = _data["frame_width"]
 FRAME_HEIGHT: int = _data["frame_height"]
 
+CAPTURE_BACKEND: str = _data.get("capture_backend", "any")
+CAPTURE_FOURCC: str | None = _data.get("capture_fourcc")
+CAPTURE_BUFFER_SIZE: int | None = _data.get("capture_buffer_size")
+CAPTURE_FPS: float | None = _data.get("capture_fps")
+CAPTURE_TIMING_ENABLED: bool = _data.get("capture_timing_enabled", False)
+CAPTURE_THREADED: bool = _data.get("capture_threaded", True)
+CAMERA_URL: str | None = _data.get("camera_url")
+NETWORK_TIMEOUT_MS: int = _data.get("network_timeout_ms", 5000)
+NETWORK_RECONNECT_INITIAL_SECONDS: float = _data.get(
+    "network_reconnect_initial_seconds", 0.5
+)
+NETWORK_RECONNECT_MAX_SECONDS: float = _data.get("network_reconnect_max_seconds", 10.0)
+
 WAKE_HOLD_SECONDS: float = _data["wake_hold_seconds"]
 COMMAND_HOLD_SECONDS: float = _data["command_hold_seconds"]
 COMMAND_TIMEOUT_SECONDS: float = _data["command_timeout_seconds"]
@@ -23,8 +36,76 @@ COMMAND_DEBOUNCE_SECONDS: float = _data["command_debounce_seconds"]
 
 GUI_ENABLED: bool = _data["gui_enabled"]
 
+ENGINE: str = _data.get("engine", "serial")
+PIPELINE_QUEUE_SIZE: int = _data.get("pipeline_queue_size", 2)
+PIPELINE_QUEUE_POLICY: str = _data.get("pipeline_queue_policy", "drop_oldest")
+MULTIPROCESS_RING_SLOTS: int = _data.get("multiprocess_ring_slots", 4)
+
 MEDIAPIPE_MAX_HANDS: int = _data["mediapipe_max_hands"]
 MEDIAPIPE_MIN_DETECTION_CONFIDENCE: float = _data["mediapipe_min_detection_confidence"]
 MEDIAPIPE_MIN_TRACKING_CONFIDENCE: float = _data["mediapipe_min_tracking_confidence"]
 
+HAND_MODEL_VARIANT: str = _data.get("hand_model_variant", "full")
+POSE_MODEL_VARIANT: str = _data.get("pose_model_variant", "lite")
+MODEL_LOAD_FROM_BUFFER: bool = _data.get("model_load_from_buffer", False)
+INFERENCE_DELEGATE: str = _data.get("inference_delegate", "cpu")
+OPENCV_THREADS: int | None = _data.get("opencv_threads")
+
+HAND_ROI_ENABLED: bool = _data.get("hand_roi_enabled", False)
+HAND_ROI_FULL_FRAME_INTERVAL: int = _data.get("hand_roi_full_frame_interval", 15)
+HAND_ROI_PADDING: float = _data.get("hand_roi_padding", 0.35)
+
+MOTION_GATE_ENABLED: bool = _data.get("motion_gate_enabled", False)
+MOTION_GATE_WIDTH: int = _data.get("motion_gate_width", 64)
+MOTION_GATE_PIXEL_THRESHOLD: int = _data.get("motion_gate_pixel_threshold", 12)
+MOTION_GATE_MIN_CHANGED_FRACTION: float = _data.get(
+    "motion_gate_min_changed_fraction", 0.01
+)
+MOTION_GATE_RECHECK_FRAMES: int = _data.get("motion_gate_recheck_frames", 30)
+
+HAND_GATE: str = _data.get("hand_gate", "pose")
 POSE_WRIST_MATCH_THRESHOLD: float = _data.get("pose_wrist_match_threshold", 0.15)
+FACE_GATE_MAX_FACE_WIDTHS: float = _data.get("face_gate_max_face_widths", 3.0)
+HEURISTIC_GATE_MIN_HAND_SIZE: float = _data.get("heuristic_gate_min_hand_size", 0.12)
+HEURISTIC_GATE_MAX_WRIST_Y: float = _data.get("heuristic_gate_max_wrist_y", 0.65)
+HEURISTIC_GATE_MAX_DEPTH_SPREAD: float = _data.get(
+    "heuristic_gate_max_depth_spread", 0.2
+)
+
+GATE_MODEL_MAX_AGE_FRAMES: int = _data.get("gate_model_max_age_frames", 30)
+GATE_MODEL_MAX_WRIST_SHIFT: float = _data.get("gate_model_max_wrist_shift", 0.1)
+GATE_MODEL_STALE_FRAMES: int | None = _data.get("gate_model_stale_frames", 45)
+
+MIRROR_LANDMARKS: bool = _data.get("mirror_landmarks", True)
+FRAME_POOL_ENABLED: bool = _data.get("frame_pool_enabled", True)
+
+DUTY_CYCLE_ENABLED: bool = _data.get("duty_cycle_enabled", False)
+DUTY_CYCLE_PROFILES: dict = _data.get("duty_cycle_profiles", {})
+DUTY_CYCLE_DOWNSHIFT_SECONDS: float = _data.get("duty_cycle_downshift_seconds", 2.0)
+
+LATENCY_GOVERNOR_ENABLED: bool = _data.get("latency_governor_enabled", False)
+LATENCY_BUDGET_MS: float = _data.get("latency_budget_ms", 50.0)
+LATENCY_GOVERNOR_WINDOW: int = _data.get("latency_governor_window", 30)
+LATENCY_GOVERNOR_HEADROOM: float = _data.get("latency_governor_headroom", 0.6)
+LATENCY_GOVERNOR_STEPS: list = _data.get("latency_governor_steps", [])
+
+DISPLAY_THREADED: bool = _data.get("display_threaded", True)
+PREVIEW_SERVER_ENABLED: bool = _data.get("preview_server_enabled", False)
+PREVIEW_SERVER_HOST: str = _data.get("preview_server_host", "127.0.0.1")
+PREVIEW_SERVER_PORT: int = _data.get("preview_server_port", 8080)
+PREVIEW_SERVER_FPS: float = _data.get("preview_server_fps", 10)
+PREVIEW_SERVER_JPEG_QUALITY: int = _data.get("preview_server_jpeg_quality", 70)
+
+FLIGHT_RECORDER_ENABLED: bool = _data.get("flight_recorder_enabled", False)
+FLIGHT_RECORDER_DIR: str = _data.get("flight_recorder_dir", "flight_recorder")
+FLIGHT_RECORDER_SECONDS: float = _data.get("flight_recorder_seconds", 10)
+FLIGHT_RECORDER_POST_SECONDS: float = _data.get("flight_recorder_post_seconds", 2)
+FLIGHT_RECORDER_MAX_MB: float = _data.get("flight_recorder_max_mb", 32)
+FLIGHT_RECORDER_FPS: float = _data.get("flight_recorder_fps", 10)
+FLIGHT_RECORDER_SCALE: float = _data.get("flight_recorder_scale", 0.5)
+FLIGHT_RECORDER_JPEG_QUALITY: int = _data.get("flight_recorder_jpeg_quality", 70)
+
+JOURNAL_ENABLED: bool = _data.get("journal_enabled", False)
+JOURNAL_DIR: str = _data.get("journal_dir", "journal")
+JOURNAL_SEGMENT_KB: int = _data.get("journal_segment_kb", 1024)
+JOURNAL_MAX_SEGMENTS: int = _data.get("journal_max_segments", 64)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+from typing import TYPE_CHECKING, Callable
 
 import bus
 import config
@@ -10,7 +11,10 @@ from state_machine import State, StateMachine
 from gestures.wake_gesture import is_wake_gesture
 from gestures.recognizer import recognize
 from commands.registry import CommandRegistry
-from hooks.base import Hook
+
+if TYPE_CHECKING:
+    # hooks/__init__ pulls in OpenCV; replays must run without it.
+    from hooks.base import Hook
 
 
 class GestureController:
@@ -19,19 +23,28 @@ class GestureController:
         sm: StateMachine,
         registry: CommandRegistry,
         hooks: list[Hook],
+        clock: Callable[[], float] | None = time.monotonic,
     ) -> None:
+        """``clock`` timestamps the end of a command for the debounce.  With
+        None the frame's ``now`` is used instead, for recordings whose
+        timestamps do not advance while a command runs."""
         self._sm = sm
         self._registry = registry
         self._hooks = hooks
+        self._clock = clock
 
         self._wake_gesture_start: float | None = None
         self._command_mode_entered_at: float | None = None
         self._last_command_at: float = 0.0
         self._command_gesture_name: str | None = None
         self._command_gesture_start: float | None = None
+        self._last_gesture: str | None = None
 
     def handle_frame(self, now: float, all_hand_landmarks: list) -> None:
         gesture = self._pick_gesture(all_hand_landmarks)
+        if gesture != self._last_gesture:
+            bus.emit("gesture_changed", now=now, gesture=gesture)
+            self._last_gesture = gesture
 
         if self._sm.state == State.IDLE:
             self._handle_idle(gesture, now)
@@ -54,6 +67,7 @@ class GestureController:
         if is_wake_gesture(gesture):
             if self._wake_gesture_start is None:
                 self._wake_gesture_start = now
+                bus.emit("wake_started", now=now, gesture=gesture)
             elif now - self._wake_gesture_start >= config.WAKE_HOLD_SECONDS:
                 self._sm.transition_to(State.COMMAND_MODE)
                 self._command_mode_entered_at = now
@@ -71,6 +85,7 @@ class GestureController:
             print("[timeout] No command detected, returning to IDLE")
             self._sm.transition_to(State.IDLE)
             self._notify_hooks("on_exit_command_mode")
+            bus.emit("command_mode_timed_out", now=now)
             bus.emit("command_mode_settled")
             return
 
@@ -90,22 +105,29 @@ class GestureController:
                 and now - self._command_gesture_start >= config.COMMAND_HOLD_SECONDS
             ):
                 command = self._registry.resolve(gesture)
+                bus.emit("command_dispatched", now=now, gesture=gesture)
                 self._sm.transition_to(State.RUNNING_COMMAND)
                 self._notify_hooks("on_exit_command_mode")
 
                 self._command_gesture_name = None
                 self._command_gesture_start = None
+                error = None
                 try:
                     command.execute()
                 except Exception as exc:
+                    error = str(exc)
                     print(f"[error] Command failed: {exc}")
                 finally:
-                    self._last_command_at = time.monotonic()
+                    self._last_command_at = (
+                        now if self._clock is None else self._clock()
+                    )
                     self._sm.transition_to(State.IDLE)
+                    bus.emit("command_executed", now=now, gesture=gesture, error=error)
                     bus.emit("command_mode_settled")
         else:
             self._command_gesture_name = gesture
             self._command_gesture_start = now
+            bus.emit("gesture_hold_started", now=now, gesture=gesture)
 
     def _notify_hooks(self, method_name: str) -> None:
         for hook in self._hooks:
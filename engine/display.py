@@ -0,0 +1,150 @@
+"""Preview display — overlays, ``cv2.imshow`` and ``cv2.waitKey``.
+
+``compose`` draws the raised hands and runs the hooks' ``on_frame``
+overlays.  The inline path calls it from ``FrameProcessor.render``;
+``DisplayStage`` runs it, and every HighGUI call, on its own thread so
+the preview never holds up detection.
+
+DisplayStage hands frames over through a FrameHandoff, which copies
+each frame into one of a few private buffers; when none is free, because
+the consumer is still busy, the frame is dropped for that consumer only.
+A frame replaced in the mailbox before the consumer picked it up is
+dropped as well and its buffer reused.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+
+import cv2
+import numpy as np
+
+from engine.queues import LatestSlot
+from gestures.detector import draw_hands
+
+WINDOW_NAME = "Gesture Control"
+_POLL_SECONDS = 0.1
+
+
+def compose(
+    frame: np.ndarray, raised_hands: list, in_command_mode: bool, hooks: list
+) -> None:
+    """Draw the raised hands and every hook's overlay onto ``frame``."""
+    draw_hands(frame, raised_hands)
+    for hook in hooks:
+        hook.on_frame(frame, in_command_mode)
+
+
+class FrameHandoff:
+    """Passes frame copies from a producer to a consumer thread, newest wins.
+
+    ``offer`` never blocks; the consumer ``take``s a buffer and must
+    ``recycle`` it once done.
+    """
+
+    def __init__(self, buffers: int = 3) -> None:
+        self._slot = LatestSlot()
+        self._free: queue.Queue = queue.Queue()
+        for _ in range(buffers):
+            self._free.put(None)  # allocated on first use, at the frame's size
+        self._unavailable = 0
+
+    @property
+    def dropped(self) -> int:
+        """Frames offered but never taken."""
+        return self._unavailable + self._slot.dropped
+
+    def offer(self, frame: np.ndarray, mirror: bool, *extra) -> bool:
+        """Copy ``frame`` (flipped if ``mirror``) for the consumer.
+
+        Returns False, dropping the frame, when every buffer is in use.
+        """
+        try:
+            buf = self._free.get_nowait()
+        except queue.Empty:
+            self._unavailable += 1
+            return False
+        if mirror:
+            buf = cv2.flip(frame, 1, dst=buf)
+        elif buf is None or buf.shape != frame.shape:
+            buf = frame.copy()
+        else:
+            np.copyto(buf, frame)
+        displaced = self._slot.put((buf, *extra))
+        if displaced is not None:
+            self._free.put(displaced[0])
+        return True
+
+    def take(self, timeout: float | None = None) -> tuple:
+        """``(buffer, *extra)`` of the newest frame.  Raises ``queue.Empty``."""
+        return self._slot.get(timeout=timeout)
+
+    def recycle(self, buf: np.ndarray) -> None:
+        self._free.put(buf)
+
+
+class DisplayStage:
+    def __init__(self, hooks: list, buffers: int = 3) -> None:
+        self._hooks = hooks
+        self._handoff = FrameHandoff(buffers)
+        self._stop = threading.Event()
+        self._quit = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._error: BaseException | None = None
+
+    @property
+    def dropped(self) -> int:
+        return self._handoff.dropped
+
+    @property
+    def quit_requested(self) -> bool:
+        """True once the user pressed 'q' in the preview window."""
+        return self._quit.is_set()
+
+    def start(self) -> "DisplayStage":
+        self._thread = threading.Thread(
+            target=self._run, name="display", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def submit(
+        self,
+        frame: np.ndarray,
+        raised_hands: list,
+        in_command_mode: bool,
+        mirror: bool = False,
+    ) -> None:
+        """Queue a frame for display without ever waiting on the display.
+
+        With ``mirror`` the copy is flipped horizontally on the way.
+        """
+        if self._error is not None:
+            raise self._error
+        self._handoff.offer(frame, mirror, raised_hands, in_command_mode)
+
+    def _run(self) -> None:
+        try:
+            while not self._stop.is_set():
+                try:
+                    buf, raised_hands, in_command_mode = self._handoff.take(
+                        timeout=_POLL_SECONDS
+                    )
+                except queue.Empty:
+                    continue
+                compose(buf, raised_hands, in_command_mode, self._hooks)
+                cv2.imshow(WINDOW_NAME, buf)
+                self._handoff.recycle(buf)
+                if cv2.waitKey(1) & 0xFF == ord("q"):
+                    self._quit.set()
+        except BaseException as exc:  # surfaced from submit()
+            self._error = exc
+            self._quit.set()
+        finally:
+            cv2.destroyAllWindows()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
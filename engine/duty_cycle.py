@@ -0,0 +1,106 @@
+"""DutyCycler — state-aware frame rate and resolution.
+
+Nothing needs full camera rate while the room is empty.  Each situation
+gets a profile (a target fps and a downscale factor):
+
+- ``idle``    — IDLE with no hands in view
+- ``hands``   — IDLE with a hand in view
+- ``command`` — COMMAND_MODE or RUNNING_COMMAND
+
+Switching up to a busier profile is immediate so command mode stays
+responsive; switching down only happens once the quieter situation has
+lasted ``downshift_seconds``, so a hand flickering in and out of view
+does not make the rate oscillate.
+
+The multiprocess engine copies full-size frames into its shared ring, so
+start mode resets every profile's ``scale`` to 1.0 there.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from state_machine import State
+
+PROFILES = ("idle", "hands", "command")
+
+
+@dataclass(frozen=True)
+class DutyProfile:
+    fps: float | None = None  # None = as fast as the camera delivers
+    scale: float = 1.0
+
+
+def profiles_from_config(data: dict) -> dict[str, DutyProfile]:
+    """Build profiles from the ``duty_cycle_profiles`` mapping in config.yaml."""
+    unknown = set(data) - set(PROFILES)
+    if unknown:
+        raise ValueError(
+            f"Unknown duty cycle profile(s) {sorted(unknown)}, expected {PROFILES}"
+        )
+    return {name: DutyProfile(**data.get(name) or {}) for name in PROFILES}
+
+
+class DutyCycler:
+    def __init__(
+        self,
+        profiles: dict[str, DutyProfile],
+        downshift_seconds: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._profiles = profiles
+        self._downshift_seconds = downshift_seconds
+        self._clock = clock
+        self._sleep = sleep
+
+        self.current = "command"
+        self._quieter_since: float | None = None
+        self._last_frame_at: float | None = None
+
+    @property
+    def profile(self) -> DutyProfile:
+        return self._profiles[self.current]
+
+    def update(self, state: State, hands_visible: bool) -> DutyProfile:
+        """Pick the profile for the current situation, with hysteresis."""
+        if state != State.IDLE:
+            wanted = "command"
+        else:
+            wanted = "hands" if hands_visible else "idle"
+
+        now = self._clock()
+        if PROFILES.index(wanted) >= PROFILES.index(self.current):
+            if wanted != self.current:
+                print(f"[duty] {self.current} -> {wanted}")
+            self.current = wanted
+            self._quieter_since = None
+        elif self._quieter_since is None:
+            self._quieter_since = now
+        elif now - self._quieter_since >= self._downshift_seconds:
+            print(f"[duty] {self.current} -> {wanted}")
+            self.current = wanted
+            self._quieter_since = None
+        return self.profile
+
+    def pace(self, cap) -> None:
+        """Wait until the current profile's next frame is due.
+
+        Sources that can ``grab()`` (a plain ``cv2.VideoCapture``) are
+        drained while waiting so the next ``read()`` is not a stale
+        buffered frame; others (the threaded reader) always return the
+        newest frame, so sleeping is enough.
+        """
+        fps = self.profile.fps
+        if fps and self._last_frame_at is not None:
+            due = self._last_frame_at + 1.0 / fps
+            grab = getattr(cap, "grab", None)
+            while self._clock() < due:
+                if grab is not None:
+                    if not grab():
+                        break
+                else:
+                    self._sleep(due - self._clock())
+        self._last_frame_at = self._clock()
@@ -0,0 +1,232 @@
+"""FlightRecorder — what the camera saw around every command.
+
+Keeps a rolling buffer of the last ``seconds`` of downscaled JPEG
+frames, hand landmarks, recognized gestures and state transitions,
+capped at ``max_bytes``.  When a command runs, command mode times out
+or ``trigger()`` is called (SIGUSR1 in start mode), the buffer is dumped
+``post_seconds`` later to ``<directory>/<time>-<n>-<reason>.zip``:
+``frames/*.jpg`` plus an ``events.jsonl`` timeline.
+
+The frame thread only offers a frame copy, at most ``fps`` times a
+second, through a FrameHandoff.  Downscaling and JPEG encoding run on
+the encoder thread and dumps on the dump thread, so leaving the recorder
+on costs the frame loop one copy per recorded frame.
+
+Events are stamped with controller time, so a ``--source`` replay dumps
+on the recording's timeline.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import queue
+import threading
+import time
+import zipfile
+from collections import deque
+from typing import NamedTuple
+
+import cv2
+import numpy as np
+
+import bus
+from engine.display import FrameHandoff
+from gestures.landmarks import to_array
+
+_POLL_SECONDS = 0.05
+_EVENT_BYTES = 64  # rough size of a small non-frame event
+
+
+class _Event(NamedTuple):
+    t: float
+    kind: str
+    payload: object
+    nbytes: int
+
+
+class FlightRecorder:
+    def __init__(
+        self,
+        directory: str = "flight_recorder",
+        seconds: float = 10.0,
+        post_seconds: float = 2.0,
+        max_bytes: int = 32 * 2**20,
+        fps: float = 10.0,
+        scale: float = 0.5,
+        quality: int = 70,
+    ) -> None:
+        self._directory = directory
+        self._seconds = seconds
+        self._post_seconds = post_seconds
+        self._max_bytes = max_bytes
+        self._interval = 1.0 / fps
+        self._scale = scale
+        self._params = [cv2.IMWRITE_JPEG_QUALITY, quality]
+
+        self._lock = threading.Lock()
+        self._events: deque[_Event] = deque()
+        self._bytes = 0
+        self._now = 0.0  # latest controller time seen
+        self._last_offer: float | None = None
+        self._handoff = FrameHandoff(buffers=2)
+        # (due, reason, controller time); a bare deque so trigger() is
+        # safe to call from a signal handler.
+        self._pending: deque = deque()
+        self.dumps_written = 0
+
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._listeners = {
+            "gesture_changed": self._on_gesture,
+            "state_changed": self._on_state,
+            "command_executed": self._on_command,
+            "command_mode_timed_out": self._on_timeout,
+        }
+
+    @property
+    def buffered_bytes(self) -> int:
+        return self._bytes
+
+    def start(self) -> "FlightRecorder":
+        for event, callback in self._listeners.items():
+            bus.on(event, callback)
+        for name, target in (
+            ("flight-encoder", self._encode_loop),
+            ("flight-dumper", self._dump_loop),
+        ):
+            t = threading.Thread(target=target, name=name, daemon=True)
+            t.start()
+            self._threads.append(t)
+        return self
+
+    # -- producers --
+
+    def add_frame(self, now: float, frame: np.ndarray, mirror: bool = False) -> None:
+        """Offer a frame; a no-op until the next one is due."""
+        wall = time.monotonic()
+        if self._last_offer is not None and wall - self._last_offer < self._interval:
+            return
+        self._last_offer = wall
+        self._handoff.offer(frame, mirror, now)
+
+    def add_landmarks(self, now: float, hands: list, raised_hands: list) -> None:
+        """Record one frame's hands and which of them were raised."""
+        self._now = now
+        arr = to_array(hands)
+        raised = [i for i, lm in enumerate(hands) if any(lm is r for r in raised_hands)]
+        self._append(now, "landmarks", (arr, raised), arr.nbytes + _EVENT_BYTES)
+
+    def trigger(self, reason: str = "manual") -> None:
+        """Dump the buffer ``post_seconds`` from now."""
+        self._pending.append((time.monotonic() + self._post_seconds, reason, self._now))
+
+    def _on_gesture(self, now: float, gesture: str | None) -> None:
+        self._append(now, "gesture", {"gesture": gesture}, _EVENT_BYTES)
+
+    def _on_state(self, old, new) -> None:
+        payload = {"old": old.name, "new": new.name}
+        self._append(self._now, "state", payload, _EVENT_BYTES)
+
+    def _on_command(self, now: float, gesture: str, error: str | None) -> None:
+        payload = {"gesture": gesture, "error": error}
+        self._append(now, "command", payload, _EVENT_BYTES)
+        self.trigger("command")
+
+    def _on_timeout(self, now: float) -> None:
+        self._append(now, "timeout", {}, _EVENT_BYTES)
+        self.trigger("timeout")
+
+    def _append(self, t: float, kind: str, payload, nbytes: int) -> None:
+        event = _Event(t, kind, payload, nbytes)
+        with self._lock:
+            # Frames arrive from the encoder thread after newer events, so
+            # insert in time order; eviction relies on the head being oldest.
+            if not self._events or t >= self._events[-1].t:
+                self._events.append(event)
+            else:
+                bisect.insort(self._events, event, key=lambda e: e.t)
+            self._bytes += nbytes
+            oldest = self._events[-1].t - self._seconds
+            while self._events and (
+                self._bytes > self._max_bytes or self._events[0].t < oldest
+            ):
+                self._bytes -= self._events.popleft().nbytes
+
+    # -- encoder thread --
+
+    def _encode_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                buf, now = self._handoff.take(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+            small = buf
+            if self._scale != 1.0:
+                small = cv2.resize(
+                    buf,
+                    None,
+                    fx=self._scale,
+                    fy=self._scale,
+                    interpolation=cv2.INTER_AREA,
+                )
+            ok, encoded = cv2.imencode(".jpg", small, self._params)
+            self._handoff.recycle(buf)
+            if ok:
+                jpeg = encoded.tobytes()
+                self._append(now, "frame", jpeg, len(jpeg))
+
+    # -- dump thread --
+
+    def _dump_loop(self) -> None:
+        while True:
+            if self._pending and (
+                self._stop.is_set() or self._pending[0][0] <= time.monotonic()
+            ):
+                _, reason, now = self._pending.popleft()
+                self._dump(reason, now)
+            elif self._stop.is_set():
+                return
+            else:
+                self._stop.wait(_POLL_SECONDS)
+
+    def _dump(self, reason: str, trigger_time: float) -> None:
+        with self._lock:
+            events = list(self._events)
+        os.makedirs(self._directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(
+            self._directory, f"{stamp}-{self.dumps_written:03d}-{reason}.zip"
+        )
+        lines = [json.dumps({"t": trigger_time, "kind": "trigger", "reason": reason})]
+        frames = 0
+        with zipfile.ZipFile(path, "w") as zf:
+            for event in events:
+                record = {"t": event.t, "kind": event.kind}
+                if event.kind == "frame":
+                    name = f"frames/{frames:05d}.jpg"
+                    zf.writestr(name, event.payload, zipfile.ZIP_STORED)
+                    record["file"] = name
+                    frames += 1
+                elif event.kind == "landmarks":
+                    arr, raised = event.payload
+                    record["hands"] = np.round(arr, 4).tolist()
+                    record["raised"] = raised
+                else:
+                    record.update(event.payload)
+                lines.append(json.dumps(record))
+            zf.writestr(
+                "events.jsonl", "\n".join(lines) + "\n", zipfile.ZIP_DEFLATED
+            )
+        self.dumps_written += 1
+        span = events[-1].t - events[0].t if events else 0.0
+        print(f"[flight] Wrote {path} ({frames} frame(s), {span:.1f} s)")
+
+    def close(self) -> None:
+        """Stop recording; pending dumps are written right away."""
+        for event, callback in self._listeners.items():
+            bus.off(event, callback)
+        self._stop.set()
+        for t in self._threads:
+            t.join(timeout=5.0)
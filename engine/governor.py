@@ -0,0 +1,99 @@
+"""LatencyGovernor — keeps per-frame latency under a budget.
+
+Latency is measured from capture to the controller having seen the
+frame.  Every ``window`` frames the governor looks at the p95: above the
+budget it degrades one step, below ``headroom`` times the budget it
+restores one step.  Steps come from config.yaml and are applied in
+order, each one overriding some of the knobs:
+
+- ``gate_model_max_age_frames`` — how often pose/face may be refreshed
+- ``scale``                     — downscale factor before inference
+- ``max_hands``                 — the hand landmarker's hand limit
+- ``frame_skip``                — process one frame out of every N
+
+The governor only decides; FrameProcessor applies each knob on the
+thread that uses it.  An engine that cannot apply a knob passes it as
+``disabled_knobs`` and it is stripped from every step, dropping steps
+left empty, so degrading moves straight on to a knob that works.  The
+multiprocess engine copies full-size frames into its shared ring, so it
+disables ``scale``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields, replace
+
+from stats import percentile
+
+KNOBS = ("gate_model_max_age_frames", "scale", "max_hands", "frame_skip")
+
+
+@dataclass(frozen=True)
+class GovernorSettings:
+    gate_model_max_age_frames: int
+    scale: float = 1.0
+    max_hands: int = 4
+    frame_skip: int = 1
+
+
+class LatencyGovernor:
+    def __init__(
+        self,
+        base: GovernorSettings,
+        steps: list[dict],
+        budget_ms: float,
+        window: int = 30,
+        headroom: float = 0.6,
+        disabled_knobs: tuple[str, ...] = (),
+    ) -> None:
+        for step in steps:
+            unknown = set(step) - set(KNOBS)
+            if unknown:
+                raise ValueError(
+                    f"Unknown governor knob(s) {sorted(unknown)}, expected {KNOBS}"
+                )
+        steps = [
+            {knob: value for knob, value in step.items() if knob not in disabled_knobs}
+            for step in steps
+        ]
+        steps = [step for step in steps if step]
+        # levels[n] is the base with the first n steps applied.
+        self._levels = [base]
+        for step in steps:
+            self._levels.append(replace(self._levels[-1], **step))
+        self._budget_ms = budget_ms
+        self._window = window
+        self._headroom = headroom
+
+        self.level = 0
+        self._samples: list[float] = []
+
+    @property
+    def settings(self) -> GovernorSettings:
+        return self._levels[self.level]
+
+    def record(self, latency_ms: float) -> None:
+        """Add one frame's latency; adjusts the level once per window."""
+        self._samples.append(latency_ms)
+        if len(self._samples) < self._window:
+            return
+        p95 = percentile(sorted(self._samples), 95)
+        self._samples.clear()
+
+        if p95 > self._budget_ms and self.level < len(self._levels) - 1:
+            self._move(self.level + 1, p95, "over")
+        elif p95 < self._budget_ms * self._headroom and self.level > 0:
+            self._move(self.level - 1, p95, "under")
+
+    def _move(self, level: int, p95: float, direction: str) -> None:
+        before, after = self.settings, self._levels[level]
+        changes = ", ".join(
+            f"{f.name} {getattr(before, f.name)} -> {getattr(after, f.name)}"
+            for f in fields(GovernorSettings)
+            if getattr(before, f.name) != getattr(after, f.name)
+        )
+        print(
+            f"[governor] p95 {p95:.1f} ms {direction} {self._budget_ms:.0f} ms budget:"
+            f" level {self.level} -> {level} ({changes})"
+        )
+        self.level = level
@@ -0,0 +1,186 @@
+"""Live-stream engine — MediaPipe LIVE_STREAM mode with result callbacks.
+
+The main thread captures, submits each frame with ``detect_async`` and
+renders; it never waits on a model.  MediaPipe drops frames internally
+when inference falls behind.  Hand results land in a LatestSlot and a
+control thread gates them and feeds ``GestureController.handle_frame`` as
+soon as each one is ready.  Gate-model (pose or face) results simply
+replace the cached ones.
+
+Both models report only a timestamp, so the engine remembers which frame
+index (and controller time) each submitted timestamp belonged to; gating
+needs the indices to know how old the cached gate-model result is.  The gate model is
+scheduled from the hands of the last gated frame.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections import deque
+
+from capture.sources import frame_time
+from engine.processor import FramePacket, FrameProcessor
+from engine.queues import LatestSlot
+from gestures.detector import HandDetector
+from gestures.gating import build_gate_model
+
+_POLL_SECONDS = 0.1
+
+
+class LiveStreamEngine:
+    def __init__(
+        self,
+        cap,
+        processor: FrameProcessor,
+        hand_kwargs: dict,
+        gate_model_kwargs: dict,
+        gui_enabled: bool,
+    ) -> None:
+        self._cap = cap
+        self._processor = processor
+        self._gui_enabled = gui_enabled
+        self._hand_kwargs = hand_kwargs
+        self._gate_model_kwargs = gate_model_kwargs
+
+        self._hand_results = LatestSlot()
+        # (timestamp_ms, frame index, controller time) of submitted frames,
+        # oldest first.
+        self._hand_submissions: deque = deque()
+        self._gate_model_submissions: deque = deque()
+        self._stop = threading.Event()
+        self._error: BaseException | None = None
+
+        # Written by the control thread, read by the render loop.
+        self._raised_hands: list = []
+        self._in_command_mode = False
+
+    # -- MediaPipe callbacks (MediaPipe threads) --
+
+    def _on_hands(self, result, timestamp_ms: int) -> None:
+        self._hand_results.put((result, timestamp_ms))
+
+    def _on_gate_model(self, result, timestamp_ms: int) -> None:
+        index, _ = _submission_for(self._gate_model_submissions, timestamp_ms)
+        self._processor.store_gate_results(result, index)
+
+    # -- control thread --
+
+    def _control_loop(self) -> None:
+        try:
+            while not self._stop.is_set():
+                try:
+                    result, timestamp_ms = self._hand_results.get(
+                        timeout=_POLL_SECONDS
+                    )
+                except queue.Empty:
+                    continue
+                index, now = _submission_for(self._hand_submissions, timestamp_ms)
+                raised = self._processor.gate(
+                    self._processor.hands_from(result),
+                    self._processor.gate_results,
+                    index,
+                )
+                # Timestamps are time.monotonic() at capture, in ms.
+                self._in_command_mode = self._processor.control(
+                    now, raised, timestamp_ms / 1000.0
+                )
+                self._raised_hands = raised
+        except BaseException as exc:  # surfaced from run()
+            self._error = exc
+            self._stop.set()
+
+    # -- driver --
+
+    def run(self) -> None:
+        hand_detector = HandDetector(
+            **self._hand_kwargs,
+            running_mode="live_stream",
+            result_callback=self._on_hands,
+        )
+        gate_model = None
+        if self._processor.gate_model_kind is not None:
+            gate_model = build_gate_model(
+                self._processor.gate_model_kind,
+                **self._gate_model_kwargs,
+                running_mode="live_stream",
+                result_callback=self._on_gate_model,
+            )
+        control = threading.Thread(
+            target=self._control_loop, name="live-stream-control", daemon=True
+        )
+        control.start()
+
+        index = 0
+        last_ts_ms = -1
+        try:
+            while not self._stop.is_set():
+                self._processor.pace(self._cap)
+                ok, frame = self._cap.read()
+                if not ok:
+                    break
+                now = time.monotonic()
+                packet = FramePacket(
+                    index=index,
+                    timestamp=now,
+                    frame=frame,
+                    source_time=frame_time(self._cap),
+                )
+                self._processor.prepare(packet)
+
+                if self._processor.check_motion(packet):
+                    # Record the timestamp before submitting: the result
+                    # callback may run before process_async returns.
+                    ts_ms = last_ts_ms = max(int(now * 1000), last_ts_ms + 1)
+                    submission = (ts_ms, index, packet.controller_time(now))
+                    self._hand_submissions.append(submission)
+                    hand_detector.process_async(packet.prepared, ts_ms)
+                    if self._processor.gate_model_due(index):
+                        self._processor.claim_gate_model(index)
+                        self._gate_model_submissions.append(submission)
+                        gate_model.process_async(packet.prepared, ts_ms)
+                index += 1
+
+                packet.raised_hands = self._raised_hands
+                packet.in_command_mode = self._in_command_mode
+                if not self._processor.render(packet):
+                    break
+                if not self._gui_enabled:
+                    time.sleep(0.001)
+        finally:
+            self._stop.set()
+            control.join(timeout=1.0)
+            hand_detector.close()
+            if gate_model is not None:
+                gate_model.close()
+
+        if self._hand_results.dropped:
+            dropped = self._hand_results.dropped
+            print(f"[live_stream] Skipped {dropped} stale hand result(s)")
+        if self._error is not None:
+            raise self._error
+
+
+def _submission_for(submissions: deque, timestamp_ms: int) -> tuple[int, float]:
+    """Pop submissions up to ``timestamp_ms`` and return its frame index
+    and controller time.
+
+    MediaPipe may drop frames, so older entries without a result are
+    discarded on the way.
+    """
+    while len(submissions) > 1 and submissions[1][0] <= timestamp_ms:
+        submissions.popleft()
+    return submissions[0][1:]
+
+
+def run(
+    cap,
+    processor: FrameProcessor,
+    hand_kwargs: dict,
+    gate_model_kwargs: dict,
+    gui_enabled: bool,
+) -> None:
+    LiveStreamEngine(
+        cap, processor, hand_kwargs, gate_model_kwargs, gui_enabled
+    ).run()
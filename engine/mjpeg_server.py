@@ -0,0 +1,177 @@
+"""MjpegPreview — annotated frames over HTTP for headless units.
+
+Serves a small page at ``/`` and a ``multipart/x-mixed-replace`` MJPEG
+stream at ``/stream`` on a local port.  Nothing is copied or encoded
+while no client is connected.  Otherwise frames are offered at most
+``fps`` times a second through a FrameHandoff, annotated and encoded on
+the encoder thread, and each JPEG is encoded once and the same bytes
+written to every connected client.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import cv2
+import numpy as np
+
+from engine.display import FrameHandoff, compose
+
+_POLL_SECONDS = 0.1
+_BOUNDARY = "frame"
+_PAGE = (
+    b"<!doctype html><title>Gesture Control</title>"
+    b'<body style="margin:0;background:#000">'
+    b'<img src="/stream" style="width:100%">'
+)
+
+
+class MjpegPreview:
+    def __init__(
+        self,
+        hooks: list,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        fps: float = 10.0,
+        quality: int = 70,
+    ) -> None:
+        self._hooks = hooks
+        self._interval = 1.0 / fps
+        self._params = [cv2.IMWRITE_JPEG_QUALITY, quality]
+        self._handoff = FrameHandoff(buffers=2)
+        self._last_offer = 0.0
+
+        # The latest JPEG and its sequence number, shared by all clients.
+        self._cond = threading.Condition()
+        self._jpeg = b""
+        self._seq = 0
+        self._clients = 0
+        self.frames_encoded = 0
+
+        self._stop = threading.Event()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._threads: list[threading.Thread] = []
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self._server.server_address[:2]
+
+    @property
+    def clients(self) -> int:
+        return self._clients
+
+    def start(self) -> "MjpegPreview":
+        for name, target in (
+            ("preview-http", self._server.serve_forever),
+            ("preview-encoder", self._encode_loop),
+        ):
+            t = threading.Thread(target=target, name=name, daemon=True)
+            t.start()
+            self._threads.append(t)
+        host, port = self.address
+        print(f"[preview] Streaming on http://{host}:{port}/")
+        return self
+
+    def submit(
+        self,
+        frame: np.ndarray,
+        raised_hands: list,
+        in_command_mode: bool,
+        mirror: bool = False,
+    ) -> None:
+        """Offer a frame; a no-op without clients or before the next one is due."""
+        if not self._clients:
+            return
+        now = time.monotonic()
+        if now - self._last_offer < self._interval:
+            return
+        self._last_offer = now
+        self._handoff.offer(frame, mirror, raised_hands, in_command_mode)
+
+    def _encode_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                buf, raised_hands, in_command_mode = self._handoff.take(
+                    timeout=_POLL_SECONDS
+                )
+            except queue.Empty:
+                continue
+            compose(buf, raised_hands, in_command_mode, self._hooks)
+            ok, encoded = cv2.imencode(".jpg", buf, self._params)
+            self._handoff.recycle(buf)
+            if not ok:
+                continue
+            with self._cond:
+                self._jpeg = encoded.tobytes()
+                self._seq += 1
+                self.frames_encoded += 1
+                self._cond.notify_all()
+
+    def _next_jpeg(self, after_seq: int) -> tuple[int, bytes] | None:
+        """Wait for a JPEG newer than ``after_seq``; None when stopping."""
+        with self._cond:
+            while self._seq <= after_seq:
+                if self._stop.is_set():
+                    return None
+                self._cond.wait(timeout=_POLL_SECONDS)
+            return self._seq, self._jpeg
+
+    def _stream(self, handler: BaseHTTPRequestHandler) -> None:
+        handler.send_response(200)
+        handler.send_header(
+            "Content-Type", f"multipart/x-mixed-replace; boundary={_BOUNDARY}"
+        )
+        handler.send_header("Cache-Control", "no-cache")
+        handler.end_headers()
+        with self._cond:
+            self._clients += 1
+            seq = self._seq
+        try:
+            while True:
+                latest = self._next_jpeg(seq)
+                if latest is None:
+                    return
+                seq, jpeg = latest
+                handler.wfile.write(
+                    f"--{_BOUNDARY}\r\nContent-Type: image/jpeg\r\n"
+                    f"Content-Length: {len(jpeg)}\r\n\r\n".encode()
+                )
+                handler.wfile.write(jpeg)
+                handler.wfile.write(b"\r\n")
+        except ConnectionError:
+            pass  # client went away
+        finally:
+            with self._cond:
+                self._clients -= 1
+
+    def _handler_class(self):
+        preview = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/":
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/html")
+                    self.send_header("Content-Length", str(len(_PAGE)))
+                    self.end_headers()
+                    self.wfile.write(_PAGE)
+                elif self.path == "/stream":
+                    preview._stream(self)
+                else:
+                    self.send_error(404)
+
+            def log_message(self, format, *args):
+                pass  # one line per request would flood the console
+
+        return Handler
+
+    def close(self) -> None:
+        self._stop.set()
+        self._server.shutdown()
+        self._server.server_close()
+        for t in self._threads:
+            t.join(timeout=1.0)
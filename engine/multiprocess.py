@@ -0,0 +1,88 @@
+"""Multi-process engine — hand and gate-model inference run in worker processes.
+
+The main process captures, mirrors each frame straight into a shared
+memory ring slot, and hands the slot number to the workers.  Up to
+``ring.slots`` frames are in flight at once; results are consumed in
+capture order, so gating, the controller and the hooks run exactly as in
+the serial engine.
+
+The gate model is scheduled on demand from each frame's hands, so it is
+submitted when those hands come back; the frame is still in its slot
+because the slot is only reused after the frame has been consumed.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+
+from capture.sources import frame_time
+from engine.processor import FramePacket, FrameProcessor
+from engine.shm_ring import SharedFrameRing
+from engine.workers import InferenceWorkers
+
+
+def run(
+    cap,
+    processor: FrameProcessor,
+    workers: InferenceWorkers,
+    ring: SharedFrameRing,
+    gui_enabled: bool,
+) -> None:
+    # Packets for frames submitted but not yet consumed.
+    in_flight: deque = deque()
+    index = 0
+    capturing = True
+
+    while capturing or in_flight:
+        if capturing and len(in_flight) < ring.slots:
+            processor.pace(cap)
+            ok, frame = cap.read()
+            if not ok:
+                capturing = False
+                continue
+
+            if frame.shape != ring.shape:
+                raise ValueError(
+                    f"Camera delivered {frame.shape}, ring expects {ring.shape}"
+                )
+            slot = ring.slot_for(index)
+            packet = FramePacket(
+                index=index,
+                timestamp=time.monotonic(),
+                frame=frame,
+                source_time=frame_time(cap),
+            )
+            processor.prepare(packet, dst=ring.view(slot))
+            if processor.check_motion(packet):
+                workers.submit_hands(index, slot)
+            in_flight.append(packet)
+            index += 1
+            if len(in_flight) < ring.slots:
+                continue
+
+        packet = in_flight.popleft()
+        if packet.run_inference:
+            packet.hand_landmarks = processor.hands_from(
+                workers.hands_result(packet.index)
+            )
+            if processor.gate_model_due(packet.index, packet.hand_landmarks):
+                processor.claim_gate_model(packet.index, packet.hand_landmarks)
+                workers.submit_gate_model(packet.index, ring.slot_for(packet.index))
+                processor.store_gate_results(
+                    workers.gate_model_result(packet.index), packet.index
+                )
+        packet.gate_results = processor.gate_results
+
+        packet.timestamp = packet.controller_time(time.monotonic())
+        packet.raised_hands = processor.gate(
+            packet.hand_landmarks, packet.gate_results, packet.index
+        )
+        packet.in_command_mode = processor.control(
+            packet.timestamp, packet.raised_hands, packet.captured_at
+        )
+        if not processor.render(packet):
+            return
+
+        if not gui_enabled:
+            time.sleep(0.001)
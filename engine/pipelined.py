@@ -0,0 +1,173 @@
+"""Pipelined engine — each group of per-frame steps runs on its own thread.
+
+    capture ─▶ hands ─▶ gate model ─▶ control ─▶ render (main thread)
+
+Stages are connected by BoundedQueues, so a slow stage only ever holds up
+the stages before it (``block``) or sheds its oldest backlog
+(``drop_oldest``).  Packets stay in capture order and the gate-model
+(pose or face) result is carried forward exactly as in the serial engine,
+so the controller sees the same raised hands.  Rendering stays on the
+main thread because ``cv2.imshow`` is not thread-safe on every platform.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Callable
+
+from capture.sources import frame_time
+from engine.processor import FramePacket, FrameProcessor
+from engine.queues import END, BoundedQueue
+
+_POLL_SECONDS = 0.1
+QUEUES = ("hands", "gate_model", "control", "render")
+# capture, hands, gate model, control and render each hold one packet.
+_STAGES = 5
+
+
+class PipelinedEngine:
+    def __init__(
+        self,
+        cap,
+        processor: FrameProcessor,
+        queue_size: int,
+        policy: str,
+    ) -> None:
+        self._cap = cap
+        self._processor = processor
+        self._stop = threading.Event()
+        self._error: BaseException | None = None
+
+        # A dropped packet's frame-pool slot can be reused straight away.
+        self.queues = {
+            name: BoundedQueue(queue_size, policy, on_drop=processor.release)
+            for name in QUEUES
+        }
+        self._threads: list[threading.Thread] = []
+
+    # -- plumbing --
+
+    def _put(self, q: BoundedQueue, item) -> bool:
+        """Forward to the next stage, giving up only if the engine stops."""
+        while not self._stop.is_set():
+            if q.put(item, timeout=_POLL_SECONDS):
+                return True
+        return False
+
+    def _spawn(self, name: str, target: Callable, *args) -> None:
+        def runner():
+            try:
+                target(*args)
+            except BaseException as exc:  # surfaced from run()
+                self._error = exc
+                self._stop.set()
+
+        t = threading.Thread(target=runner, name=f"pipeline-{name}", daemon=True)
+        t.start()
+        self._threads.append(t)
+
+    def _stage(
+        self,
+        inbox: BoundedQueue,
+        outbox: BoundedQueue,
+        step: Callable[[FramePacket], None],
+    ) -> None:
+        while not self._stop.is_set():
+            try:
+                packet = inbox.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+            if packet is END:
+                self._put(outbox, END)
+                return
+            step(packet)
+            if not self._put(outbox, packet):
+                return
+
+    # -- stages --
+
+    def _capture(self) -> None:
+        index = 0
+        while not self._stop.is_set():
+            self._processor.pace(self._cap)
+            ok, frame = self._cap.read()
+            if not ok:
+                break
+            packet = FramePacket(
+                index=index,
+                timestamp=time.monotonic(),
+                frame=frame,
+                source_time=frame_time(self._cap),
+            )
+            index += 1
+            self._processor.prepare(packet)
+            self._processor.check_motion(packet)
+            if not self._put(self.queues["hands"], packet):
+                return
+        self._put(self.queues["hands"], END)
+
+    def _hands(self, packet: FramePacket) -> None:
+        if packet.run_inference:
+            packet.hand_landmarks = self._processor.detect_hands(packet.prepared)
+
+    def _gate_model(self, packet: FramePacket) -> None:
+        if packet.run_inference:
+            packet.gate_results = self._processor.update_gate_results(
+                packet.index, packet.prepared, packet.hand_landmarks
+            )
+        else:
+            packet.gate_results = self._processor.gate_results
+
+    def _control(self, packet: FramePacket) -> None:
+        packet.raised_hands = self._processor.gate(
+            packet.hand_landmarks, packet.gate_results, packet.index
+        )
+        packet.in_command_mode = self._processor.control(
+            packet.controller_time(packet.timestamp),
+            packet.raised_hands,
+            packet.captured_at,
+        )
+
+    # -- driver --
+
+    def run(self) -> None:
+        q = self.queues
+        self._spawn("capture", self._capture)
+        self._spawn("hands", self._stage, q["hands"], q["gate_model"], self._hands)
+        self._spawn(
+            "gate_model", self._stage, q["gate_model"], q["control"], self._gate_model
+        )
+        self._spawn("control", self._stage, q["control"], q["render"], self._control)
+
+        try:
+            while not self._stop.is_set():
+                try:
+                    packet = q["render"].get(timeout=_POLL_SECONDS)
+                except queue.Empty:
+                    continue
+                if packet is END:
+                    break
+                if not self._processor.render(packet):
+                    break
+        finally:
+            self._stop.set()
+            for t in self._threads:
+                t.join(timeout=1.0)
+
+        dropped = {name: bq.dropped for name, bq in q.items() if bq.dropped}
+        if dropped:
+            print(f"[pipeline] Dropped frames per queue: {dropped}")
+        if self._error is not None:
+            raise self._error
+
+
+def max_frames_in_flight(queue_size: int) -> int:
+    """Most packets the engine can hold at once, e.g. to size a FramePool
+    that packets release when rendered or dropped."""
+    return len(QUEUES) * queue_size + _STAGES
+
+
+def run(cap, processor: FrameProcessor, queue_size: int, policy: str) -> None:
+    PipelinedEngine(cap, processor, queue_size, policy).run()
@@ -0,0 +1,343 @@
+"""FrameProcessor — the per-frame steps shared by every engine.
+
+The serial loop calls them back to back; the pipelined engine runs each
+group of steps on its own thread.  Either way the controller sees the same
+sequence of raised hands.
+
+The preview behaves like a mirror.  By default the pixels are flipped
+before inference; with ``mirror_landmarks`` the models see the raw frame,
+their landmarks are mirrored instead (so gating and ``recognize`` see the
+same coordinates either way) and pixels are only flipped for display.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+
+import cv2
+import numpy as np
+
+from state_machine import State, StateMachine
+from controller import GestureController
+from engine.display import WINDOW_NAME, DisplayStage, compose
+from engine.duty_cycle import DutyCycler
+from engine.flight_recorder import FlightRecorder
+from engine.governor import LatencyGovernor
+from engine.mjpeg_server import MjpegPreview
+from gestures.frame import PreparedFrame
+from gestures.frame_pool import FramePool
+from gestures.gate_scheduler import GateModelResult, GateModelScheduler
+from gestures.landmarks import mirror_gate_result, mirror_landmarks
+from gestures.motion_gate import MotionGate
+
+
+@dataclass
+class FramePacket:
+    """A frame and everything computed from it so far."""
+
+    index: int
+    timestamp: float
+    frame: np.ndarray
+    prepared: PreparedFrame | None = None
+    hand_landmarks: list = field(default_factory=list)
+    gate_results: GateModelResult | None = None
+    raised_hands: list = field(default_factory=list)
+    in_command_mode: bool = False
+    run_inference: bool = True
+    captured_at: float = field(default_factory=time.monotonic)
+    # The recording's timestamp for file sources (see capture.sources).
+    source_time: float | None = None
+
+    def controller_time(self, now: float) -> float:
+        """The time the controller should see: ``source_time`` when the
+        frame comes from a recording, else ``now``."""
+        return now if self.source_time is None else self.source_time
+
+
+class FrameProcessor:
+    def __init__(
+        self,
+        detector,
+        gate_model,
+        hand_gate,
+        sm: StateMachine,
+        controller: GestureController,
+        hooks: list,
+        gui_enabled: bool,
+        motion_gate: MotionGate | None = None,
+        gate_scheduler: GateModelScheduler | None = None,
+        mirror_landmarks: bool = False,
+        frame_pool: FramePool | None = None,
+        duty_cycle: DutyCycler | None = None,
+        governor: LatencyGovernor | None = None,
+        display: DisplayStage | None = None,
+        preview: MjpegPreview | None = None,
+        flight_recorder: FlightRecorder | None = None,
+    ) -> None:
+        self.detector = detector
+        self.gate_model = gate_model
+        self._hand_gate = hand_gate
+        self._sm = sm
+        self._controller = controller
+        self._hooks = hooks
+        self._gui_enabled = gui_enabled
+        self._motion_gate = motion_gate
+        self._gate_scheduler = gate_scheduler or GateModelScheduler()
+        self._mirror_landmarks = mirror_landmarks
+        self._frame_pool = frame_pool
+        self._duty_cycle = duty_cycle
+        self._governor = governor
+        self._applied_max_hands: int | None = None
+        self._display = display
+        self._preview = preview
+        self._flight_recorder = flight_recorder
+        self._display_buf: np.ndarray | None = None
+
+        self._gate_results: GateModelResult | None = None
+        # Hands from the most recently gated frame, for engines that must
+        # schedule the gate model before the current frame's hands are known.
+        self._last_hands: list = []
+
+    def pace(self, cap) -> None:
+        """Before each read: wait for the duty cycle's next frame, if any,
+        and drop the frames the governor wants skipped."""
+        if self._duty_cycle is not None:
+            self._duty_cycle.update(self._sm.state, bool(self._last_hands))
+            self._duty_cycle.pace(cap)
+        if self._governor is not None:
+            discard = getattr(cap, "grab", None) or cap.read
+            for _ in range(self._governor.settings.frame_skip - 1):
+                discard()
+
+    def prepare(self, packet: FramePacket, dst: np.ndarray | None = None) -> None:
+        """Mirror the raw camera frame so the preview behaves like a mirror,
+        unless landmarks are mirrored instead.
+
+        The prepared frame replaces ``packet.frame``; its RGB and
+        ``mp.Image`` forms are built lazily and shared by every consumer.
+        Without an explicit ``dst`` the frame pool's buffers are used, if
+        there is one, and the duty cycle's downscale is applied.
+        """
+        mirror = not self._mirror_landmarks
+        if dst is None:
+            scale = 1.0
+            if self._duty_cycle is not None:
+                scale *= self._duty_cycle.profile.scale
+            if self._governor is not None:
+                scale *= self._governor.settings.scale
+            if scale != 1.0:
+                packet.frame = cv2.resize(
+                    packet.frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA
+                )
+        if dst is None and self._frame_pool is not None:
+            packet.prepared = self._frame_pool.prepare(packet.frame, mirror)
+        else:
+            packet.prepared = PreparedFrame.from_camera(
+                packet.frame, dst=dst, mirror=mirror
+            )
+        packet.frame = packet.prepared.bgr
+
+    def check_motion(self, packet: FramePacket) -> bool:
+        """Decide whether the models should run on this packet.
+
+        Always true without a motion gate, and always true in command mode
+        so a held gesture is never starved of inference.
+        """
+        if self._motion_gate is not None:
+            packet.run_inference = self._motion_gate.should_infer(
+                packet.frame, force=self._sm.state == State.COMMAND_MODE
+            )
+        return packet.run_inference
+
+    def detect_hands(self, frame: PreparedFrame) -> list:
+        if self._governor is not None:
+            self._apply_max_hands(self._governor.settings.max_hands)
+        return self.hands_from(self.detector.process(frame))
+
+    def _apply_max_hands(self, max_hands: int) -> None:
+        # Rebuilding the landmarker is slow, so only on an actual change.
+        if self._applied_max_hands is None:
+            self._applied_max_hands = max_hands
+        elif max_hands != self._applied_max_hands:
+            set_max_hands = getattr(self.detector, "set_max_hands", None)
+            if set_max_hands is None:
+                # The governor would go on believing the limit changed.
+                raise TypeError(
+                    f"{type(self.detector).__name__} cannot change max_hands; "
+                    "disable the governor's max_hands steps for this detector"
+                )
+            set_max_hands(max_hands)
+            self._applied_max_hands = max_hands
+
+    def hands_from(self, result) -> list:
+        """Hand landmarks from a detector result, in mirrored coordinates."""
+        hands = result.hand_landmarks or []
+        if self._mirror_landmarks:
+            return [mirror_landmarks(lm) for lm in hands]
+        return hands
+
+    @property
+    def gate_model_kind(self) -> str | None:
+        """Which model the raised-hand gate needs ("pose", "face" or None)."""
+        return self._hand_gate.model_kind
+
+    def gate_model_due(self, index: int, hands: list | None = None) -> bool:
+        """True when frame ``index`` should get a fresh gate-model inference.
+
+        ``hands`` are the hands seen on that frame; engines that have to
+        decide before hand inference finishes omit them and the hands of
+        the last gated frame are used instead.
+        """
+        if hands is None:
+            hands = self._last_hands
+        if self._governor is not None:
+            max_age = self._governor.settings.gate_model_max_age_frames
+            self._gate_scheduler.max_age_frames = max_age
+        return self._hand_gate.model_kind is not None and self._gate_scheduler.due(
+            index, hands
+        )
+
+    def claim_gate_model(self, index: int, hands: list | None = None) -> None:
+        """Record that frame ``index`` was sent for gate-model inference."""
+        if hands is None:
+            hands = self._last_hands
+        self._gate_scheduler.claim(index, hands)
+
+    def store_gate_results(self, gate_results, index: int) -> None:
+        """Cache a gate-model result computed on frame ``index``."""
+        if self._mirror_landmarks:
+            gate_results = mirror_gate_result(gate_results)
+        self._gate_results = GateModelResult(gate_results, index)
+
+    @property
+    def gate_results(self) -> GateModelResult | None:
+        return self._gate_results
+
+    def update_gate_results(
+        self, index: int, frame: PreparedFrame, hands: list
+    ) -> GateModelResult | None:
+        """Run the gate model when the scheduler asks for it, else reuse the
+        cached result."""
+        if self.gate_model_due(index, hands):
+            self.claim_gate_model(index, hands)
+            self.store_gate_results(self.gate_model.process(frame), index)
+        return self._gate_results
+
+    def gate(
+        self, all_hands: list, gate_results: GateModelResult | None, index: int
+    ) -> list:
+        """Keep only the hands the raised-hand gate lets through on frame
+        ``index``.  The gate sees how many frames old the result is."""
+        self._last_hands = all_hands
+        if self._motion_gate is not None:
+            self._motion_gate.note_hands(bool(all_hands))
+        if gate_results is None:
+            return self._hand_gate.raised_hands(all_hands, None)
+        return self._hand_gate.raised_hands(
+            all_hands, gate_results.result, gate_results.age(index)
+        )
+
+    def control(
+        self, now: float, raised_hands: list, captured_at: float | None = None
+    ) -> bool:
+        """Feed the controller and return whether we are in command mode.
+
+        ``captured_at`` (``time.monotonic()`` at capture) lets the governor
+        measure the frame's latency.
+        """
+        if self._flight_recorder is not None:
+            # Before the controller, so transitions it causes carry ``now``.
+            self._flight_recorder.add_landmarks(now, self._last_hands, raised_hands)
+        self._controller.handle_frame(now, raised_hands)
+        if self._governor is not None and captured_at is not None:
+            self._governor.record((time.monotonic() - captured_at) * 1000)
+        return self._sm.state == State.COMMAND_MODE
+
+    def release(self, packet) -> None:
+        """Give the packet's frame-pool slot back, once it has been rendered
+        or dropped.  Anything that is not a pooled packet is ignored."""
+        prepared = getattr(packet, "prepared", None)
+        if self._frame_pool is not None and prepared is not None:
+            self._frame_pool.release(prepared)
+
+    def render(self, packet: FramePacket) -> bool:
+        """Draw overlays and show the preview.  Returns False when the user quits.
+
+        With a DisplayStage the frame is only handed over: overlays, hooks'
+        ``on_frame`` and the window all run on the display thread.  The
+        MJPEG preview likewise gets the clean frame and annotates its own copy.
+        Either way the packet's buffers are released afterwards.
+        """
+        try:
+            return self._render(packet)
+        finally:
+            self.release(packet)
+
+    def _render(self, packet: FramePacket) -> bool:
+        frame = packet.frame
+        if packet.prepared is not None:
+            for hook in self._hooks:
+                on_rgb_frame = getattr(hook, "on_rgb_frame", None)
+                if on_rgb_frame is not None:
+                    on_rgb_frame(packet.prepared.rgb, packet.in_command_mode)
+
+        if self._flight_recorder is not None:
+            self._flight_recorder.add_frame(
+                packet.controller_time(packet.timestamp),
+                frame,
+                mirror=self._mirror_landmarks,
+            )
+
+        if self._preview is not None:
+            self._preview.submit(
+                frame,
+                packet.raised_hands,
+                packet.in_command_mode,
+                mirror=self._mirror_landmarks,
+            )
+
+        if self._display is not None:
+            self._display.submit(
+                frame,
+                packet.raised_hands,
+                packet.in_command_mode,
+                mirror=self._mirror_landmarks,
+            )
+            return not self._display.quit_requested
+
+        if self._gui_enabled:
+            if self._mirror_landmarks:
+                # Reused across frames; cv2.flip reallocates on a size change.
+                self._display_buf = cv2.flip(frame, 1, dst=self._display_buf)
+                frame = self._display_buf
+            compose(frame, packet.raised_hands, packet.in_command_mode, self._hooks)
+        elif self._preview is None:
+            # With a preview its encoder thread runs the hooks' on_frame.
+            for hook in self._hooks:
+                hook.on_frame(frame, packet.in_command_mode)
+
+        if self._gui_enabled:
+            cv2.imshow(WINDOW_NAME, frame)
+            if cv2.waitKey(1) & 0xFF == ord("q"):
+                return False
+        return True
+
+    def process(self, packet: FramePacket) -> bool:
+        """Run every step on one packet, in order.  Returns False to stop."""
+        self.prepare(packet)
+        if self.check_motion(packet):
+            packet.hand_landmarks = self.detect_hands(packet.prepared)
+            packet.gate_results = self.update_gate_results(
+                packet.index, packet.prepared, packet.hand_landmarks
+            )
+        else:
+            packet.gate_results = self._gate_results
+        packet.timestamp = packet.controller_time(time.monotonic())
+        packet.raised_hands = self.gate(
+            packet.hand_landmarks, packet.gate_results, packet.index
+        )
+        packet.in_command_mode = self.control(
+            packet.timestamp, packet.raised_hands, packet.captured_at
+        )
+        return self.render(packet)
@@ -0,0 +1,107 @@
+"""Bounded hand-off queues between pipeline stages."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Callable
+
+DROP_OLDEST = "drop_oldest"
+BLOCK = "block"
+POLICIES = (DROP_OLDEST, BLOCK)
+
+# Marks the end of the stream.
+END = object()
+
+
+class BoundedQueue:
+    """A fixed-size queue with a configurable policy for when it is full.
+
+    ``drop_oldest`` discards the oldest waiting item so producers never
+    stall (and counts what it dropped, passing it to ``on_drop``);
+    ``block`` makes the producer wait for room, applying back-pressure up
+    the pipeline.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        policy: str = DROP_OLDEST,
+        on_drop: Callable[[object], None] | None = None,
+    ) -> None:
+        if policy not in POLICIES:
+            raise ValueError(
+                f"Unknown queue policy '{policy}', expected one of {POLICIES}"
+            )
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._policy = policy
+        self._on_drop = on_drop
+        self.dropped = 0
+
+    def put(self, item, timeout: float | None = None) -> bool:
+        """Enqueue ``item``.  Returns False if a blocking put timed out."""
+        if self._policy == BLOCK:
+            try:
+                self._queue.put(item, timeout=timeout)
+            except queue.Full:
+                return False
+            return True
+
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return True
+            except queue.Full:
+                try:
+                    dropped = self._queue.get_nowait()
+                except queue.Empty:
+                    continue
+                self.dropped += 1
+                if self._on_drop is not None:
+                    self._on_drop(dropped)
+
+    def get(self, timeout: float | None = None):
+        """Dequeue the next item.  Raises ``queue.Empty`` on timeout."""
+        return self._queue.get(timeout=timeout)
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+
+class LatestSlot:
+    """A one-item mailbox: ``put`` overwrites, ``get`` waits for something new.
+
+    Used where only the freshest value matters, e.g. the latest inference
+    result.  Overwritten values that were never read are counted.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._item = None
+        self._seq = 0
+        self._read_seq = 0
+        self.dropped = 0
+
+    def put(self, item):
+        """Store ``item``; returns the unread item it replaced, if any."""
+        displaced = None
+        with self._cond:
+            if self._seq > self._read_seq:
+                self.dropped += 1
+                displaced = self._item
+            self._item = item
+            self._seq += 1
+            self._cond.notify_all()
+        return displaced
+
+    def get(self, timeout: float | None = None):
+        """Return the newest unread item.  Raises ``queue.Empty`` on timeout."""
+        with self._cond:
+            if not self._cond.wait_for(
+                lambda: self._seq > self._read_seq, timeout=timeout
+            ):
+                raise queue.Empty
+            self._read_seq = self._seq
+            return self._item
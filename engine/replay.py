@@ -0,0 +1,73 @@
+"""Landmark replay — drive gating and the controller from a recording.
+
+No frames, models, MediaPipe or OpenCV: recorded landmarks go straight
+through the raised-hand gate and into ``GestureController.handle_frame``
+on the recording's timestamps.  The gate model's results were recorded
+on every frame with hands, so the GateModelScheduler picks which of them
+gating gets to see exactly as it would live.
+
+Commands resolve to ReplayRegistry stand-ins that only log the gesture,
+so a replay never touches real devices.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from gestures.gate_scheduler import GateModelResult, GateModelScheduler
+from gestures.recording import LandmarkRecording
+
+
+class FiredCommand(NamedTuple):
+    timestamp: float
+    gesture: str
+
+
+class _LoggedCommand:
+    def __init__(self, registry: "ReplayRegistry", gesture: str) -> None:
+        self._registry = registry
+        self._gesture = gesture
+
+    def execute(self) -> None:
+        self._registry.fired.append(FiredCommand(self._registry.now, self._gesture))
+
+
+class ReplayRegistry:
+    """Resolves every gesture to a command that records when it ran."""
+
+    def __init__(self) -> None:
+        self.fired: list[FiredCommand] = []
+        self.now = 0.0
+
+    def resolve(self, gesture_name: str) -> _LoggedCommand:
+        return _LoggedCommand(self, gesture_name)
+
+
+def replay(
+    recording: LandmarkRecording,
+    hand_gate,
+    controller,
+    scheduler: GateModelScheduler | None = None,
+    registry: ReplayRegistry | None = None,
+) -> None:
+    """Feed every recorded frame through ``hand_gate`` into ``controller``.
+
+    ``registry``, if the controller was built with one, is told each
+    frame's time so fired commands are stamped with it.
+    """
+    scheduler = scheduler or GateModelScheduler()
+    cached: GateModelResult | None = None
+    # Gate-model results are only unpacked for the frames that use them.
+    timestamps = recording.timestamps.tolist()
+    for index, hands in enumerate(recording.hand_landmarks):
+        if hand_gate.model_kind is not None and scheduler.due(index, hands):
+            scheduler.claim(index, hands)
+            cached = GateModelResult(recording.gate_result(index), index)
+        if cached is None:
+            raised = hand_gate.raised_hands(hands, None)
+        else:
+            raised = hand_gate.raised_hands(hands, cached.result, cached.age(index))
+        now = timestamps[index]
+        if registry is not None:
+            registry.now = now
+        controller.handle_frame(now, raised)
@@ -0,0 +1,30 @@
+"""Serial engine — capture and process one frame at a time on the main thread."""
+
+from __future__ import annotations
+
+import time
+
+from capture.sources import frame_time
+from engine.processor import FramePacket, FrameProcessor
+
+
+def run(cap, processor: FrameProcessor, gui_enabled: bool) -> None:
+    index = 0
+    while True:
+        processor.pace(cap)
+        ok, frame = cap.read()
+        if not ok:
+            break
+
+        packet = FramePacket(
+            index=index,
+            timestamp=time.monotonic(),
+            frame=frame,
+            source_time=frame_time(cap),
+        )
+        index += 1
+        if not processor.process(packet):
+            break
+
+        if not gui_enabled:
+            time.sleep(0.001)
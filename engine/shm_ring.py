@@ -0,0 +1,61 @@
+"""SharedFrameRing — fixed-size frame slots in ``multiprocessing.shared_memory``.
+
+The producer writes each frame straight into a slot and only the slot
+number travels to the worker processes, so frames are never pickled or
+copied through a pipe.  The caller is responsible for not reusing a slot
+while a worker may still be reading it.
+"""
+
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+class SharedFrameRing:
+    def __init__(
+        self,
+        slots: int,
+        height: int,
+        width: int,
+        channels: int = 3,
+        name: str | None = None,
+    ) -> None:
+        self.slots = slots
+        self.shape = (height, width, channels)
+        size = slots * height * width * channels
+        self._owner = name is None
+        if self._owner:
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+        self._frames = np.ndarray(
+            (slots, *self.shape), dtype=np.uint8, buffer=self._shm.buf
+        )
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def slot_for(self, index: int) -> int:
+        return index % self.slots
+
+    def view(self, slot: int) -> np.ndarray:
+        """A writable array backed by the shared memory of ``slot``."""
+        return self._frames[slot]
+
+    def write(self, slot: int, frame: np.ndarray) -> np.ndarray:
+        if frame.shape != self.shape:
+            raise ValueError(
+                f"Frame shape {frame.shape} does not match ring shape {self.shape}"
+            )
+        view = self._frames[slot]
+        np.copyto(view, frame)
+        return view
+
+    def close(self) -> None:
+        del self._frames
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
@@ -0,0 +1,170 @@
+"""Hand and gate-model inference in worker processes.
+
+Each worker owns its own MediaPipe model and reads frames from a
+SharedFrameRing.  Jobs are ``(index, slot)`` pairs and results are
+compact float32 arrays, so neither direction moves pixels through a pipe
+and model inference never contends for the main interpreter's GIL.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import queue
+import traceback
+
+import numpy as np
+
+from engine.shm_ring import SharedFrameRing
+from gestures.landmarks import (
+    FaceResult,
+    HandResult,
+    PoseResult,
+    from_array,
+    handedness_labels,
+    to_array,
+)
+
+_RESULT_TIMEOUT_SECONDS = 10.0
+
+
+def _compact_hands(result):
+    return to_array(result.hand_landmarks or []), handedness_labels(result)
+
+
+def _compact_pose(result):
+    return to_array(result.pose_landmarks or [])
+
+
+def _compact_faces(result):
+    return np.array(result.faces, dtype=np.float32).reshape(-1, 4)
+
+
+def _hand_worker(ring_name, ring_shape, slots, detector_kwargs, jobs, results):
+    from gestures.detector import HandDetector
+
+    detector = HandDetector(**detector_kwargs)
+    _serve(detector, _compact_hands, ring_name, ring_shape, slots, jobs, results)
+
+
+def _gate_model_worker(
+    ring_name, ring_shape, slots, detector_kwargs, jobs, results, kind
+):
+    from gestures.gating import build_gate_model
+
+    detector = build_gate_model(kind, **detector_kwargs)
+    compact = _compact_pose if kind == "pose" else _compact_faces
+    _serve(detector, compact, ring_name, ring_shape, slots, jobs, results)
+
+
+def _serve(detector, compact, ring_name, ring_shape, slots, jobs, results) -> None:
+    ring = SharedFrameRing(slots, *ring_shape, name=ring_name)
+    try:
+        while True:
+            job = jobs.get()
+            if job is None:
+                return
+            index, slot = job
+            try:
+                payload = compact(detector.process(ring.view(slot)))
+            except Exception:
+                results.put((index, "error", traceback.format_exc()))
+                return
+            results.put((index, "ok", payload))
+    finally:
+        detector.close()
+        ring.close()
+
+
+class _Worker:
+    def __init__(self, ctx, name, target, ring, detector_kwargs, *extra) -> None:
+        self.name = name
+        self.jobs = ctx.Queue()
+        self.results = ctx.Queue()
+        self.process = ctx.Process(
+            target=target,
+            args=(
+                ring.name,
+                ring.shape,
+                ring.slots,
+                detector_kwargs,
+                self.jobs,
+                self.results,
+                *extra,
+            ),
+            name=f"{name}-worker",
+            daemon=True,
+        )
+
+    def result_for(self, index: int):
+        while True:
+            try:
+                got_index, status, payload = self.results.get(
+                    timeout=_RESULT_TIMEOUT_SECONDS
+                )
+            except queue.Empty:
+                if not self.process.is_alive():
+                    raise RuntimeError(f"{self.name} worker exited unexpectedly")
+                continue
+            if status == "error":
+                raise RuntimeError(f"{self.name} worker failed:\n{payload}")
+            if got_index == index:
+                return payload
+
+    def stop(self) -> None:
+        self.jobs.put(None)
+        self.process.join(timeout=2.0)
+        if self.process.is_alive():
+            self.process.terminate()
+
+
+class InferenceWorkers:
+    """A hand worker plus, if the gate needs one, a gate-model worker,
+    all sharing one frame ring."""
+
+    def __init__(
+        self,
+        ring: SharedFrameRing,
+        hand_kwargs: dict,
+        gate_model_kind: str | None,
+        gate_model_kwargs: dict,
+    ) -> None:
+        ctx = mp.get_context("spawn")
+        self._gate_model_kind = gate_model_kind
+        self._workers = [_Worker(ctx, "hands", _hand_worker, ring, hand_kwargs)]
+        self._hands = self._workers[0]
+        self._gate_model = None
+        if gate_model_kind is not None:
+            self._gate_model = _Worker(
+                ctx,
+                gate_model_kind,
+                _gate_model_worker,
+                ring,
+                gate_model_kwargs,
+                gate_model_kind,
+            )
+            self._workers.append(self._gate_model)
+
+    def start(self) -> "InferenceWorkers":
+        for worker in self._workers:
+            worker.process.start()
+        return self
+
+    def submit_hands(self, index: int, slot: int) -> None:
+        self._hands.jobs.put((index, slot))
+
+    def submit_gate_model(self, index: int, slot: int) -> None:
+        self._gate_model.jobs.put((index, slot))
+
+    def hands_result(self, index: int) -> HandResult:
+        arr, handedness = self._hands.result_for(index)
+        return HandResult(from_array(arr), handedness)
+
+    def gate_model_result(self, index: int) -> PoseResult | FaceResult:
+        arr = self._gate_model.result_for(index)
+        if self._gate_model_kind == "pose":
+            return PoseResult(from_array(arr))
+        return FaceResult([tuple(box) for box in arr.tolist()])
+
+    def close(self) -> None:
+        for worker in self._workers:
+            worker.stop()
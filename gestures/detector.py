@@ -1,13 +1,14 @@
-import os
+from typing import Callable
 
 import mediapipe as mp
 import cv2
 import numpy as np
 
-BaseOptions = mp.tasks.BaseOptions
+from gestures.frame import PreparedFrame
+from gestures.models import HAND_MODELS, RUNNING_MODES, base_options, model_path
+
 HandLandmarker = mp.tasks.vision.HandLandmarker
 HandLandmarkerOptions = mp.tasks.vision.HandLandmarkerOptions
-VisionRunningMode = mp.tasks.vision.RunningMode
 
 # Standard MediaPipe hand connections for drawing.
 HAND_CONNECTIONS = [
@@ -36,54 +37,115 @@ HAND_CONNECTIONS = [
     (13, 17),  # palm
 ]
 
-MODEL_PATH = os.path.join(
-    os.path.dirname(os.path.dirname(__file__)), "hand_landmarker.task"
-)
+
+_CONNECTION_INDEX = np.array(HAND_CONNECTIONS)
+
+
+def draw_hands(frame: np.ndarray, hands: list) -> None:
+    """Draw every hand's connections and joints with one polylines call each.
+
+    Joints are zero-length segments: OpenCV caps thick lines with round
+    ends, so each becomes a filled dot the size of the old circles.
+    """
+    if not hands:
+        return
+    h, w = frame.shape[:2]
+    points = np.array(
+        [[(lm.x * w, lm.y * h) for lm in landmarks] for landmarks in hands]
+    ).astype(np.int32)
+    segments = points[:, _CONNECTION_INDEX].reshape(-1, 2, 2)
+    joints = np.repeat(points.reshape(-1, 1, 2), 2, axis=1)
+    cv2.polylines(frame, list(segments), False, (0, 255, 0), 2)
+    cv2.polylines(frame, list(joints), False, (0, 0, 255), 8)
+
+
+def draw_landmarks(frame: np.ndarray, landmarks: list) -> None:
+    """Draw hand landmarks and connections on the frame."""
+    draw_hands(frame, [landmarks])
 
 
 class HandDetector:
-    """Wraps the MediaPipe Tasks HandLandmarker (VIDEO mode)."""
+    """Wraps the MediaPipe Tasks HandLandmarker.
+
+    ``running_mode`` is "video" (the default) or "image" for ``process``,
+    or "live_stream" for ``process_async``, which also needs a
+    ``result_callback``.
+    """
 
     def __init__(
         self,
         max_hands: int,
         min_detection_confidence: float,
         min_tracking_confidence: float,
+        running_mode: str = "video",
+        result_callback: Callable[[object, int], None] | None = None,
+        model_variant: str = "full",
+        use_model_buffer: bool = False,
+        delegate: str = "cpu",
     ):
-        if not os.path.exists(MODEL_PATH):
-            raise FileNotFoundError(
-                f"Model not found at {MODEL_PATH}. Download it with:\n"
-                "  wget -q https://storage.googleapis.com/mediapipe-models/"
-                "hand_landmarker/hand_landmarker/float16/1/hand_landmarker.task"
+        if (running_mode == "live_stream") != (result_callback is not None):
+            raise ValueError(
+                "result_callback is required for, and only for, live_stream mode"
             )
+        path = model_path(HAND_MODELS, model_variant)
 
         options = HandLandmarkerOptions(
-            base_options=BaseOptions(model_asset_path=MODEL_PATH),
-            running_mode=VisionRunningMode.VIDEO,
+            base_options=base_options(path, use_model_buffer, delegate),
+            running_mode=RUNNING_MODES[running_mode],
             num_hands=max_hands,
             min_hand_detection_confidence=min_detection_confidence,
             min_hand_presence_confidence=min_tracking_confidence,
+            result_callback=(
+                (lambda result, _image, ts_ms: result_callback(result, ts_ms))
+                if result_callback
+                else None
+            ),
         )
+        self._options = options
         self._landmarker = HandLandmarker.create_from_options(options)
+        self._running_mode = running_mode
         self._frame_ts = 0
+        self._last_async_ts_ms = -1
 
-    def process(self, frame: np.ndarray):
-        """Process a BGR frame and return a HandLandmarkerResult."""
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
+    def process(self, frame: np.ndarray | PreparedFrame):
+        """Process a BGR frame (or a PreparedFrame) and return a HandLandmarkerResult."""
+        if not isinstance(frame, PreparedFrame):
+            frame = PreparedFrame(frame)
+        if self._running_mode == "image":
+            return self._landmarker.detect(frame.mp_image)
         self._frame_ts += 1
-        return self._landmarker.detect_for_video(mp_image, self._frame_ts)
+        return self._landmarker.detect_for_video(frame.mp_image, self._frame_ts)
 
-    def draw_landmarks(self, frame: np.ndarray, landmarks: list) -> None:
-        """Draw hand landmarks and connections on the frame."""
-        h, w = frame.shape[:2]
-        points = [(int(lm.x * w), int(lm.y * h)) for lm in landmarks]
+    def process_async(
+        self, frame: np.ndarray | PreparedFrame, timestamp_ms: int
+    ) -> int:
+        """Queue a frame for LIVE_STREAM inference and return the timestamp
+        used.  The result arrives via ``result_callback(result, timestamp_ms)``
+        on a MediaPipe thread.
 
-        for start, end in HAND_CONNECTIONS:
-            cv2.line(frame, points[start], points[end], (0, 255, 0), 2)
+        MediaPipe drops queued frames on its own when inference falls behind.
+        """
+        if not isinstance(frame, PreparedFrame):
+            frame = PreparedFrame(frame)
+        # LIVE_STREAM requires strictly increasing timestamps.
+        timestamp_ms = max(timestamp_ms, self._last_async_ts_ms + 1)
+        self._last_async_ts_ms = timestamp_ms
+        self._landmarker.detect_async(frame.mp_image, timestamp_ms)
+        return timestamp_ms
 
-        for pt in points:
-            cv2.circle(frame, pt, 4, (0, 0, 255), -1)
+    def set_max_hands(self, max_hands: int) -> None:
+        """Rebuild the landmarker with a new hand limit.
+
+        This reloads the model, so it is meant for rare adjustments (the
+        latency governor), not per-frame use.
+        """
+        self._landmarker.close()
+        self._options.num_hands = max_hands
+        self._landmarker = HandLandmarker.create_from_options(self._options)
+
+    def draw_landmarks(self, frame: np.ndarray, landmarks: list) -> None:
+        """Draw hand landmarks and connections on the frame."""
+        draw_landmarks(frame, landmarks)
 
     def close(self) -> None:
         self._landmarker.close()
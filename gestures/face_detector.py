@@ -0,0 +1,97 @@
+"""FaceDetector — wraps the MediaPipe Tasks FaceDetector.
+
+Much cheaper than the pose landmarker; used by the face-based raised-hand
+gate.  Results are returned as a FaceResult of normalized boxes so they
+can be compared with hand landmarks directly.  Running modes work as in
+HandDetector.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+import mediapipe as mp
+import numpy as np
+
+from gestures.frame import PreparedFrame
+from gestures.landmarks import FaceResult
+from gestures.models import FACE_MODELS, RUNNING_MODES, base_options, model_path
+
+MpFaceDetector = mp.tasks.vision.FaceDetector
+MpFaceDetectorOptions = mp.tasks.vision.FaceDetectorOptions
+
+
+def _to_face_result(result, width: int, height: int) -> FaceResult:
+    faces = []
+    for detection in result.detections or []:
+        box = detection.bounding_box
+        faces.append(
+            (
+                box.origin_x / width,
+                box.origin_y / height,
+                (box.origin_x + box.width) / width,
+                (box.origin_y + box.height) / height,
+            )
+        )
+    return FaceResult(faces)
+
+
+class FaceDetector:
+    def __init__(
+        self,
+        min_detection_confidence: float = 0.5,
+        running_mode: str = "video",
+        result_callback: Callable[[FaceResult, int], None] | None = None,
+        model_variant: str = "short_range",
+        use_model_buffer: bool = False,
+        delegate: str = "cpu",
+    ):
+        if (running_mode == "live_stream") != (result_callback is not None):
+            raise ValueError(
+                "result_callback is required for, and only for, live_stream mode"
+            )
+        path = model_path(FACE_MODELS, model_variant)
+        options = MpFaceDetectorOptions(
+            base_options=base_options(path, use_model_buffer, delegate),
+            running_mode=RUNNING_MODES[running_mode],
+            min_detection_confidence=min_detection_confidence,
+            result_callback=(
+                (
+                    lambda result, image, ts_ms: result_callback(
+                        _to_face_result(result, image.width, image.height), ts_ms
+                    )
+                )
+                if result_callback
+                else None
+            ),
+        )
+        self._detector = MpFaceDetector.create_from_options(options)
+        self._running_mode = running_mode
+        self._frame_ts = 0
+        self._last_async_ts_ms = -1
+
+    def process(self, frame: np.ndarray | PreparedFrame) -> FaceResult:
+        """Process a BGR frame (or a PreparedFrame) and return a FaceResult."""
+        if not isinstance(frame, PreparedFrame):
+            frame = PreparedFrame(frame)
+        height, width = frame.bgr.shape[:2]
+        if self._running_mode == "image":
+            result = self._detector.detect(frame.mp_image)
+        else:
+            self._frame_ts += 1
+            result = self._detector.detect_for_video(frame.mp_image, self._frame_ts)
+        return _to_face_result(result, width, height)
+
+    def process_async(
+        self, frame: np.ndarray | PreparedFrame, timestamp_ms: int
+    ) -> int:
+        """Queue a frame for LIVE_STREAM inference; see HandDetector.process_async."""
+        if not isinstance(frame, PreparedFrame):
+            frame = PreparedFrame(frame)
+        timestamp_ms = max(timestamp_ms, self._last_async_ts_ms + 1)
+        self._last_async_ts_ms = timestamp_ms
+        self._detector.detect_async(frame.mp_image, timestamp_ms)
+        return timestamp_ms
+
+    def close(self) -> None:
+        self._detector.close()
@@ -0,0 +1,57 @@
+"""PreparedFrame — one camera frame, converted once for every consumer.
+
+The BGR frame (mirrored, unless landmarks are mirrored instead), its RGB
+conversion and the ``mp.Image`` wrapper are each produced at most once
+per frame and shared by the hand detector,
+the pose detector and any hook that wants RGB.  Conversions are lazy, so
+frames that never reach a model never pay for them.
+"""
+
+from __future__ import annotations
+
+import cv2
+import mediapipe as mp
+import numpy as np
+
+
+class PreparedFrame:
+    __slots__ = ("bgr", "_rgb", "_rgb_dst", "_mp_image")
+
+    def __init__(self, bgr: np.ndarray, rgb_dst: np.ndarray | None = None) -> None:
+        self.bgr = bgr
+        self._rgb: np.ndarray | None = None
+        self._rgb_dst = rgb_dst
+        self._mp_image: mp.Image | None = None
+
+    @classmethod
+    def from_camera(
+        cls,
+        raw: np.ndarray,
+        dst: np.ndarray | None = None,
+        mirror: bool = True,
+        rgb_dst: np.ndarray | None = None,
+    ) -> "PreparedFrame":
+        """Mirror a raw camera frame (into ``dst`` if given) and wrap it.
+
+        With ``mirror=False`` the raw frame is wrapped as is, or copied
+        into ``dst`` when one is given.  ``rgb_dst`` receives the RGB
+        conversion, if one is ever made.
+        """
+        if mirror:
+            return cls(cv2.flip(raw, 1, dst=dst), rgb_dst)
+        if dst is not None:
+            np.copyto(dst, raw)
+            return cls(dst, rgb_dst)
+        return cls(raw, rgb_dst)
+
+    @property
+    def rgb(self) -> np.ndarray:
+        if self._rgb is None:
+            self._rgb = cv2.cvtColor(self.bgr, cv2.COLOR_BGR2RGB, dst=self._rgb_dst)
+        return self._rgb
+
+    @property
+    def mp_image(self) -> mp.Image:
+        if self._mp_image is None:
+            self._mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=self.rgb)
+        return self._mp_image
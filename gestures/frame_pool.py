@@ -0,0 +1,84 @@
+"""FramePool — preallocated buffers for the per-frame conversions.
+
+Every frame used to get a fresh mirrored BGR array and a fresh RGB array.
+The pool allocates ``slots`` of each once, for the first frame's shape,
+and hands out a free slot as OpenCV ``dst=`` outputs per frame.  A slot
+only becomes free again when its frame is ``release``d — once rendered,
+or when a queue drops it — so a frame still being recognized or drawn is
+never overwritten, however many later frames were prepared and dropped
+meanwhile.  When every slot is taken the frame gets fresh buffers
+instead, as without a pool, and ``misses`` counts it.
+
+``mp.Image`` always copies its input into MediaPipe-owned memory, so
+that wrapper is still created per frame.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+
+from gestures.frame import PreparedFrame
+
+
+class FramePool:
+    def __init__(self, slots: int) -> None:
+        if slots < 1:
+            raise ValueError("FramePool needs at least one slot")
+        self.slots = slots
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._shape: tuple | None = None
+        self._bgr: list[np.ndarray] = []
+        self._rgb: list[np.ndarray] = []
+        self._free: list[int] = []
+        # id(prepared frame) -> slot, for frames not yet released.
+        self._taken: dict[int, int] = {}
+
+    def _allocate(self, shape: tuple) -> None:
+        # Frames still holding old buffers keep them; releasing one later
+        # is a no-op.
+        self._shape = shape
+        self._bgr = [np.empty(shape, dtype=np.uint8) for _ in range(self.slots)]
+        self._rgb = [np.empty(shape, dtype=np.uint8) for _ in range(self.slots)]
+        self._free = list(range(self.slots))
+        self._taken.clear()
+
+    def prepare(self, raw: np.ndarray, mirror: bool = True) -> PreparedFrame:
+        """Like ``PreparedFrame.from_camera``, writing into a free slot.
+
+        Buffers are reallocated only if the camera changes resolution.
+        """
+        with self._lock:
+            if raw.shape != self._shape:
+                self._allocate(raw.shape)
+            if not self._free:
+                self.misses += 1
+                slot = None
+            else:
+                slot = self._free.pop()
+        if slot is None:
+            return PreparedFrame.from_camera(raw, mirror=mirror)
+        prepared = PreparedFrame.from_camera(
+            raw,
+            dst=self._bgr[slot] if mirror else None,
+            mirror=mirror,
+            rgb_dst=self._rgb[slot],
+        )
+        with self._lock:
+            self._taken[id(prepared)] = slot
+        return prepared
+
+    def release(self, prepared: PreparedFrame) -> None:
+        """Make ``prepared``'s slot available again.  Frames that did not
+        come from the pool, or were already released, are ignored."""
+        with self._lock:
+            slot = self._taken.pop(id(prepared), None)
+            if slot is not None:
+                self._free.append(slot)
+
+    @property
+    def available(self) -> int:
+        with self._lock:
+            return len(self._free) if self._shape is not None else self.slots
@@ -0,0 +1,57 @@
+"""Demand-driven scheduling for the gate model (pose or face).
+
+The gate model only matters while hands are in view, so it runs when
+hands are present and the cached result no longer describes the scene:
+it is older than ``max_age_frames``, the number of hands changed, or a
+wrist moved further than ``max_wrist_shift`` (normalized) since the
+cached result was computed.
+
+Results are stamped with the index of the frame they were computed on
+so gating can tell how old they are when it uses them.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import NamedTuple
+
+
+class GateModelResult(NamedTuple):
+    """A gate-model result and the index of the frame it was computed on."""
+
+    result: object
+    frame_index: int
+
+    def age(self, index: int) -> int:
+        """Frames between this result and frame ``index``."""
+        return index - self.frame_index
+
+
+class GateModelScheduler:
+    def __init__(self, max_age_frames: int = 30, max_wrist_shift: float = 0.1):
+        self.max_age_frames = max_age_frames
+        self._max_wrist_shift = max_wrist_shift
+        self._last_index: int | None = None
+        self._wrists: list[tuple[float, float]] = []
+
+    def due(self, index: int, hands: list) -> bool:
+        """True when frame ``index``, showing ``hands``, needs a fresh result."""
+        if not hands:
+            return False
+        if self._last_index is None or len(hands) != len(self._wrists):
+            return True
+        if index - self._last_index >= self.max_age_frames:
+            return True
+        return self._wrist_shift(hands) > self._max_wrist_shift
+
+    def claim(self, index: int, hands: list) -> None:
+        """Record that frame ``index``, showing ``hands``, was sent for inference."""
+        self._last_index = index
+        self._wrists = [(lm[0].x, lm[0].y) for lm in hands]
+
+    def _wrist_shift(self, hands: list) -> float:
+        """Largest distance from a current wrist to its nearest cached wrist."""
+        return max(
+            min(math.dist((lm[0].x, lm[0].y), wrist) for wrist in self._wrists)
+            for lm in hands
+        )
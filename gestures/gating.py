@@ -0,0 +1,150 @@
+"""Raised-hand gating strategies.
+
+Only hands that are deliberately raised may drive the controller.  Each
+strategy decides that from the hand landmarks plus, optionally, the
+result of a cheaper or richer "gate model" run on demand (see
+``gestures.gate_scheduler``) and how many frames old that result is:
+
+- ``pose``      — wrist above the neck of the matching body (pose model)
+- ``face``      — wrist above the chin of the nearest face (face detector)
+- ``heuristic`` — hand size, wrist height and depth alone (no model)
+
+Strategies themselves are pure Python, so they can gate recorded or
+synthetic landmarks without MediaPipe.
+"""
+
+from __future__ import annotations
+
+import config
+from gestures.pose_match import neck_y_for_hand
+
+MIDDLE_FINGER_MCP = 9
+
+
+class PoseGate:
+    model_kind = "pose"
+
+    def __init__(self, match_threshold: float, max_age: int | None = None) -> None:
+        self._match_threshold = match_threshold
+        self._max_age = max_age
+
+    def raised_hands(self, hands: list, results, age: int = 0) -> list:
+        raised = []
+        for lm in hands:
+            neck_y = neck_y_for_hand(
+                lm[0].x, lm[0].y, results, self._match_threshold, age, self._max_age
+            )
+            if neck_y is not None and lm[0].y < neck_y:
+                raised.append(lm)
+        return raised
+
+
+class FaceGate:
+    model_kind = "face"
+
+    def __init__(
+        self, max_face_widths: float = 3.0, max_age: int | None = None
+    ) -> None:
+        self._max_face_widths = max_face_widths
+        self._max_age = max_age
+
+    def raised_hands(self, hands: list, results, age: int = 0) -> list:
+        if not results or not results.faces:
+            return []
+        if self._max_age is not None and age > self._max_age:
+            return []
+        raised = []
+        for lm in hands:
+            wrist = lm[0]
+            face = min(results.faces, key=lambda f: abs((f[0] + f[2]) / 2 - wrist.x))
+            x0, _, x1, chin_y = face
+            reach = (x1 - x0) * self._max_face_widths
+            if abs((x0 + x1) / 2 - wrist.x) <= reach and wrist.y < chin_y:
+                raised.append(lm)
+        return raised
+
+
+class HandHeuristicGate:
+    """Treat a hand as raised when it is close (large), held high in the
+    frame, upright (knuckles above the wrist) and roughly facing the camera
+    (small spread of landmark depths)."""
+
+    model_kind = None
+
+    def __init__(
+        self,
+        min_hand_size: float = 0.12,
+        max_wrist_y: float = 0.65,
+        max_depth_spread: float = 0.2,
+    ) -> None:
+        self._min_hand_size = min_hand_size
+        self._max_wrist_y = max_wrist_y
+        self._max_depth_spread = max_depth_spread
+
+    def raised_hands(self, hands: list, results=None, age: int = 0) -> list:
+        raised = []
+        for lm in hands:
+            xs = [p.x for p in lm]
+            ys = [p.y for p in lm]
+            zs = [getattr(p, "z", 0.0) for p in lm]
+            size = max(max(xs) - min(xs), max(ys) - min(ys))
+            if (
+                size >= self._min_hand_size
+                and lm[0].y <= self._max_wrist_y
+                and lm[MIDDLE_FINGER_MCP].y < lm[0].y
+                and max(zs) - min(zs) <= self._max_depth_spread
+            ):
+                raised.append(lm)
+        return raised
+
+
+GATES = ("pose", "face", "heuristic")
+
+
+def build_from_config():
+    """Build the strategy selected by ``hand_gate`` in config.yaml."""
+    if config.HAND_GATE == "pose":
+        return PoseGate(
+            config.POSE_WRIST_MATCH_THRESHOLD, config.GATE_MODEL_STALE_FRAMES
+        )
+    if config.HAND_GATE == "face":
+        return FaceGate(
+            config.FACE_GATE_MAX_FACE_WIDTHS, config.GATE_MODEL_STALE_FRAMES
+        )
+    if config.HAND_GATE == "heuristic":
+        return HandHeuristicGate(
+            config.HEURISTIC_GATE_MIN_HAND_SIZE,
+            config.HEURISTIC_GATE_MAX_WRIST_Y,
+            config.HEURISTIC_GATE_MAX_DEPTH_SPREAD,
+        )
+    raise ValueError(
+        f"Unknown hand_gate '{config.HAND_GATE}', expected one of {GATES}"
+    )
+
+
+def gate_model_kwargs(kind: str) -> dict:
+    """Detector keyword arguments for a gate model, from config.yaml."""
+    common = {
+        "use_model_buffer": config.MODEL_LOAD_FROM_BUFFER,
+        "delegate": config.INFERENCE_DELEGATE,
+    }
+    if kind == "pose":
+        return {
+            "max_poses": config.MEDIAPIPE_MAX_HANDS,
+            "model_variant": config.POSE_MODEL_VARIANT,
+            **common,
+        }
+    return common
+
+
+def build_gate_model(kind: str | None, **kwargs):
+    """Construct the detector a strategy needs, or None if it needs none."""
+    if kind == "pose":
+        from gestures.pose_detector import PoseDetector
+
+        return PoseDetector(**kwargs)
+    if kind == "face":
+        from gestures.face_detector import FaceDetector
+
+        return FaceDetector(**kwargs)
+    return None
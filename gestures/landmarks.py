@@ -0,0 +1,70 @@
+"""Lightweight landmark containers that need neither MediaPipe nor OpenCV.
+
+They expose the same attribute names as MediaPipe's results
+(``lm.x``/``lm.y``/``lm.z``, ``result.hand_landmarks``,
+``result.pose_landmarks``) so ``recognize`` and the pose matching code
+accept either.  Arrays are shaped ``(people_or_hands, points, 3)``.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+class Landmark(NamedTuple):
+    x: float
+    y: float
+    z: float = 0.0
+
+
+class HandResult(NamedTuple):
+    hand_landmarks: list
+    handedness: list = []
+
+
+class PoseResult(NamedTuple):
+    pose_landmarks: list
+
+
+class FaceResult(NamedTuple):
+    """Face boxes as normalized ``(x0, y0, x1, y1)`` tuples."""
+
+    faces: list
+
+
+def to_array(landmark_lists: list) -> np.ndarray:
+    """Pack a list of landmark lists into a float32 ``(n, points, 3)`` array."""
+    if not landmark_lists:
+        return np.zeros((0, 0, 3), dtype=np.float32)
+    return np.array(
+        [[(lm.x, lm.y, getattr(lm, "z", 0.0)) for lm in lms] for lms in landmark_lists],
+        dtype=np.float32,
+    )
+
+
+def from_array(arr: np.ndarray) -> list[list[Landmark]]:
+    """Unpack an ``(n, points, 3)`` array into lists of Landmarks."""
+    return [[Landmark(*point) for point in lms.tolist()] for lms in arr]
+
+
+def handedness_labels(result) -> list[str]:
+    """Return the top handedness label ("Left"/"Right") for each hand."""
+    return [cats[0].category_name if cats else "" for cats in result.handedness or []]
+
+
+def mirror_landmarks(landmarks: list) -> list[Landmark]:
+    """Mirror one landmark list horizontally, as if the frame had been flipped."""
+    return [Landmark(1.0 - lm.x, lm.y, getattr(lm, "z", 0.0)) for lm in landmarks]
+
+
+def mirror_gate_result(result):
+    """Mirror a pose or face result horizontally; None passes through."""
+    if result is None:
+        return None
+    if hasattr(result, "faces"):
+        return FaceResult(
+            [(1.0 - x1, y0, 1.0 - x0, y1) for x0, y0, x1, y1 in result.faces]
+        )
+    return PoseResult([mirror_landmarks(p) for p in result.pose_landmarks or []])
@@ -0,0 +1,91 @@
+"""Model files and BaseOptions for the MediaPipe landmarkers.
+
+Variants map to the ``.task`` files published by MediaPipe, expected in
+the repository root.  When ``use_buffer`` is set the file is read once
+into memory and the same bytes are handed to every landmarker built from
+it (e.g. the full-frame and crop hand detectors).
+"""
+
+from __future__ import annotations
+
+import os
+
+import mediapipe as mp
+
+BaseOptions = mp.tasks.BaseOptions
+VisionRunningMode = mp.tasks.vision.RunningMode
+
+RUNNING_MODES = {
+    "video": VisionRunningMode.VIDEO,
+    "image": VisionRunningMode.IMAGE,
+    "live_stream": VisionRunningMode.LIVE_STREAM,
+}
+
+MODELS_DIR = os.path.dirname(os.path.dirname(__file__))
+_URL_BASE = "https://storage.googleapis.com/mediapipe-models"
+
+HAND_MODELS = {
+    "full": (
+        "hand_landmarker.task",
+        f"{_URL_BASE}/hand_landmarker/hand_landmarker/float16/1/hand_landmarker.task",
+    ),
+}
+
+POSE_MODELS = {
+    variant: (
+        f"pose_landmarker_{variant}.task",
+        f"{_URL_BASE}/pose_landmarker/pose_landmarker_{variant}/float16/1/"
+        f"pose_landmarker_{variant}.task",
+    )
+    for variant in ("lite", "full", "heavy")
+}
+
+FACE_MODELS = {
+    "short_range": (
+        "blaze_face_short_range.tflite",
+        f"{_URL_BASE}/face_detector/blaze_face_short_range/float16/1/"
+        "blaze_face_short_range.tflite",
+    ),
+}
+
+_DELEGATES = {
+    "cpu": BaseOptions.Delegate.CPU,
+    "gpu": BaseOptions.Delegate.GPU,
+}
+
+_buffers: dict[str, bytes] = {}
+
+
+def model_path(models: dict, variant: str) -> str:
+    """Return the path of a model variant, or raise if it is not downloaded."""
+    if variant not in models:
+        raise ValueError(
+            f"Unknown model variant '{variant}', expected one of {sorted(models)}"
+        )
+    filename, url = models[variant]
+    path = os.path.join(MODELS_DIR, filename)
+    if not os.path.exists(path):
+        raise FileNotFoundError(
+            f"Model not found at {path}. Download it with:\n  wget -q {url}"
+        )
+    return path
+
+
+def load_buffer(path: str) -> bytes:
+    """Read a model file once and return the shared bytes."""
+    if path not in _buffers:
+        with open(path, "rb") as f:
+            _buffers[path] = f.read()
+    return _buffers[path]
+
+
+def base_options(path: str, use_buffer: bool = False, delegate: str = "cpu"):
+    if delegate not in _DELEGATES:
+        raise ValueError(
+            f"Unknown delegate '{delegate}', expected one of {sorted(_DELEGATES)}"
+        )
+    if use_buffer:
+        return BaseOptions(
+            model_asset_buffer=load_buffer(path), delegate=_DELEGATES[delegate]
+        )
+    return BaseOptions(model_asset_path=path, delegate=_DELEGATES[delegate])
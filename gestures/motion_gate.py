@@ -0,0 +1,65 @@
+"""MotionGate — skip the models while nothing in front of the camera moves.
+
+Each frame is shrunk to a tiny greyscale thumbnail and compared with the
+previous one.  Inference runs when enough pixels changed, while hands
+were seen on the last inferred frame, when the caller forces it (e.g. in
+command mode), and at least every ``recheck_frames`` frames so a person
+who walked in and stood still is still picked up.
+"""
+
+from __future__ import annotations
+
+import cv2
+import numpy as np
+
+
+class MotionGate:
+    def __init__(
+        self,
+        width: int = 64,
+        pixel_threshold: int = 12,
+        min_changed_fraction: float = 0.01,
+        recheck_frames: int = 30,
+    ) -> None:
+        self._width = width
+        self._pixel_threshold = pixel_threshold
+        self._min_changed_fraction = min_changed_fraction
+        self._recheck_frames = recheck_frames
+
+        self._previous: np.ndarray | None = None
+        self._frames_since_inference = 0
+        self._hands_seen = False
+        self.skipped_frames = 0
+
+    def _thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        h, w = frame.shape[:2]
+        size = (self._width, max(1, round(h * self._width / w)))
+        small = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+    def _moved(self, thumb: np.ndarray) -> bool:
+        previous, self._previous = self._previous, thumb
+        if previous is None:
+            return True
+        diff = cv2.absdiff(thumb, previous)
+        changed = np.count_nonzero(diff > self._pixel_threshold)
+        return changed >= self._min_changed_fraction * diff.size
+
+    def should_infer(self, frame: np.ndarray, force: bool = False) -> bool:
+        """Decide whether this BGR frame is worth running the models on."""
+        moved = self._moved(self._thumbnail(frame))
+        if (
+            force
+            or moved
+            or self._hands_seen
+            or self._frames_since_inference + 1 >= self._recheck_frames
+        ):
+            self._frames_since_inference = 0
+            return True
+        self._frames_since_inference += 1
+        self.skipped_frames += 1
+        return False
+
+    def note_hands(self, hands_present: bool) -> None:
+        """Report whether the last inferred frame contained any hands."""
+        self._hands_seen = hands_present
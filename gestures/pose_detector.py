@@ -1,53 +1,80 @@
-"""PoseDetector — wraps MediaPipe PoseLandmarker (VIDEO mode)."""
+"""PoseDetector — wraps MediaPipe PoseLandmarker.
+
+VIDEO mode by default; see HandDetector for the other running modes.
+"""
 
 from __future__ import annotations
 
-import math
-import os
+from typing import Callable
 
-import cv2
 import mediapipe as mp
 import numpy as np
 
-BaseOptions = mp.tasks.BaseOptions
+from gestures.frame import PreparedFrame
+from gestures.models import POSE_MODELS, RUNNING_MODES, base_options, model_path
+from gestures.pose_match import neck_y_for_hand
+
 PoseLandmarker = mp.tasks.vision.PoseLandmarker
 PoseLandmarkerOptions = mp.tasks.vision.PoseLandmarkerOptions
-VisionRunningMode = mp.tasks.vision.RunningMode
-
-NOSE = 0
-LEFT_SHOULDER = 11
-RIGHT_SHOULDER = 12
-LEFT_WRIST = 15
-RIGHT_WRIST = 16
-
-MODEL_PATH = os.path.join(
-    os.path.dirname(os.path.dirname(__file__)), "pose_landmarker_lite.task"
-)
 
 
 class PoseDetector:
-    def __init__(self, max_poses: int = 4, min_detection_confidence: float = 0.5):
-        if not os.path.exists(MODEL_PATH):
-            raise FileNotFoundError(
-                f"Pose model not found at {MODEL_PATH}. Download it with:\n"
-                "  wget -q https://storage.googleapis.com/mediapipe-models/"
-                "pose_landmarker/pose_landmarker_lite/float16/1/pose_landmarker_lite.task"
+    def __init__(
+        self,
+        max_poses: int = 4,
+        min_detection_confidence: float = 0.5,
+        running_mode: str = "video",
+        result_callback: Callable[[object, int], None] | None = None,
+        model_variant: str = "lite",
+        use_model_buffer: bool = False,
+        delegate: str = "cpu",
+    ):
+        if (running_mode == "live_stream") != (result_callback is not None):
+            raise ValueError(
+                "result_callback is required for, and only for, live_stream mode"
             )
+        path = model_path(POSE_MODELS, model_variant)
         options = PoseLandmarkerOptions(
-            base_options=BaseOptions(model_asset_path=MODEL_PATH),
-            running_mode=VisionRunningMode.VIDEO,
+            base_options=base_options(path, use_model_buffer, delegate),
+            running_mode=RUNNING_MODES[running_mode],
             num_poses=max_poses,
             min_pose_detection_confidence=min_detection_confidence,
+            result_callback=(
+                (lambda result, _image, ts_ms: result_callback(result, ts_ms))
+                if result_callback
+                else None
+            ),
         )
         self._landmarker = PoseLandmarker.create_from_options(options)
+        self._running_mode = running_mode
         self._frame_ts = 0
+        self._last_async_ts_ms = -1
 
-    def process(self, frame: np.ndarray):
-        """Process a BGR frame and return a PoseLandmarkerResult."""
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb)
+    def process(self, frame: np.ndarray | PreparedFrame):
+        """Process a BGR frame (or a PreparedFrame) and return a PoseLandmarkerResult."""
+        if not isinstance(frame, PreparedFrame):
+            frame = PreparedFrame(frame)
+        if self._running_mode == "image":
+            return self._landmarker.detect(frame.mp_image)
         self._frame_ts += 1
-        return self._landmarker.detect_for_video(mp_image, self._frame_ts)
+        return self._landmarker.detect_for_video(frame.mp_image, self._frame_ts)
+
+    def process_async(
+        self, frame: np.ndarray | PreparedFrame, timestamp_ms: int
+    ) -> int:
+        """Queue a frame for LIVE_STREAM inference and return the timestamp
+        used.  The result arrives via ``result_callback(result, timestamp_ms)``
+        on a MediaPipe thread.
+
+        MediaPipe drops queued frames on its own when inference falls behind.
+        """
+        if not isinstance(frame, PreparedFrame):
+            frame = PreparedFrame(frame)
+        # LIVE_STREAM requires strictly increasing timestamps.
+        timestamp_ms = max(timestamp_ms, self._last_async_ts_ms + 1)
+        self._last_async_ts_ms = timestamp_ms
+        self._landmarker.detect_async(frame.mp_image, timestamp_ms)
+        return timestamp_ms
 
     def neck_y_for_hand(
         self,
@@ -55,34 +82,13 @@ class PoseDetector:
         hand_wrist_y: float,
         pose_result,
         match_threshold: float,
+        age: int = 0,
+        max_age: int | None = None,
     ) -> float | None:
-        """
-        Return the neck y-coordinate of the person whose wrist is closest
-        to the given hand wrist, or None if no match within match_threshold.
-
-        Neck is approximated as the midpoint between the nose and the
-        shoulder midpoint.
-        """
-        if not pose_result or not pose_result.pose_landmarks:
-            return None
-
-        best_neck_y = None
-        best_dist = float("inf")
-
-        for person in pose_result.pose_landmarks:
-            for wrist_idx in (LEFT_WRIST, RIGHT_WRIST):
-                lm = person[wrist_idx]
-                dist = math.sqrt(
-                    (lm.x - hand_wrist_x) ** 2 + (lm.y - hand_wrist_y) ** 2
-                )
-                if dist < best_dist:
-                    best_dist = dist
-                    shoulder_mid_y = (
-                        person[LEFT_SHOULDER].y + person[RIGHT_SHOULDER].y
-                    ) / 2
-                    best_neck_y = (person[NOSE].y + shoulder_mid_y) / 2
-
-        return best_neck_y if best_dist <= match_threshold else None
+        """See ``gestures.pose_match.neck_y_for_hand``."""
+        return neck_y_for_hand(
+            hand_wrist_x, hand_wrist_y, pose_result, match_threshold, age, max_age
+        )
 
     def close(self) -> None:
         self._landmarker.close()
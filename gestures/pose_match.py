@@ -0,0 +1,56 @@
+"""Match a hand to the body it belongs to using pose landmarks.
+
+Kept free of MediaPipe so gating can run on recorded or synthetic
+landmarks.
+"""
+
+from __future__ import annotations
+
+import math
+
+NOSE = 0
+LEFT_SHOULDER = 11
+RIGHT_SHOULDER = 12
+LEFT_WRIST = 15
+RIGHT_WRIST = 16
+
+
+def neck_y_for_hand(
+    hand_wrist_x: float,
+    hand_wrist_y: float,
+    pose_result,
+    match_threshold: float,
+    age: int = 0,
+    max_age: int | None = None,
+) -> float | None:
+    """
+    Return the neck y-coordinate of the person whose wrist is closest
+    to the given hand wrist, or None if no match within match_threshold.
+
+    Neck is approximated as the midpoint between the nose and the
+    shoulder midpoint.
+
+    ``age`` is how many frames older the pose result is than the hand;
+    a result older than ``max_age`` frames matches nothing, since the
+    body has likely moved since.
+    """
+    if not pose_result or not pose_result.pose_landmarks:
+        return None
+    if max_age is not None and age > max_age:
+        return None
+
+    best_neck_y = None
+    best_dist = float("inf")
+
+    for person in pose_result.pose_landmarks:
+        for wrist_idx in (LEFT_WRIST, RIGHT_WRIST):
+            lm = person[wrist_idx]
+            dist = math.sqrt((lm.x - hand_wrist_x) ** 2 + (lm.y - hand_wrist_y) ** 2)
+            if dist < best_dist:
+                best_dist = dist
+                shoulder_mid_y = (
+                    person[LEFT_SHOULDER].y + person[RIGHT_SHOULDER].y
+                ) / 2
+                best_neck_y = (person[NOSE].y + shoulder_mid_y) / 2
+
+    return best_neck_y if best_dist <= match_threshold else None
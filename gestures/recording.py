@@ -0,0 +1,159 @@
+"""Landmark recordings — a session's landmarks, without the pixels.
+
+A recording is a compressed ``.npz`` of fixed-shape arrays, one row per
+frame, padded with NaN where a frame has fewer hands, people or faces
+than the busiest one:
+
+- ``timestamps``  ``(N,)``             seconds, as the controller saw them
+- ``hands``       ``(N, H, 21, 3)``    hand landmarks, as gating sees them
+- ``hand_counts`` ``(N,)``             hands present on each frame
+- ``handedness``  ``(N, H)``           "Left" / "Right" / ""
+- ``gate``        ``(N, G, 33, 3)``    pose landmarks, or ``(N, G, 4)`` face
+  boxes, from running the gate model on that frame
+- ``gate_counts`` ``(N,)``             people or faces found; -1 where the
+  gate model did not run (frames without hands)
+- ``gate_model``  ``()``               "pose", "face" or ""
+
+The gate model is recorded on every frame with hands, so a replay can
+apply any gate-model schedule.  Only numpy is needed to read or write
+one.
+"""
+
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Iterator, NamedTuple
+
+import numpy as np
+
+from gestures.landmarks import FaceResult, PoseResult, from_array, to_array
+
+HAND_POINTS = 21
+POSE_POINTS = 33
+
+
+class RecordedFrame(NamedTuple):
+    timestamp: float
+    hands: list
+    handedness: list[str]
+    gate_result: object  # PoseResult, FaceResult or None if not run
+
+
+def _gate_array(gate_model: str, result) -> np.ndarray:
+    if gate_model == "face":
+        return np.array(result.faces, dtype=np.float32).reshape(-1, 4)
+    return to_array(result.pose_landmarks or []).reshape(-1, POSE_POINTS, 3)
+
+
+def _pad(rows: list[np.ndarray], item_shape: tuple) -> np.ndarray:
+    """Stack ``(n_i, *item_shape)`` rows into ``(N, max n_i, *item_shape)``."""
+    width = max((len(row) for row in rows), default=0)
+    out = np.full((len(rows), width, *item_shape), np.nan, dtype=np.float32)
+    for i, row in enumerate(rows):
+        out[i, : len(row)] = row
+    return out
+
+
+class LandmarkRecorder:
+    def __init__(self, gate_model: str | None = None) -> None:
+        self._gate_model = gate_model or ""
+        self._timestamps: list[float] = []
+        self._hands: list[np.ndarray] = []
+        self._handedness: list[list[str]] = []
+        self._gate: list[np.ndarray] = []
+        self._gate_counts: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def add(
+        self, timestamp: float, hands: list, handedness: list[str], gate_result=None
+    ) -> None:
+        """Append one frame.  ``gate_result`` is None where the gate model
+        did not run."""
+        self._timestamps.append(timestamp)
+        self._hands.append(to_array(hands).reshape(-1, HAND_POINTS, 3))
+        self._handedness.append(list(handedness))
+        if gate_result is None or not self._gate_model:
+            self._gate.append(np.zeros((0, *self._gate_shape()), np.float32))
+            self._gate_counts.append(-1)
+        else:
+            arr = _gate_array(self._gate_model, gate_result)
+            self._gate.append(arr)
+            self._gate_counts.append(len(arr))
+
+    def _gate_shape(self) -> tuple:
+        return (4,) if self._gate_model == "face" else (POSE_POINTS, 3)
+
+    def save(self, path: str) -> None:
+        hands = _pad(self._hands, (HAND_POINTS, 3))
+        handedness = np.full(hands.shape[:2], "", dtype="U5")
+        for i, labels in enumerate(self._handedness):
+            handedness[i, : len(labels)] = labels
+        np.savez_compressed(
+            path,
+            timestamps=np.array(self._timestamps, dtype=np.float64),
+            hands=hands,
+            hand_counts=np.array([len(h) for h in self._hands], dtype=np.int16),
+            handedness=handedness,
+            gate=_pad(self._gate, self._gate_shape()),
+            gate_counts=np.array(self._gate_counts, dtype=np.int16),
+            gate_model=np.array(self._gate_model),
+        )
+
+
+class LandmarkRecording:
+    """A loaded recording; iterating yields RecordedFrames."""
+
+    def __init__(self, arrays) -> None:
+        self.timestamps = arrays["timestamps"]
+        self.hands = arrays["hands"]
+        self.hand_counts = arrays["hand_counts"]
+        self.handedness = arrays["handedness"]
+        self.gate = arrays["gate"]
+        self.gate_counts = arrays["gate_counts"]
+        self.gate_model = str(arrays["gate_model"]) or None
+
+    @classmethod
+    def load(cls, path: str) -> "LandmarkRecording":
+        with np.load(path) as arrays:
+            return cls({name: arrays[name] for name in arrays.files})
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def duration(self) -> float:
+        """Seconds from the first frame to the last."""
+        if len(self) < 2:
+            return 0.0
+        return float(self.timestamps[-1] - self.timestamps[0])
+
+    @cached_property
+    def hand_landmarks(self) -> list[list]:
+        """Each frame's hands as Landmark lists, converted once."""
+        return [
+            from_array(self.hands[i, :n]) for i, n in enumerate(self.hand_counts)
+        ]
+
+    def frame(self, i: int) -> RecordedFrame:
+        n = int(self.hand_counts[i])
+        return RecordedFrame(
+            float(self.timestamps[i]),
+            self.hand_landmarks[i],
+            self.handedness[i, :n].tolist(),
+            self.gate_result(i),
+        )
+
+    def gate_result(self, i: int):
+        """Frame ``i``'s gate-model result, or None where it did not run."""
+        count = int(self.gate_counts[i])
+        if count < 0:
+            return None
+        if self.gate_model == "face":
+            return FaceResult([tuple(box) for box in self.gate[i, :count].tolist()])
+        return PoseResult(from_array(self.gate[i, :count]))
+
+    def __iter__(self) -> Iterator[RecordedFrame]:
+        for i in range(len(self)):
+            yield self.frame(i)
@@ -0,0 +1,139 @@
+"""RoiHandTracker — run hand inference on crops around tracked hands.
+
+Once hands are found, the next frames only look at a padded square around
+each one instead of the whole frame.  Crop landmarks are mapped back to
+full-frame normalized coordinates, so ``recognize`` and the neck gating
+see exactly what a full-frame detection would give them.  A full-frame
+pass runs every ``full_frame_interval`` frames, whenever nothing is
+tracked, and whenever a crop loses its hand.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from gestures.frame import PreparedFrame
+from gestures.landmarks import HandResult, Landmark
+
+# Two detections whose wrists are closer than this (normalized) are the
+# same hand seen from overlapping crops.
+_DUPLICATE_WRIST_DISTANCE = 0.05
+
+
+def crop_box(
+    landmarks: list, width: int, height: int, padding: float, min_size: int
+) -> tuple[int, int, int, int]:
+    """Return a padded square ``(x0, y0, x1, y1)`` pixel box around a hand."""
+    xs = [lm.x * width for lm in landmarks]
+    ys = [lm.y * height for lm in landmarks]
+    cx = (min(xs) + max(xs)) / 2
+    cy = (min(ys) + max(ys)) / 2
+    side = max(max(xs) - min(xs), max(ys) - min(ys)) * (1 + 2 * padding)
+    side = min(max(side, min_size), width, height)
+
+    x0 = int(round(min(max(cx - side / 2, 0), width - side)))
+    y0 = int(round(min(max(cy - side / 2, 0), height - side)))
+    return x0, y0, x0 + int(side), y0 + int(side)
+
+
+def to_full_frame(
+    landmarks: list, box: tuple[int, int, int, int], width: int, height: int
+) -> list[Landmark]:
+    """Map crop-normalized landmarks back to full-frame normalized space."""
+    x0, y0, x1, y1 = box
+    cw, ch = x1 - x0, y1 - y0
+    return [
+        Landmark(
+            (x0 + lm.x * cw) / width,
+            (y0 + lm.y * ch) / height,
+            lm.z * cw / width,
+        )
+        for lm in landmarks
+    ]
+
+
+class RoiHandTracker:
+    """Drop-in for HandDetector.process that crops around tracked hands.
+
+    ``full_detector`` runs on whole frames (VIDEO mode); ``crop_detector``
+    should be a single-hand detector in "image" mode, since consecutive
+    crops may show different hands.
+    """
+
+    def __init__(
+        self,
+        full_detector,
+        crop_detector,
+        max_hands: int,
+        full_frame_interval: int = 15,
+        padding: float = 0.35,
+        min_crop_size: int = 96,
+    ) -> None:
+        self._full = full_detector
+        self._crop = crop_detector
+        self._max_hands = max_hands
+        self._full_frame_interval = full_frame_interval
+        self._padding = padding
+        self._min_crop_size = min_crop_size
+
+        self._tracks: list[list] = []
+        self._frames_since_full = 0
+        self.full_frame_passes = 0
+        self.crop_passes = 0
+
+    def process(self, frame: np.ndarray | PreparedFrame) -> HandResult:
+        if not isinstance(frame, PreparedFrame):
+            frame = PreparedFrame(frame)
+
+        if self._tracks and self._frames_since_full < self._full_frame_interval:
+            result = self._process_crops(frame)
+            if result is not None:
+                self._frames_since_full += 1
+                self._tracks = result.hand_landmarks
+                return result
+
+        result = self._process_full(frame)
+        self._frames_since_full = 0
+        self._tracks = result.hand_landmarks
+        return result
+
+    def _process_full(self, frame: PreparedFrame) -> HandResult:
+        self.full_frame_passes += 1
+        result = self._full.process(frame)
+        return HandResult(result.hand_landmarks or [], result.handedness or [])
+
+    def _process_crops(self, frame: PreparedFrame) -> HandResult | None:
+        """Detect inside each track's crop, or None if any track was lost."""
+        height, width = frame.bgr.shape[:2]
+        hands, handedness = [], []
+
+        for track in self._tracks[: self._max_hands]:
+            box = crop_box(track, width, height, self._padding, self._min_crop_size)
+            x0, y0, x1, y1 = box
+            self.crop_passes += 1
+            result = self._crop.process(PreparedFrame(frame.bgr[y0:y1, x0:x1]))
+            if not result.hand_landmarks:
+                return None
+
+            lm = to_full_frame(result.hand_landmarks[0], box, width, height)
+            if any(_same_hand(lm, other) for other in hands):
+                continue
+            hands.append(lm)
+            handedness.append(result.handedness[0] if result.handedness else [])
+
+        return HandResult(hands, handedness)
+
+    def set_max_hands(self, max_hands: int) -> None:
+        self._max_hands = max_hands
+        self._full.set_max_hands(max_hands)
+
+    def close(self) -> None:
+        self._full.close()
+        self._crop.close()
+
+
+def _same_hand(a: list, b: list) -> bool:
+    return (
+        abs(a[0].x - b[0].x) < _DUPLICATE_WRIST_DISTANCE
+        and abs(a[0].y - b[0].y) < _DUPLICATE_WRIST_DISTANCE
+    )
@@ -0,0 +1,191 @@
+"""Synthetic landmarks — hands, bodies and gesture sequences without a camera.
+
+Hands are built from a fixed skeleton in hand units (wrist at the
+origin, middle fingertip one unit above it), posed per gesture, then
+rotated, scaled and placed in normalized frame coordinates with optional
+Gaussian jitter, so ``recognize`` classifies them as asked:
+
+    hand("closed_fist")                        # a raised fist
+    hand("fingers_extended:index+middle")      # any finger combination
+    hand("closed_fist", rotation=math.pi / 2)  # sideways: "no_hand"
+
+``person`` builds a 33-point pose whose right wrist sits on a given
+hand, and ``stream`` turns a script of ``(gesture, seconds)`` steps into
+timestamped frames of hands and poses, ready for gating and the
+controller.  Only the standard library is needed.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from typing import Iterator, NamedTuple
+
+from gestures.landmarks import Landmark, PoseResult
+from gestures.pose_match import (
+    LEFT_SHOULDER,
+    LEFT_WRIST,
+    NOSE,
+    RIGHT_SHOULDER,
+    RIGHT_WRIST,
+)
+
+POSE_POINTS = 33
+FINGERS = ("thumb", "index", "middle", "ring", "pinky")
+
+# (x, y) per landmark, y pointing down as in MediaPipe.  Fingers are
+# listed MCP, PIP, DIP, TIP; the thumb CMC, MCP, IP, TIP.
+_THUMB = {
+    True: [(-0.15, -0.15), (-0.3, -0.25), (-0.42, -0.35), (-0.55, -0.45)],
+    # Curled back across the palm, so its x steps change direction.
+    False: [(-0.15, -0.15), (-0.25, -0.25), (-0.2, -0.35), (-0.1, -0.4)],
+}
+_FINGER_X = {"index": -0.15, "middle": -0.05, "ring": 0.05, "pinky": 0.15}
+_FINGER = {
+    True: [(0.0, -0.5), (0.0, -0.7), (0.0, -0.85), (0.0, -1.0)],
+    # Folded: the tip ends below the PIP joint.
+    False: [(0.0, -0.5), (0.0, -0.7), (0.02, -0.6), (0.02, -0.62)],
+}
+
+DEFAULT_SCRIPT = (
+    ("no_hand", 1.0),
+    ("closed_fist", 1.5),
+    ("fingers_extended:index", 1.5),
+    ("no_hand", 1.0),
+)
+
+
+def extended_fingers(gesture: str) -> set[str]:
+    """Which fingers ``gesture`` extends: none for a fist, all five for
+    an open palm."""
+    if gesture == "closed_fist":
+        return set()
+    prefix = "fingers_extended:"
+    if not gesture.startswith(prefix):
+        raise ValueError(f"Cannot synthesize gesture '{gesture}'")
+    names = set(gesture[len(prefix) :].split("+"))
+    unknown = names - set(FINGERS)
+    if unknown:
+        raise ValueError(f"Unknown finger(s) {sorted(unknown)} in '{gesture}'")
+    return names
+
+
+def _skeleton(extended: set[str]) -> list[tuple[float, float]]:
+    points = [(0.0, 0.0), *_THUMB["thumb" in extended]]
+    for finger, offset in _FINGER_X.items():
+        points += [(x + offset, y) for x, y in _FINGER[finger in extended]]
+    return points
+
+
+def hand(
+    gesture: str = "closed_fist",
+    wrist: tuple[float, float] = (0.5, 0.4),
+    size: float = 0.2,
+    rotation: float = 0.0,
+    mirror: bool = False,
+    noise: float = 0.0,
+    rng: random.Random | None = None,
+) -> list[Landmark]:
+    """21 landmarks showing ``gesture`` ("closed_fist" or
+    "fingers_extended:<fingers>").
+
+    ``size`` is the wrist-to-fingertip length in frame units, ``rotation``
+    turns the hand about its wrist (radians, clockwise on screen),
+    ``mirror`` swaps which side the thumb is on and ``noise`` is the
+    standard deviation of jitter added to every coordinate.
+    """
+    rng = rng or random
+    cos, sin = math.cos(rotation), math.sin(rotation)
+    wx, wy = wrist
+    out = []
+    for x, y in _skeleton(extended_fingers(gesture)):
+        if mirror:
+            x = -x
+        rx = x * cos - y * sin
+        ry = x * sin + y * cos
+        out.append(
+            Landmark(
+                wx + rx * size + (rng.gauss(0.0, noise) if noise else 0.0),
+                wy + ry * size + (rng.gauss(0.0, noise) if noise else 0.0),
+                rng.gauss(0.0, noise) if noise else 0.0,
+            )
+        )
+    return out
+
+
+def person(
+    wrist: tuple[float, float],
+    shoulder_y: float = 0.55,
+    noise: float = 0.0,
+    rng: random.Random | None = None,
+) -> list[Landmark]:
+    """33 pose landmarks of someone whose right wrist is at ``wrist``.
+
+    The neck (halfway between the nose and the shoulder midpoint) is
+    0.075 above ``shoulder_y``, so a hand is raised when its wrist is
+    higher than that.
+    """
+    rng = rng or random
+    cx = wrist[0] + 0.15
+    body = [(cx, shoulder_y + 0.3)] * POSE_POINTS  # hips and legs, roughly
+    body[NOSE] = (cx, shoulder_y - 0.15)
+    body[LEFT_SHOULDER] = (cx + 0.1, shoulder_y)
+    body[RIGHT_SHOULDER] = (cx - 0.1, shoulder_y)
+    body[LEFT_WRIST] = (cx + 0.15, shoulder_y + 0.35)
+    body[RIGHT_WRIST] = wrist
+    return [
+        Landmark(
+            x + (rng.gauss(0.0, noise) if noise else 0.0),
+            y + (rng.gauss(0.0, noise) if noise else 0.0),
+        )
+        for x, y in body
+    ]
+
+
+def _random_gesture(rng: random.Random) -> str:
+    chosen = set(rng.sample(FINGERS, rng.randint(1, len(FINGERS))))
+    # In the order ``recognize`` names them.
+    return "fingers_extended:" + "+".join(f for f in FINGERS if f in chosen)
+
+
+class SyntheticFrame(NamedTuple):
+    timestamp: float
+    hands: list  # landmark lists; the scripted hand first
+    gestures: list[str]  # what each hand shows
+    pose_result: PoseResult
+
+
+def stream(
+    script=DEFAULT_SCRIPT,
+    fps: float = 30.0,
+    hands: int = 1,
+    noise: float = 0.002,
+    dropout: float = 0.0,
+    seed: int = 0,
+) -> Iterator[SyntheticFrame]:
+    """Frames acting out ``script``, a sequence of ``(gesture, seconds)``.
+
+    The first hand performs the script, raised above its owner's neck;
+    "no_hand" steps leave it out of the frame.  ``hands - 1`` more people
+    stand alongside with a lowered hand showing a random gesture, which
+    a pose gate should ignore.  Each hand is missing from a frame with
+    probability ``dropout``, as when the detector loses it.  Seeded, so
+    every run yields the same frames.
+    """
+    rng = random.Random(seed)
+    gestures = ["closed_fist"] + [_random_gesture(rng) for _ in range(hands - 1)]
+    size = 0.6 / (hands + 2)
+    slots = [((i + 0.5) / hands, 0.35 if i == 0 else 0.75) for i in range(hands)]
+    frame = 0
+    for gesture, seconds in script:
+        for _ in range(round(seconds * fps)):
+            present, shown, people = [], [], []
+            for i, wrist in enumerate(slots):
+                g = gesture if i == 0 else gestures[i]
+                people.append(person(wrist, noise=noise, rng=rng))
+                if (i == 0 and g == "no_hand") or rng.random() < dropout:
+                    continue
+                present.append(hand(g, wrist, size, noise=noise, rng=rng))
+                shown.append(g)
+            yield SyntheticFrame(frame / fps, present, shown, PoseResult(people))
+            frame += 1
@@ -7,7 +7,14 @@ import numpy as np
 
 @runtime_checkable
 class Hook(Protocol):
-    """Interface for lifecycle hooks."""
+    """Interface for lifecycle hooks.
+
+    Hooks that need the frame in RGB may also define
+    ``on_rgb_frame(rgb: np.ndarray, in_command_mode: bool)``; it receives
+    the conversion already made for the detectors, before any overlay is
+    drawn, so it is unmirrored when ``mirror_landmarks`` is on.  Treat the
+    array as read-only.
+    """
 
     def on_enter_command_mode(self) -> None:
         """Called once when transitioning into COMMAND_MODE."""
@@ -18,5 +25,13 @@ class Hook(Protocol):
         ...
 
     def on_frame(self, frame: np.ndarray, in_command_mode: bool) -> None:
-        """Called every frame — use for visual overlays."""
+        """Called every frame — use for visual overlays.
+
+        With ``display_threaded`` this runs on the display thread, and only
+        for frames that are actually displayed.  With
+        ``preview_server_enabled`` it also runs on the preview's encoder
+        thread for every streamed frame — instead of inline when the GUI is
+        off, in addition to the window otherwise — so calls may overlap and
+        must be thread-safe.
+        """
         ...
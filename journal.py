@@ -0,0 +1,235 @@
+"""Binary event journal — months of state and command history, cheaply.
+
+Every state transition, wake start, gesture hold, command dispatch,
+command result and timeout becomes one fixed-size 64-byte record written
+into a memory-mapped segment file, so appending is a ``struct.pack_into``
+with no syscall and no text formatting.  Full segments rotate to the
+next ``journal-NNNNNN.bin`` and the oldest beyond ``max_segments`` are
+deleted, which bounds disk use on SD-card devices.
+
+Records carry ``time.monotonic_ns()``.  Each segment's header stores a
+wall-clock/monotonic anchor taken when it was opened, which the reader
+uses to turn record times back into dates; a new process always starts
+a new segment, so an anchor never spans a reboot.
+
+    import journal
+    j = journal.Journal("journal").start()   # subscribes to the bus
+    for record in journal.read("journal", kinds={"result"}):
+        print(journal.format_record(record))
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+from datetime import datetime
+from typing import Iterator, NamedTuple
+
+import bus
+from state_machine import State
+
+MAGIC = b"GCJ1"
+RECORD_SIZE = 64
+# mono_ns, kind, old state, new state / error flag, gesture name
+_RECORD = struct.Struct("<qBBB1x52s")
+# magic, record size, wall-clock ns and monotonic ns at open
+_HEADER = struct.Struct("<4sHxx qq")
+_SEGMENT = re.compile(r"journal-(\d{6})\.bin$")
+
+KINDS = ("state", "wake", "hold", "dispatch", "result", "timeout")
+_KIND_CODES = {name: code for code, name in enumerate(KINDS, start=1)}
+
+
+class JournalRecord(NamedTuple):
+    wall_time: float  # seconds since the epoch
+    mono_ns: int
+    kind: str
+    gesture: str
+    old: State | None
+    new: State | None
+    failed: bool
+
+
+class Journal:
+    def __init__(
+        self, directory: str, segment_bytes: int = 2**20, max_segments: int = 64
+    ) -> None:
+        if segment_bytes < 2 * RECORD_SIZE:
+            raise ValueError(f"segment_bytes must be at least {2 * RECORD_SIZE}")
+        self._directory = directory
+        self._capacity = segment_bytes // RECORD_SIZE  # slot 0 is the header
+        self._max_segments = max_segments
+        self._lock = threading.Lock()
+        self._file = None
+        self._mm: mmap.mmap | None = None
+        self._slot = 0
+        self._segment = 0
+        self.records_written = 0
+        self._listeners = {
+            "state_changed": self._on_state,
+            "wake_started": self._on_wake,
+            "gesture_hold_started": self._on_hold,
+            "command_dispatched": self._on_dispatch,
+            "command_executed": self._on_result,
+            "command_mode_timed_out": self._on_timeout,
+        }
+
+    def start(self) -> "Journal":
+        os.makedirs(self._directory, exist_ok=True)
+        existing = _segments(self._directory)
+        self._segment = existing[-1][0] + 1 if existing else 0
+        self._open_segment()
+        for event, callback in self._listeners.items():
+            bus.on(event, callback)
+        return self
+
+    # -- bus listeners --
+
+    def _on_state(self, old: State, new: State) -> None:
+        self.append("state", old=old, new=new)
+
+    def _on_wake(self, now: float, gesture: str) -> None:
+        self.append("wake", gesture)
+
+    def _on_hold(self, now: float, gesture: str) -> None:
+        self.append("hold", gesture)
+
+    def _on_dispatch(self, now: float, gesture: str) -> None:
+        self.append("dispatch", gesture)
+
+    def _on_result(self, now: float, gesture: str, error: str | None) -> None:
+        self.append("result", gesture, failed=error is not None)
+
+    def _on_timeout(self, now: float) -> None:
+        self.append("timeout")
+
+    # -- writing --
+
+    def append(
+        self,
+        kind: str,
+        gesture: str | None = None,
+        old: State | None = None,
+        new: State | None = None,
+        failed: bool = False,
+    ) -> None:
+        """Write one record stamped with ``time.monotonic_ns()``."""
+        second = int(failed) if new is None else new.value
+        packed_gesture = (gesture or "").encode("ascii", "replace")
+        with self._lock:
+            if self._mm is None:
+                return  # closed
+            if self._slot >= self._capacity:
+                self._rotate()
+            _RECORD.pack_into(
+                self._mm,
+                self._slot * RECORD_SIZE,
+                time.monotonic_ns(),
+                _KIND_CODES[kind],
+                old.value if old is not None else 0,
+                second,
+                packed_gesture,  # truncated to 52 bytes by struct
+            )
+            self._slot += 1
+            self.records_written += 1
+
+    def _open_segment(self) -> None:
+        path = os.path.join(self._directory, f"journal-{self._segment:06d}.bin")
+        self._file = open(path, "w+b")
+        self._file.truncate(self._capacity * RECORD_SIZE)
+        self._mm = mmap.mmap(self._file.fileno(), self._capacity * RECORD_SIZE)
+        _HEADER.pack_into(
+            self._mm, 0, MAGIC, RECORD_SIZE, time.time_ns(), time.monotonic_ns()
+        )
+        self._slot = 1
+        for _, old_path in _segments(self._directory)[: -self._max_segments]:
+            os.remove(old_path)
+
+    def _close_segment(self) -> None:
+        self._mm.flush()
+        self._mm.close()
+        self._file.close()
+        self._mm = self._file = None
+
+    def _rotate(self) -> None:
+        self._close_segment()
+        self._segment += 1
+        self._open_segment()
+
+    def close(self) -> None:
+        for event, callback in self._listeners.items():
+            bus.off(event, callback)
+        with self._lock:
+            if self._mm is not None:
+                self._close_segment()
+
+
+def _segments(directory: str) -> list[tuple[int, str]]:
+    """``(number, path)`` of every segment in ``directory``, oldest first.
+
+    A directory that does not exist yet holds no segments.
+    """
+    if not os.path.isdir(directory):
+        return []
+    found = []
+    for name in os.listdir(directory):
+        match = _SEGMENT.match(name)
+        if match:
+            found.append((int(match.group(1)), os.path.join(directory, name)))
+    return sorted(found)
+
+
+def read(
+    directory: str,
+    kinds: set[str] | None = None,
+    gesture: str | None = None,
+    since: float | None = None,
+) -> Iterator[JournalRecord]:
+    """Yield records oldest first, optionally filtered by kind, gesture
+    name and wall-clock start time."""
+    for _, path in _segments(directory):
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < RECORD_SIZE:
+            continue
+        magic, record_size, wall_ns, mono_ns = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or record_size != RECORD_SIZE:
+            continue
+        for offset in range(RECORD_SIZE, len(data) - RECORD_SIZE + 1, RECORD_SIZE):
+            t_ns, code, old, second, name = _RECORD.unpack_from(data, offset)
+            if code == 0:
+                break  # the rest of the segment was never written
+            kind = KINDS[code - 1]
+            record = JournalRecord(
+                wall_time=(wall_ns + t_ns - mono_ns) / 1e9,
+                mono_ns=t_ns,
+                kind=kind,
+                gesture=name.rstrip(b"\0").decode("ascii"),
+                old=State(old) if old else None,
+                new=State(second) if kind == "state" else None,
+                failed=kind == "result" and bool(second),
+            )
+            if kinds and kind not in kinds:
+                continue
+            if gesture and record.gesture != gesture:
+                continue
+            if since is not None and record.wall_time < since:
+                continue
+            yield record
+
+
+def format_record(record: JournalRecord) -> str:
+    stamp = datetime.fromtimestamp(record.wall_time).isoformat(
+        sep=" ", timespec="milliseconds"
+    )
+    if record.kind == "state":
+        detail = f"{record.old.name} -> {record.new.name}"
+    elif record.kind == "result":
+        detail = f"{record.gesture} {'failed' if record.failed else 'ok'}"
+    else:
+        detail = record.gesture
+    return f"{stamp}  {record.kind:<8} {detail}".rstrip()
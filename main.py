@@ -2,14 +2,22 @@
 
 Usage:
     python main.py start             Start the gesture listener
+    python main.py start --source demo.mp4 [--paced]
+                                     Run on a recording instead of the camera
+    python main.py record out.npz [--source demo.mp4]
+                                     Save a session's landmarks for replay
+    python main.py replay out.npz    Replay landmarks through the controller
+    python main.py journal [--kind K] [--gesture G] [--since T] [--tail N]
+                                     Dump or filter the event journal
     python main.py configure hue     Discover Hue bridge and list lights
     python main.py configure tuya    Discover Tuya devices on local network
+    python main.py benchmark models  Measure latency of each model variant
     python main.py help              Show this help message
 """
 
 import sys
 
-from modes import help as help_mode, start, configure
+from modes import help as help_mode
 
 
 def main() -> None:
@@ -21,15 +29,37 @@ def main() -> None:
 
     mode = args[0]
 
+    # Modes are imported on demand so each one only loads what it needs;
+    # replay in particular must run without MediaPipe or OpenCV.
     if mode == "start":
-        start.run()
+        from modes import start
+
+        start.run(args[1:])
+    elif mode == "record":
+        from modes import record
+
+        record.run(args[1:])
+    elif mode == "replay":
+        from modes import replay
+
+        replay.run(args[1:])
+    elif mode == "journal":
+        from modes import journal as journal_mode
+
+        journal_mode.run(args[1:])
     elif mode == "configure":
         if len(args) < 2:
             print("Error: 'configure' requires an integration name")
             print("Usage: python main.py configure <name>")
             print("Supported integrations: hue, tuya")
             sys.exit(1)
+        from modes import configure
+
         configure.run(args[1])
+    elif mode == "benchmark":
+        from modes import benchmark
+
+        benchmark.run(args[1:])
     else:
         print(f"Error: unknown mode '{mode}'")
         help_mode.run()
@@ -0,0 +1,155 @@
+"""Benchmark mode — measure performance without a camera."""
+
+import argparse
+import sys
+
+BENCHMARKS = ("models", "pipeline", "micro", "devices")
+
+
+def run(args: list[str]) -> None:
+    if not args or args[0] not in BENCHMARKS:
+        print("Error: 'benchmark' requires one of: " + ", ".join(BENCHMARKS))
+        print("Usage: python main.py benchmark <name> [options]")
+        sys.exit(1)
+
+    # Benchmarks are imported lazily so each one only needs its own
+    # dependencies installed.
+    name, rest = args[0], args[1:]
+    if name == "models":
+        from benchmarks import models
+
+        video = rest[0] if rest else models.DEFAULT_VIDEO
+        frames = int(rest[1]) if len(rest) > 1 else models.DEFAULT_FRAMES
+        models.run(video, frames)
+    elif name == "pipeline":
+        _run_pipeline(rest)
+    elif name == "micro":
+        _run_micro(rest)
+    elif name == "devices":
+        _run_devices(rest)
+
+
+def _run_pipeline(args: list[str]) -> None:
+    from benchmarks import pipeline
+
+    parser = argparse.ArgumentParser(prog="main.py benchmark pipeline")
+    parser.add_argument("video", nargs="?", default=pipeline.DEFAULT_VIDEO)
+    parser.add_argument(
+        "--frames", type=int, help="stop after this many frames (default: all)"
+    )
+    parser.add_argument(
+        "--variant",
+        nargs="+",
+        action="append",
+        metavar=("NAME", "KEY=VALUE"),
+        help="a named run with config.yaml keys overridden; repeat to compare",
+    )
+    parser.add_argument(
+        "--gestures",
+        default=pipeline.DEFAULT_GESTURES,
+        metavar="PATH",
+        help="where hooks are configured (default gestures.yaml; none if missing)",
+    )
+    parser.add_argument("--output", metavar="PATH", help="write results as JSON")
+    parser.add_argument(
+        "--baseline", metavar="PATH", help="compare against an earlier --output"
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        metavar="PCT",
+        help="exit 1 if fps or a stage's latency is this much worse than --baseline",
+    )
+    options = parser.parse_args(args)
+    if options.max_regression is not None and not options.baseline:
+        parser.error("--max-regression requires --baseline")
+
+    try:
+        variants = [
+            (name, pipeline.parse_overrides(pairs))
+            for name, *pairs in options.variant or [["current"]]
+        ]
+    except ValueError as e:
+        parser.error(str(e))
+
+    # Read first: --output may overwrite the baseline file.
+    baseline = pipeline.load(options.baseline) if options.baseline else None
+    results = pipeline.run(
+        options.video, variants, options.frames, options.gestures
+    )
+    if options.output:
+        pipeline.save(results, options.output)
+        print(f"[benchmark] Wrote {options.output}")
+    if baseline is not None:
+        rows = pipeline.compare(results, baseline)
+        pipeline.print_comparison(rows)
+        if options.max_regression is not None:
+            worst = [r for r in rows if r["regression_pct"] > options.max_regression]
+            if worst:
+                print(
+                    f"[benchmark] {len(worst)} metric(s) regressed by more than "
+                    f"{options.max_regression:.0f}%"
+                )
+                sys.exit(1)
+
+
+def _run_micro(args: list[str]) -> None:
+    from benchmarks import micro
+
+    parser = argparse.ArgumentParser(prog="main.py benchmark micro")
+    parser.add_argument(
+        "--ops", type=int, default=micro.DEFAULT_OPS, help="operations per run"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=micro.DEFAULT_REPEAT, help="runs; best counts"
+    )
+    parser.add_argument("--hands", type=int, default=1, help="people in view")
+    parser.add_argument(
+        "--noise", type=float, default=0.002, help="landmark jitter (std. dev.)"
+    )
+    parser.add_argument(
+        "--dropout", type=float, default=0.0, help="chance a hand goes undetected"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", metavar="PATH", help="write results as JSON")
+    options = parser.parse_args(args)
+
+    rows = micro.run(
+        options.ops,
+        options.repeat,
+        options.hands,
+        options.noise,
+        options.dropout,
+        options.seed,
+    )
+    if options.output:
+        micro.save(rows, options.output)
+        print(f"[benchmark] Wrote {options.output}")
+
+
+def _run_devices(args: list[str]) -> None:
+    from benchmarks import devices
+    from benchmarks.standins import FaultProfile
+
+    parser = argparse.ArgumentParser(prog="main.py benchmark devices")
+    parser.add_argument(
+        "--ops", type=int, default=devices.DEFAULT_OPS, help="runs per scenario"
+    )
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="added to every request"
+    )
+    parser.add_argument(
+        "--jitter-ms", type=float, default=0.0, help="+/- around --latency-ms"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="fraction of requests failing"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", metavar="PATH", help="write results as JSON")
+    options = parser.parse_args(args)
+
+    faults = FaultProfile(options.latency_ms, options.jitter_ms, options.error_rate)
+    rows = devices.run(options.ops, faults, options.seed)
+    if options.output:
+        devices.save(rows, options.output)
+        print(f"[benchmark] Wrote {options.output}")
@@ -5,12 +5,38 @@ Usage: python main.py <mode> [options]
 
 Modes:
   start             Start the gesture listener
+  start --source <video> [--paced]
+                    Run on a recording instead of the camera, as fast as
+                    possible or at its recorded rate
+  record <out.npz> [--source <video>]
+                    Save a session's hand and gate-model landmarks
+  replay <in.npz> [--repeat N]
+                    Run recorded landmarks through gating and the controller,
+                    without MediaPipe, OpenCV or real commands
+  journal [--kind K] [--gesture G] [--since T] [--tail N]
+                    Dump or filter the event journal (journal_enabled)
   configure <name>  Run first-time setup for an integration
+  benchmark <name>  Run a performance benchmark
   help              Show this help message
 
 Integrations:
   hue               Discover Philips Hue bridge and list lights
   tuya              Discover Tuya devices on local network
+
+Benchmarks:
+  models [video] [frames]
+                    Latency of each downloaded model variant (default demo.mp4)
+  pipeline [video] [--frames N] [--variant NAME KEY=VALUE...]
+           [--output run.json] [--baseline base.json [--max-regression PCT]]
+                    End-to-end fps and per-stage latency/CPU of the whole
+                    pipeline over a video, per engine or config variant
+  micro [--ops N] [--hands K] [--noise S] [--output micro.json]
+                    Ops/s of recognize, _pick_gesture, neck_y_for_hand and
+                    handle_frame on synthetic landmarks (no MediaPipe)
+  devices [--ops N] [--latency-ms MS] [--jitter-ms MS] [--error-rate R]
+          [--output devices.json]
+                    Latency, failures and HTTP requests per Hue/Tuya command
+                    against local bridge and cloud stand-ins
 """
 
 
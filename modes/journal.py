@@ -0,0 +1,46 @@
+"""Journal mode — dump or filter the binary event journal."""
+
+import argparse
+import os
+import sys
+from collections import deque
+from datetime import datetime
+
+import config
+import journal
+
+
+def run(args: list[str]) -> None:
+    parser = argparse.ArgumentParser(prog="main.py journal")
+    parser.add_argument(
+        "--dir", default=config.JOURNAL_DIR, help="journal directory (journal_dir)"
+    )
+    parser.add_argument(
+        "--kind",
+        action="append",
+        choices=journal.KINDS,
+        help="only records of this kind; repeat for several",
+    )
+    parser.add_argument("--gesture", help="only records for this gesture")
+    parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        help="only records from this local time on, e.g. 2026-10-01T08:00",
+    )
+    parser.add_argument("--tail", type=int, help="only the last N matching records")
+    options = parser.parse_args(args)
+    if not os.path.isdir(options.dir):
+        print(f"Error: no journal in '{options.dir}'")
+        print("Set journal_enabled: true in config.yaml to start recording one.")
+        sys.exit(1)
+
+    records = journal.read(
+        options.dir,
+        kinds=set(options.kind) if options.kind else None,
+        gesture=options.gesture,
+        since=options.since.timestamp() if options.since else None,
+    )
+    if options.tail:
+        records = deque(records, maxlen=options.tail)
+    for record in records:
+        print(journal.format_record(record))
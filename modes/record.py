@@ -0,0 +1,89 @@
+"""Record mode — save a session's landmarks for replay.
+
+Runs the camera (or a ``--source`` video) through the hand landmarker and
+the configured gate model and writes what they saw to a compact
+``.npz`` (see gestures.recording).  No commands run while recording.
+Stop with Ctrl+C or 'q' in the preview; a video stops at its end.
+"""
+
+import argparse
+import time
+
+import cv2
+
+import config
+from capture.sources import frame_time
+from engine.display import WINDOW_NAME
+from gestures import gating
+from gestures.detector import HandDetector, draw_hands
+from gestures.frame import PreparedFrame
+from gestures.landmarks import handedness_labels, mirror_gate_result, mirror_landmarks
+from gestures.recording import LandmarkRecorder
+from modes.start import hand_detector_kwargs, open_frame_source
+
+_MIRRORED_HANDEDNESS = {"Left": "Right", "Right": "Left"}
+
+
+def run(args: list[str]) -> None:
+    parser = argparse.ArgumentParser(prog="main.py record")
+    parser.add_argument("output", help="where to write the .npz recording")
+    parser.add_argument(
+        "--source", metavar="PATH", help="record a video file instead of the camera"
+    )
+    options = parser.parse_args(args)
+
+    opened = open_frame_source(options.source)
+    if opened is None:
+        return
+    cap, _ = opened
+
+    hand_gate = gating.build_from_config()
+    kind = hand_gate.model_kind
+    detector = HandDetector(**hand_detector_kwargs())
+    gate_model = gating.build_gate_model(kind, **gating.gate_model_kwargs(kind))
+    recorder = LandmarkRecorder(kind)
+
+    started_at = time.monotonic()
+    try:
+        while True:
+            ok, raw = cap.read()
+            if not ok:
+                break
+            now = frame_time(cap)
+            if now is None:
+                now = time.monotonic() - started_at
+            frame = PreparedFrame.from_camera(raw, mirror=not config.MIRROR_LANDMARKS)
+
+            result = detector.process(frame)
+            hands = result.hand_landmarks or []
+            handedness = handedness_labels(result)
+            gate_result = None
+            if hands and gate_model is not None:
+                gate_result = gate_model.process(frame)
+            if config.MIRROR_LANDMARKS:
+                # Store what gating sees: landmarks of the mirrored view.
+                hands = [mirror_landmarks(lm) for lm in hands]
+                handedness = [_MIRRORED_HANDEDNESS.get(h, h) for h in handedness]
+                gate_result = mirror_gate_result(gate_result)
+            recorder.add(now, hands, handedness, gate_result)
+
+            if config.GUI_ENABLED:
+                preview = frame.bgr
+                if config.MIRROR_LANDMARKS:
+                    preview = cv2.flip(preview, 1)
+                draw_hands(preview, hands)
+                cv2.imshow(WINDOW_NAME, preview)
+                if cv2.waitKey(1) & 0xFF == ord("q"):
+                    break
+    except KeyboardInterrupt:
+        print("\nStopping...")
+    finally:
+        detector.close()
+        if gate_model is not None:
+            gate_model.close()
+        cap.release()
+        if config.GUI_ENABLED:
+            cv2.destroyAllWindows()
+
+    recorder.save(options.output)
+    print(f"[record] Saved {len(recorder)} frame(s) to {options.output}")
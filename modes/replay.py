@@ -0,0 +1,60 @@
+"""Replay mode — run a landmark recording through gating and the controller.
+
+Needs neither MediaPipe nor OpenCV, and commands are only logged, so a
+replay is a fast, device-free regression run of the controller and the
+recognizer on real user data.
+"""
+
+import argparse
+import time
+
+import config
+from controller import GestureController
+from engine.replay import ReplayRegistry, replay
+from gestures import gating
+from gestures.gate_scheduler import GateModelScheduler
+from gestures.recording import LandmarkRecording
+from state_machine import StateMachine
+
+
+def run(args: list[str]) -> None:
+    parser = argparse.ArgumentParser(prog="main.py replay")
+    parser.add_argument("recording", help="an .npz written by 'main.py record'")
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="replay this many times, for timing"
+    )
+    options = parser.parse_args(args)
+    if options.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    recording = LandmarkRecording.load(options.recording)
+    hand_gate = gating.build_from_config()
+    if hand_gate.model_kind != recording.gate_model:
+        print(
+            f"[replay] Warning: recorded with gate model "
+            f"{recording.gate_model or 'none'}, gating needs "
+            f"{hand_gate.model_kind or 'none'}"
+        )
+
+    elapsed = 0.0
+    for _ in range(options.repeat):
+        registry = ReplayRegistry()
+        # The recording's timestamps are the only clock.
+        controller = GestureController(StateMachine(), registry, [], clock=None)
+        scheduler = GateModelScheduler(
+            config.GATE_MODEL_MAX_AGE_FRAMES, config.GATE_MODEL_MAX_WRIST_SHIFT
+        )
+        started = time.perf_counter()
+        replay(recording, hand_gate, controller, scheduler, registry)
+        elapsed += time.perf_counter() - started
+
+    for fired in registry.fired:
+        print(f"[replay] {fired.timestamp:8.2f} s  {fired.gesture}")
+    frames = len(recording) * options.repeat
+    rate = frames / elapsed if elapsed else 0.0
+    speedup = recording.duration * options.repeat / elapsed if elapsed else 0.0
+    print(
+        f"[replay] {len(registry.fired)} command(s) from {len(recording)} frame(s) "
+        f"({recording.duration:.1f} s); {rate:.0f} frames/s, "
+        f"{speedup:.0f}x real time"
+    )
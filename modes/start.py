@@ -1,21 +1,49 @@
-"""Start mode — launch the gesture listener."""
+"""Start mode — launch the gesture listener.
 
+By default frames come from the camera.  ``--source path.mp4`` plays a
+recording instead, as fast as it decodes or, with ``--paced``, at its
+original rate; either way the controller runs on the file's timestamps.
+"""
+
+import argparse
+import signal
 import time
+from dataclasses import replace
 
 import cv2
 
 import config
 import integrations
+import journal
 from integrations import hue, tuya
-from state_machine import State, StateMachine
+from state_machine import StateMachine
+from capture.camera import log_negotiated, open_camera
+from capture.latest_frame import LatestFrameReader
+from capture.network import NetworkStreamSource
+from capture.sources import VideoFileSource
+from capture.timing import TimedCapture
 from gestures.detector import HandDetector
-from gestures.pose_detector import PoseDetector
+from gestures.frame_pool import FramePool
+from gestures.gate_scheduler import GateModelScheduler
+from gestures.motion_gate import MotionGate
+from gestures import gating
+from gestures.roi import RoiHandTracker
 from commands.registry import CommandRegistry
 from hooks import build_from_yaml as build_hooks
 from controller import GestureController
+from engine import live_stream, multiprocess, pipelined, serial
+from engine.display import DisplayStage
+from engine.duty_cycle import DutyCycler, profiles_from_config
+from engine.flight_recorder import FlightRecorder
+from engine.governor import GovernorSettings, LatencyGovernor
+from engine.mjpeg_server import MjpegPreview
+from engine.processor import FrameProcessor
+from engine.shm_ring import SharedFrameRing
+from engine.workers import InferenceWorkers
 
 
-def run() -> None:
+def run(args: list[str] | None = None) -> None:
+    options = _parse_args(args or [])
     enabled_integrations: set[str] = set()
 
     hue_cfg = integrations.get("hue")
@@ -36,69 +64,344 @@ def run() -> None:
     registry = CommandRegistry.build_from_yaml("gestures.yaml", enabled_integrations)
     hooks = build_hooks("gestures.yaml", enabled_integrations)
 
-    controller = GestureController(sm, registry, hooks)
+    # A recording's clock stands still while a command runs.
+    clock = None if options.source else time.monotonic
+    controller = GestureController(sm, registry, hooks, clock=clock)
 
-    detector = HandDetector(
-        max_hands=config.MEDIAPIPE_MAX_HANDS,
-        min_detection_confidence=config.MEDIAPIPE_MIN_DETECTION_CONFIDENCE,
-        min_tracking_confidence=config.MEDIAPIPE_MIN_TRACKING_CONFIDENCE,
-    )
-    pose_detector = PoseDetector(max_poses=config.MEDIAPIPE_MAX_HANDS)
+    if config.OPENCV_THREADS is not None:
+        cv2.setNumThreads(config.OPENCV_THREADS)
 
-    cap = cv2.VideoCapture(config.CAMERA_INDEX)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, config.FRAME_WIDTH)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, config.FRAME_HEIGHT)
+    hand_gate = gating.build_from_config()
+    hand_kwargs = hand_detector_kwargs()
+    gate_model_kwargs = gating.gate_model_kwargs(hand_gate.model_kind)
 
-    if not cap.isOpened():
-        print("ERROR: cannot open camera")
+    opened = open_frame_source(options.source, options.paced)
+    if opened is None:
         return
+    cap, actual = opened
+    recording = cap if isinstance(cap, VideoFileSource) else None
+    stream = cap if isinstance(cap, NetworkStreamSource) else None
 
-    pose_results = None
-    frame_count = 0
+    reader = None
+    # A recording must not drop frames, so it is never read on a thread;
+    # a network stream already decodes on its own.
+    if config.CAPTURE_THREADED and recording is None and stream is None:
+        cap = reader = LatestFrameReader(cap).start()
+    if config.CAPTURE_TIMING_ENABLED:
+        cap = TimedCapture(cap)
 
-    try:
-        while True:
-            ok, frame = cap.read()
-            if not ok:
-                break
-
-            frame = cv2.flip(frame, 1)
-            results = detector.process(frame)
-            if frame_count % 30 == 0:
-                pose_results = pose_detector.process(frame)
-            frame_count += 1
-            now = time.monotonic()
-
-            all_hands = results.hand_landmarks or []
-            raised_hands = []
-            for lm in all_hands:
-                neck_y = pose_detector.neck_y_for_hand(
-                    lm[0].x, lm[0].y, pose_results, config.POSE_WRIST_MATCH_THRESHOLD
-                )
-                if neck_y is not None and lm[0].y < neck_y:
-                    raised_hands.append(lm)
-
-            if config.GUI_ENABLED:
-                for lm in raised_hands:
-                    detector.draw_landmarks(frame, lm)
+    detector, gate_model, ring, workers = build_inference(
+        hand_gate, hand_kwargs, gate_model_kwargs, actual
+    )
+    motion_gate = build_motion_gate()
 
-            controller.handle_frame(now, raised_hands)
+    display = None
+    if config.GUI_ENABLED and config.DISPLAY_THREADED:
+        display = DisplayStage(hooks).start()
+    preview = None
+    if config.PREVIEW_SERVER_ENABLED:
+        preview = MjpegPreview(
+            hooks,
+            config.PREVIEW_SERVER_HOST,
+            config.PREVIEW_SERVER_PORT,
+            config.PREVIEW_SERVER_FPS,
+            config.PREVIEW_SERVER_JPEG_QUALITY,
+        ).start()
+    flight_recorder = _build_flight_recorder()
+    event_journal = None
+    if config.JOURNAL_ENABLED:
+        event_journal = journal.Journal(
+            config.JOURNAL_DIR,
+            config.JOURNAL_SEGMENT_KB * 1024,
+            config.JOURNAL_MAX_SEGMENTS,
+        ).start()
 
-            in_command_mode = sm.state == State.COMMAND_MODE
-            for hook in hooks:
-                hook.on_frame(frame, in_command_mode)
+    processor = FrameProcessor(
+        detector,
+        gate_model,
+        hand_gate,
+        sm,
+        controller,
+        hooks,
+        config.GUI_ENABLED,
+        motion_gate=motion_gate,
+        gate_scheduler=GateModelScheduler(
+            config.GATE_MODEL_MAX_AGE_FRAMES, config.GATE_MODEL_MAX_WRIST_SHIFT
+        ),
+        mirror_landmarks=config.MIRROR_LANDMARKS,
+        frame_pool=build_frame_pool(),
+        duty_cycle=build_duty_cycle(),
+        governor=build_governor(),
+        display=display,
+        preview=preview,
+        flight_recorder=flight_recorder,
+    )
 
-            if config.GUI_ENABLED:
-                cv2.imshow("Gesture Control", frame)
-                if cv2.waitKey(1) & 0xFF == ord("q"):
-                    break
-            else:
-                time.sleep(0.001)
+    started_at = time.monotonic()
+    try:
+        run_engine(cap, processor, hand_kwargs, gate_model_kwargs, workers, ring)
     except KeyboardInterrupt:
         print("\nShutting down...")
     finally:
-        detector.close()
-        pose_detector.close()
+        if workers is not None:
+            workers.close()
+            ring.close()
+        if detector is not None:
+            detector.close()
+        if gate_model is not None:
+            gate_model.close()
         cap.release()
+        if preview is not None:
+            preview.close()
+        if flight_recorder is not None:
+            flight_recorder.close()
+        if event_journal is not None:
+            event_journal.close()
+        if display is not None:
+            display.close()
+            if display.dropped:
+                print(f"[display] Dropped {display.dropped} preview frame(s)")
+        if motion_gate is not None:
+            print(f"[motion] Skipped inference on {motion_gate.skipped_frames} frame(s)")
+        if recording is not None:
+            elapsed = time.monotonic() - started_at
+            print(
+                f"[capture] Played {recording.frames_read} frame(s) "
+                f"({recording.frame_time or 0.0:.1f} s of video) in {elapsed:.1f} s"
+            )
+        if stream is not None:
+            stats = stream.stats()
+            print(
+                f"[network] decode {stats['decode_fps']:.1f} fps  "
+                f"lag p50 {stats['lag_ms']['p50']:.1f} ms  "
+                f"p95 {stats['lag_ms']['p95']:.1f} ms  "
+                f"{stats['reconnects']} reconnect(s)  "
+                f"{stream.dropped_frames} stale frame(s) dropped"
+            )
+        if reader is not None and reader.dropped_frames:
+            print(f"[capture] Dropped {reader.dropped_frames} stale frame(s)")
+        if isinstance(cap, TimedCapture):
+            for name, stats in cap.summary().items():
+                print(
+                    f"[capture] {name:<8} p50 {stats['p50']:.1f} ms  "
+                    f"p95 {stats['p95']:.1f} ms  p99 {stats['p99']:.1f} ms"
+                )
         if config.GUI_ENABLED:
             cv2.destroyAllWindows()
+
+
+def _parse_args(args: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="main.py start")
+    parser.add_argument(
+        "--source", metavar="PATH", help="play a video file instead of the camera"
+    )
+    parser.add_argument(
+        "--paced",
+        action="store_true",
+        help="play --source at its recorded rate instead of as fast as possible",
+    )
+    options = parser.parse_args(args)
+    if options.paced and not options.source:
+        parser.error("--paced requires --source")
+    return options
+
+
+def open_frame_source(path: str | None = None, paced: bool = False):
+    """Open the recording at ``path``, else the configured IP or local camera.
+
+    Returns ``(source, {"width": ..., "height": ...})``, or None (after
+    saying why) when it cannot be opened.
+    """
+    if path:
+        cap = VideoFileSource(path, paced=paced)
+        if not cap.isOpened():
+            print(f"ERROR: cannot open {path}")
+            return None
+        pacing = "paced" if paced else "as fast as possible"
+        print(f"[capture] Playing {path} ({pacing})")
+        return cap, {
+            "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        }
+
+    if config.CAMERA_URL:
+        cap = NetworkStreamSource(
+            config.CAMERA_URL,
+            config.NETWORK_TIMEOUT_MS,
+            config.NETWORK_RECONNECT_INITIAL_SECONDS,
+            config.NETWORK_RECONNECT_MAX_SECONDS,
+        ).start()
+        print(f"[network] Waiting for the first frame from {config.CAMERA_URL}")
+        height, width = cap.wait_for_frame()
+        print(f"[network] Streaming {width}x{height}")
+        return cap, {"width": width, "height": height}
+
+    requested = {
+        "width": config.FRAME_WIDTH,
+        "height": config.FRAME_HEIGHT,
+        "fourcc": config.CAPTURE_FOURCC,
+        "buffer_size": config.CAPTURE_BUFFER_SIZE,
+        "fps": config.CAPTURE_FPS,
+    }
+    cap = open_camera(config.CAMERA_INDEX, backend=config.CAPTURE_BACKEND, **requested)
+    if not cap.isOpened():
+        print("ERROR: cannot open camera")
+        return None
+    return cap, log_negotiated(cap, requested)
+
+
+def hand_detector_kwargs() -> dict:
+    return {
+        "max_hands": config.MEDIAPIPE_MAX_HANDS,
+        "min_detection_confidence": config.MEDIAPIPE_MIN_DETECTION_CONFIDENCE,
+        "min_tracking_confidence": config.MEDIAPIPE_MIN_TRACKING_CONFIDENCE,
+        "model_variant": config.HAND_MODEL_VARIANT,
+        "use_model_buffer": config.MODEL_LOAD_FROM_BUFFER,
+        "delegate": config.INFERENCE_DELEGATE,
+    }
+
+
+def build_inference(hand_gate, hand_kwargs: dict, gate_model_kwargs: dict, actual):
+    """Build the models the configured engine needs.
+
+    Returns ``(detector, gate_model, ring, workers)``.  Worker processes
+    own the models in multiprocess mode and the live-stream engine builds
+    its own; otherwise they live in this process.
+    """
+    detector = gate_model = ring = workers = None
+    if config.ENGINE == "multiprocess":
+        ring = SharedFrameRing(
+            config.MULTIPROCESS_RING_SLOTS, actual["height"], actual["width"]
+        )
+        workers = InferenceWorkers(
+            ring, hand_kwargs, hand_gate.model_kind, gate_model_kwargs
+        ).start()
+    elif config.ENGINE != "live_stream":
+        detector = _build_hand_detector(hand_kwargs)
+        gate_model = gating.build_gate_model(hand_gate.model_kind, **gate_model_kwargs)
+    return detector, gate_model, ring, workers
+
+
+def run_engine(
+    cap, processor, hand_kwargs: dict, gate_model_kwargs: dict, workers, ring
+) -> None:
+    """Drive ``processor`` over ``cap`` with the configured engine until
+    the source ends or the user quits."""
+    if config.ENGINE == "live_stream":
+        live_stream.run(
+            cap, processor, hand_kwargs, gate_model_kwargs, config.GUI_ENABLED
+        )
+    elif config.ENGINE == "multiprocess":
+        multiprocess.run(cap, processor, workers, ring, config.GUI_ENABLED)
+    elif config.ENGINE == "pipelined":
+        pipelined.run(
+            cap,
+            processor,
+            config.PIPELINE_QUEUE_SIZE,
+            config.PIPELINE_QUEUE_POLICY,
+        )
+    else:
+        serial.run(cap, processor, config.GUI_ENABLED)
+
+
+def build_motion_gate() -> MotionGate | None:
+    if not config.MOTION_GATE_ENABLED:
+        return None
+    return MotionGate(
+        width=config.MOTION_GATE_WIDTH,
+        pixel_threshold=config.MOTION_GATE_PIXEL_THRESHOLD,
+        min_changed_fraction=config.MOTION_GATE_MIN_CHANGED_FRACTION,
+        recheck_frames=config.MOTION_GATE_RECHECK_FRAMES,
+    )
+
+
+def build_frame_pool() -> FramePool | None:
+    # The multiprocess engine already writes frames into its shared ring.
+    if not config.FRAME_POOL_ENABLED or config.ENGINE == "multiprocess":
+        return None
+    if config.ENGINE == "pipelined":
+        return FramePool(pipelined.max_frames_in_flight(config.PIPELINE_QUEUE_SIZE))
+    return FramePool(1)
+
+
+def build_duty_cycle() -> DutyCycler | None:
+    if not config.DUTY_CYCLE_ENABLED:
+        return None
+    profiles = profiles_from_config(config.DUTY_CYCLE_PROFILES)
+    if config.ENGINE == "multiprocess":
+        # Frames go into the shared ring at full size; prepare() skips scaling.
+        if any(profile.scale != 1.0 for profile in profiles.values()):
+            print("[duty] Profile scale is skipped by the multiprocess engine")
+        profiles = {
+            name: replace(profile, scale=1.0) for name, profile in profiles.items()
+        }
+    return DutyCycler(profiles, config.DUTY_CYCLE_DOWNSHIFT_SECONDS)
+
+
+def _build_flight_recorder() -> FlightRecorder | None:
+    if not config.FLIGHT_RECORDER_ENABLED:
+        return None
+    recorder = FlightRecorder(
+        config.FLIGHT_RECORDER_DIR,
+        config.FLIGHT_RECORDER_SECONDS,
+        config.FLIGHT_RECORDER_POST_SECONDS,
+        int(config.FLIGHT_RECORDER_MAX_MB * 2**20),
+        config.FLIGHT_RECORDER_FPS,
+        config.FLIGHT_RECORDER_SCALE,
+        config.FLIGHT_RECORDER_JPEG_QUALITY,
+    ).start()
+    if hasattr(signal, "SIGUSR1"):  # not on Windows
+        signal.signal(signal.SIGUSR1, lambda *_: recorder.trigger("manual"))
+        print("[flight] Recording; send SIGUSR1 to dump on demand")
+    return recorder
+
+
+def build_governor() -> LatencyGovernor | None:
+    if not config.LATENCY_GOVERNOR_ENABLED:
+        return None
+    stale = config.GATE_MODEL_STALE_FRAMES
+    for step in config.LATENCY_GOVERNOR_STEPS:
+        max_age = step.get("gate_model_max_age_frames")
+        if stale is not None and max_age is not None and max_age > stale:
+            # Results would be refused as stale before they are refreshed.
+            raise ValueError(
+                f"latency_governor_steps: gate_model_max_age_frames {max_age} "
+                f"exceeds gate_model_stale_frames {stale}"
+            )
+    base = GovernorSettings(
+        gate_model_max_age_frames=config.GATE_MODEL_MAX_AGE_FRAMES,
+        max_hands=config.MEDIAPIPE_MAX_HANDS,
+    )
+    disabled = []
+    if config.ENGINE == "multiprocess":
+        # Frames go into the shared ring at full size; prepare() skips scaling.
+        disabled.append("scale")
+    if config.ENGINE in ("multiprocess", "live_stream"):
+        # The hand landmarker lives in the workers or the engine, not here.
+        disabled.append("max_hands")
+    if disabled:
+        print(
+            f"[governor] {' and '.join(disabled)} steps are skipped by the "
+            f"{config.ENGINE} engine"
+        )
+    return LatencyGovernor(
+        base,
+        config.LATENCY_GOVERNOR_STEPS,
+        config.LATENCY_BUDGET_MS,
+        config.LATENCY_GOVERNOR_WINDOW,
+        config.LATENCY_GOVERNOR_HEADROOM,
+        disabled_knobs=tuple(disabled),
+    )
+
+
+def _build_hand_detector(hand_kwargs: dict):
+    if not config.HAND_ROI_ENABLED:
+        return HandDetector(**hand_kwargs)
+    return RoiHandTracker(
+        HandDetector(**hand_kwargs),
+        HandDetector(**{**hand_kwargs, "max_hands": 1}, running_mode="image"),
+        max_hands=hand_kwargs["max_hands"],
+        full_frame_interval=config.HAND_ROI_FULL_FRAME_INTERVAL,
+        padding=config.HAND_ROI_PADDING,
+    )
+
@@ -1,5 +1,7 @@
 from enum import Enum, auto
 
+import bus
+
 
 class State(Enum):
     IDLE = auto()
@@ -19,3 +21,4 @@ class StateMachine:
         old = self._state
         self._state = new_state
         print(f"[STATE] {old.name} -> {new_state.name}")
+        bus.emit("state_changed", old=old, new=new_state)
@@ -0,0 +1,25 @@
+"""Percentiles and summaries of timing samples, for runtime stats and benchmarks."""
+
+from __future__ import annotations
+
+import math
+
+
+def percentile(sorted_samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return float("nan")
+    rank = max(1, math.ceil(pct / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Mean and p50/p95/p99 of a list of samples (in their own unit)."""
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean": sum(ordered) / len(ordered) if ordered else float("nan"),
+        "p50": percentile(ordered, 50),
+        "p95": percentile(ordered, 95),
+        "p99": percentile(ordered, 99),
+    }
@@ -0,0 +1,52 @@
+import os
+
+import context
+import integrations
+from benchmarks import devices
+from benchmarks.standins import FaultProfile
+from hooks.hue_hook import HueHook
+
+
+def _run(faults, ops=3):
+    with devices.standins(faults) as servers:
+        rows = {
+            scenario.name: devices.measure(scenario, list(servers), ops)
+            for scenario in devices.build_scenarios(HueHook(devices.HOOK_PARAMS))
+        }
+    return rows
+
+
+def test_counts_round_trips_per_command():
+    rows = _run(FaultProfile())
+
+    turn_on = rows["hue_turn_on"]
+    assert turn_on["errors"] == 0
+    # Cold: the light list, then on and color as separate PUTs per light.
+    assert turn_on["first_op_requests"] == 5
+    assert turn_on["routes_per_op"]["PUT /lights/{id}/state"] == 4
+    assert rows["hue_hook_enter"]["routes_per_op"]["GET /lights/{id}"] == 2
+    assert rows["hue_on_gesture"]["requests_per_op"]["mean"] == 8
+    assert rows["tuya_press_key"]["first_op_requests"] == 3  # token renewal
+    assert rows["tuya_press_key"]["requests_per_op"]["p50"] == 1
+    for row in rows.values():
+        assert row["ops_per_second"] > 0
+
+
+def test_failures_are_counted_even_when_swallowed():
+    rows = _run(FaultProfile(error_rate=1.0))
+
+    # The command only prints Tuya's error body.
+    assert rows["tuya_press_key"]["errors"] == 0
+    assert rows["tuya_press_key"]["failed_requests"] == 3
+    assert rows["hue_turn_off"]["errors"] == 3
+    assert rows["hue_hook_enter"]["errors"] == 3
+
+
+def test_standins_restore_the_environment():
+    integrations._cache = {"hue": {"enabled": False}}
+    bundle = os.environ.get("REQUESTS_CA_BUNDLE")
+    with devices.standins(FaultProfile()):
+        assert context.get("hue_bridge") is not None
+        assert devices.AC_DEVICE in integrations.get("tuya")["devices"]
+    assert integrations._cache == {"hue": {"enabled": False}}
+    assert os.environ.get("REQUESTS_CA_BUNDLE") == bundle
@@ -0,0 +1,131 @@
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import yaml
+
+import config
+from benchmarks import pipeline
+from modes import start
+
+DEMO = str(Path(__file__).resolve().parents[1] / "demo.mp4")
+
+
+class FakeHandDetector:
+    def __init__(self):
+        self.closed = False
+
+    def process(self, frame):
+        return SimpleNamespace(hand_landmarks=[])
+
+    def close(self):
+        self.closed = True
+
+
+def test_parse_overrides_reads_yaml_values():
+    overrides = pipeline.parse_overrides(
+        ["engine=pipelined", "hand_roi_enabled=true", "pipeline_queue_size=3"]
+    )
+    assert overrides == {
+        "ENGINE": "pipelined",
+        "HAND_ROI_ENABLED": True,
+        "PIPELINE_QUEUE_SIZE": 3,
+    }
+
+
+@pytest.mark.parametrize("pair", ["no_such_key=1", "engine"])
+def test_parse_overrides_rejects_unknown_keys(pair):
+    with pytest.raises(ValueError):
+        pipeline.parse_overrides([pair])
+
+
+def test_overridden_config_restores_values():
+    engine = config.ENGINE
+    with pipeline.overridden_config({"ENGINE": "pipelined"}):
+        assert config.ENGINE == "pipelined"
+    assert config.ENGINE == engine
+
+
+def test_stage_timer_times_each_thread():
+    class Worker:
+        def step(self, n):
+            return n * 2
+
+    worker = Worker()
+    timer = pipeline.StageTimer()
+    timer.wrap(worker, "step")
+    assert worker.step(2) == 4
+    t = threading.Thread(target=worker.step, args=(1,))
+    t.start()
+    t.join()
+
+    summary = timer.summary()
+    assert timer.count("step") == 2
+    assert summary["step"]["latency_ms"]["count"] == 2
+    assert summary["step"]["cpu_ms"]["count"] == 2
+    assert timer.count("other") == 0
+
+
+def _variant(name, fps, p95):
+    stats = {"p50": p95 / 2, "p95": p95, "p99": p95}
+    return {
+        "name": name,
+        "fps": fps,
+        "stages": {"detect_hands": {"latency_ms": stats, "cpu_ms": stats}},
+    }
+
+
+def test_compare_flags_regressions_by_variant_name():
+    baseline = {"variants": [_variant("serial", 30.0, 10.0), _variant("old", 1, 1)]}
+    results = {"variants": [_variant("serial", 24.0, 12.0), _variant("new", 1, 1)]}
+
+    rows = {row["metric"]: row for row in pipeline.compare(results, baseline)}
+
+    assert set(rows) == {"fps", "detect_hands p50", "detect_hands p95"}
+    assert rows["fps"]["change_pct"] == pytest.approx(-20.0)
+    assert rows["fps"]["regression_pct"] == pytest.approx(20.0)
+    assert rows["detect_hands p95"]["regression_pct"] == pytest.approx(20.0)
+
+
+@pytest.mark.parametrize("engine", ["serial", "pipelined"])
+def test_run_variant_plays_the_video_through_the_pipeline(
+    monkeypatch, tmp_path, engine
+):
+    gestures = tmp_path / "gestures.yaml"
+    gestures.write_text(yaml.dump({"hooks": [{"hook": "ConsoleHook"}]}))
+    detectors = []
+
+    def fake_hand_detector(kwargs):
+        detectors.append(FakeHandDetector())
+        return detectors[-1]
+
+    monkeypatch.setattr(start, "_build_hand_detector", fake_hand_detector)
+    overrides = {"ENGINE": engine, "HAND_GATE": "heuristic"}
+
+    result = pipeline.run_variant(
+        DEMO, engine, overrides, frame_limit=5, gestures_path=str(gestures)
+    )
+
+    assert result["name"] == engine
+    assert result["overrides"] == {"engine": engine, "hand_gate": "heuristic"}
+    assert result["engine"] == engine
+    assert result["frames_read"] == 5
+    assert result["frames_processed"] == 5
+    assert result["fps"] > 0
+    for stage in ("read", "prepare", "detect_hands", "gate", "control", "render"):
+        assert result["stages"][stage]["latency_ms"]["count"] >= 5
+    assert detectors[0].closed
+    assert config.HAND_GATE == "pose"
+
+
+def test_run_without_a_gestures_file_uses_no_hooks(monkeypatch, tmp_path, capsys):
+    monkeypatch.setattr(start, "_build_hand_detector", lambda kw: FakeHandDetector())
+    missing = str(tmp_path / "gestures.yaml")
+
+    variants = [("current", {"HAND_GATE": "heuristic"})]
+    results = pipeline.run(DEMO, variants, frame_limit=2, gestures_path=missing)
+
+    assert results["gestures"] is None
+    assert results["variants"][0]["frames_processed"] == 2
+    assert "running without hooks" in capsys.readouterr().out
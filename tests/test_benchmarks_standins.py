@@ -0,0 +1,81 @@
+import os
+import time
+
+import pytest
+import requests
+import tinytuya
+from phue import Bridge
+
+from benchmarks.standins import FaultProfile, HueBridgeStandIn, TuyaCloudStandIn
+from integrations import hue
+
+
+@pytest.fixture
+def hue_bridge():
+    server = HueBridgeStandIn(light_ids=(5, 6)).start()
+    yield server, Bridge(server.host, username="standin", config_file_path=os.devnull)
+    server.close()
+
+
+def test_hue_commands_change_light_state(hue_bridge):
+    server, bridge = hue_bridge
+
+    hue.turn_on(bridge, [5, 6])
+    hue.set_color(bridge, [5], {"hue": 100, "sat": 200})
+
+    assert server.lights["5"]["state"]["on"] is True
+    assert server.lights["5"]["state"]["colormode"] == "hs"
+    assert bridge.get_light(6)["state"]["on"] is True
+    assert [r.route for r in server.requests] == [
+        "GET /lights",
+        "PUT /lights/{id}/state",
+        "PUT /lights/{id}/state",
+        "PUT /lights/{id}/state",
+        "GET /lights/{id}",
+    ]
+
+
+def test_injected_errors_change_nothing(hue_bridge):
+    server, bridge = hue_bridge
+    server.faults = FaultProfile(error_rate=1.0)
+
+    result = bridge.set_light(5, {"on": True})
+
+    assert "error" in result[0][0]
+    assert server.lights["5"]["state"]["on"] is False
+    assert server.requests[-1].status == 503
+    assert server.requests[-1].failed
+
+
+def test_latency_is_added_to_every_request():
+    server = HueBridgeStandIn(faults=FaultProfile(latency_ms=50, jitter_ms=5)).start()
+    try:
+        start = time.perf_counter()
+        requests.get(f"http://{server.host}/api/standin/config", timeout=5)
+        assert time.perf_counter() - start >= 0.045
+    finally:
+        server.close()
+
+
+def test_tuya_cloud_renews_a_stale_token_over_tls(monkeypatch):
+    server = TuyaCloudStandIn().start()
+    try:
+        monkeypatch.setenv("REQUESTS_CA_BUNDLE", server.cert_path)
+        cloud = tinytuya.Cloud(
+            apiRegion="us", apiKey="k", apiSecret="s", initial_token="stale"
+        )
+        cloud.urlhost = server.host
+
+        result = cloud.cloudrequest(
+            "/v2.0/infrareds/gw/remotes/ac/command", "POST", {"key": "power"}
+        )
+
+        assert result["success"] is True
+        assert server.commands == [{"key": "power"}]
+        assert [r.route for r in server.requests] == [
+            "POST /v2.0/infrareds/{id}/remotes/{id}/command",
+            "GET /v1.0/token",
+            "POST /v2.0/infrareds/{id}/remotes/{id}/command",
+        ]
+    finally:
+        server.close()
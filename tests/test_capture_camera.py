@@ -0,0 +1,48 @@
+import cv2
+import numpy as np
+import pytest
+
+from capture.camera import fourcc_to_str, log_negotiated, negotiated, open_camera
+
+
+@pytest.fixture
+def video(tmp_path):
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 15, (64, 48))
+    for i in range(5):
+        writer.write(np.full((48, 64, 3), i * 40, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+def test_fourcc_round_trip():
+    assert fourcc_to_str(cv2.VideoWriter_fourcc(*"MJPG")) == "MJPG"
+    assert fourcc_to_str(0) == ""
+    assert fourcc_to_str(-1) == ""
+
+
+def test_negotiated_reports_what_the_source_delivers(video):
+    cap = open_camera(video, width=1280, height=720, buffer_size=1, fps=60)
+    try:
+        actual = negotiated(cap)
+    finally:
+        cap.release()
+    assert (actual["width"], actual["height"]) == (64, 48)
+    assert actual["fourcc"] == "MJPG"
+    assert actual["fps"] == pytest.approx(15)
+
+
+def test_log_flags_rejected_settings(video, capsys):
+    cap = open_camera(video)
+    try:
+        log_negotiated(cap, {"width": 1280, "height": 48, "fourcc": None})
+    finally:
+        cap.release()
+    out = capsys.readouterr().out
+    assert "width=64 (requested 1280)" in out
+    assert "height=48 " in out
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="backend"):
+        open_camera(0, backend="betamax")
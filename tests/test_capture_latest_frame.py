@@ -0,0 +1,87 @@
+import threading
+
+import numpy as np
+
+from capture.latest_frame import LatestFrameReader
+
+
+class FakeCapture:
+    """Yields ``count`` frames whose pixel value is the frame index."""
+
+    def __init__(self, count: int, gate: threading.Event | None = None):
+        self._count = count
+        self._i = 0
+        self._gate = gate
+        self.released = False
+
+    def isOpened(self):
+        return True
+
+    def read(self):
+        if self._gate is not None:
+            self._gate.wait()
+        if self._i >= self._count:
+            return False, None
+        frame = np.full((4, 4, 3), self._i, dtype=np.uint8)
+        self._i += 1
+        return True, frame
+
+    def release(self):
+        self.released = True
+
+
+def test_read_returns_frames_in_order_when_consumer_keeps_up():
+    gate = threading.Event()
+    reader = LatestFrameReader(FakeCapture(3, gate)).start()
+    seen = []
+    gate.set()
+    while True:
+        ok, frame = reader.read()
+        if not ok:
+            break
+        seen.append(int(frame[0, 0, 0]))
+    reader.release()
+    assert seen == sorted(seen)
+    assert seen[-1] == 2
+
+
+def test_slow_consumer_gets_latest_frame_and_counts_drops():
+    reader = LatestFrameReader(FakeCapture(10)).start()
+    reader._thread.join(timeout=1.0)  # let the capture run to completion
+
+    ok, frame = reader.read()
+    assert ok
+    assert int(frame[0, 0, 0]) == 9
+    assert reader.seq == 10
+    assert reader.dropped_frames == 9
+
+    ok, frame = reader.read()
+    assert not ok
+    reader.release()
+
+
+def test_read_waits_out_a_stall():
+    gate = threading.Event()
+    reader = LatestFrameReader(FakeCapture(1, gate), read_timeout=0.02).start()
+    threading.Timer(0.1, gate.set).start()  # several read_timeouts later
+    ok, frame = reader.read()
+    assert ok and int(frame[0, 0, 0]) == 0
+    reader.release()
+
+
+def test_read_ends_when_the_capture_closes():
+    gate = threading.Event()
+    cap = FakeCapture(1, gate)
+    reader = LatestFrameReader(cap, read_timeout=0.02).start()
+    cap.isOpened = lambda: False
+    ok, frame = reader.read()
+    assert not ok and frame is None
+    gate.set()
+    reader.release()
+
+
+def test_release_releases_underlying_capture():
+    cap = FakeCapture(0)
+    reader = LatestFrameReader(cap).start()
+    reader.release()
+    assert cap.released
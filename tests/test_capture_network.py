@@ -0,0 +1,141 @@
+"""NetworkStreamSource against a local MJPEG server standing in for an IP camera."""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from capture.network import NetworkStreamSource
+from engine.mjpeg_server import MjpegPreview
+
+
+class StandInCamera:
+    """An MjpegPreview fed a steady stream of frames, like an IP camera."""
+
+    def __init__(self, port=0):
+        self.preview = MjpegPreview([], port=port, fps=1000, quality=90).start()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._feed, daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self):
+        host, port = self.preview.address
+        return f"http://{host}:{port}/stream"
+
+    def _feed(self):
+        value = 0
+        while not self._stop.is_set():
+            self.preview.submit(np.full((48, 64, 3), value, np.uint8), [], False)
+            value = (value + 10) % 250
+            time.sleep(0.01)
+
+    def close(self):
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+        self.preview.close()
+
+
+@pytest.fixture
+def camera():
+    cam = StandInCamera()
+    yield cam
+    cam.close()
+
+
+def _source(url, **kwargs):
+    kwargs.setdefault("timeout_ms", 1000)
+    kwargs.setdefault("backoff_initial", 0.05)
+    kwargs.setdefault("backoff_max", 0.2)
+    return NetworkStreamSource(url, **kwargs).start()
+
+
+def test_streams_frames_and_reports_decode_rate_and_lag(camera):
+    source = _source(camera.url)
+    try:
+        assert source.wait_for_frame(timeout=5.0) == (48, 64)
+        for _ in range(10):
+            ok, frame = source.read()
+            assert ok and frame.shape == (48, 64, 3)
+        stats = source.stats()
+    finally:
+        source.release()
+    assert stats["decode_fps"] > 0
+    assert stats["lag_ms"]["count"] == 10
+    assert stats["reconnects"] == 0
+
+
+def test_reconnects_when_the_camera_comes_back(camera):
+    source = _source(camera.url)
+    try:
+        assert source.wait_for_frame(timeout=5.0)
+        port = camera.preview.address[1]
+        camera.close()
+
+        replacement = StandInCamera(port=port)
+        try:
+            deadline = time.monotonic() + 10.0
+            while source.reconnects == 0 and time.monotonic() < deadline:
+                time.sleep(0.05)
+            seq = source.seq
+            ok, _ = source.read()
+        finally:
+            replacement.close()
+    finally:
+        source.release()
+    assert source.reconnects >= 1
+    assert ok and source.seq > seq
+
+
+class Unreachable:
+    def isOpened(self):
+        return False
+
+    def release(self):
+        pass
+
+
+def test_backs_off_while_the_camera_is_unreachable(capsys):
+    attempts = []
+
+    def opener(url, timeout_ms):
+        attempts.append(time.monotonic())
+        return Unreachable()
+
+    source = _source(
+        "rtsp://camera.invalid/", opener=opener, backoff_initial=0.1, backoff_max=0.2
+    )
+    time.sleep(0.65)
+    assert source.isOpened()
+    source.release()
+
+    gaps = [b - a for a, b in zip(attempts, attempts[1:])]
+    assert gaps[:3] == pytest.approx([0.1, 0.2, 0.2], abs=0.05)
+    assert "retrying in 0.2 s" in capsys.readouterr().out
+
+
+def test_read_returns_false_once_released():
+    source = _source("rtsp://camera.invalid/", opener=lambda url, ms: Unreachable())
+    result = []
+    reader = threading.Thread(target=lambda: result.append(source.read()))
+    reader.start()
+    time.sleep(0.05)
+    source.release()
+    reader.join(timeout=1.0)
+    assert result == [(False, None)]
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_read_returns_false_when_the_opener_raises():
+    def opener(url, timeout_ms):
+        raise RuntimeError("backend crashed")
+
+    source = _source("rtsp://camera.invalid/", opener=opener)
+    result = []
+    reader = threading.Thread(target=lambda: result.append(source.read()))
+    reader.start()
+    reader.join(timeout=1.0)
+    assert result == [(False, None)]
+    assert source.wait_for_frame(timeout=1.0) is None
+    source.release()
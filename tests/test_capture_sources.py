@@ -0,0 +1,79 @@
+import cv2
+import numpy as np
+import pytest
+
+from capture.sources import VideoFileSource, frame_time
+
+
+@pytest.fixture
+def video(tmp_path):
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (64, 48))
+    for i in range(5):
+        writer.write(np.full((48, 64, 3), i * 40, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 50.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(round(seconds, 6))
+        self.now += seconds
+
+
+def _drain(source):
+    times = []
+    while source.read()[0]:
+        times.append(round(source.frame_time, 6))
+    return times
+
+
+def test_reports_the_file_timestamps(video):
+    source = VideoFileSource(video)
+    try:
+        assert frame_time(source) is None
+        assert _drain(source) == [0.0, 0.1, 0.2, 0.3, 0.4]
+    finally:
+        source.release()
+
+
+def test_as_fast_as_possible_never_sleeps(video):
+    clock = FakeClock()
+    source = VideoFileSource(video, clock=clock, sleep=clock.sleep)
+    _drain(source)
+    source.release()
+    assert clock.slept == []
+
+
+def test_paced_waits_for_each_timestamp(video):
+    clock = FakeClock()
+    source = VideoFileSource(video, paced=True, clock=clock, sleep=clock.sleep)
+    source.read()
+    clock.now += 0.03  # processing the first frame took 30 ms
+    _drain(source)
+    source.release()
+    assert clock.slept == [0.07, 0.1, 0.1, 0.1]
+    assert clock.now == pytest.approx(50.4)
+
+
+def test_grab_keeps_the_timeline(video):
+    source = VideoFileSource(video)
+    try:
+        source.read()
+        assert source.grab()
+        source.read()
+        assert source.frame_time == pytest.approx(0.2)
+        assert source.frames_read == 3
+    finally:
+        source.release()
+
+
+def test_live_sources_have_no_frame_time():
+    assert frame_time(object()) is None
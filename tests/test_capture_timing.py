@@ -0,0 +1,76 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from capture.latest_frame import LatestFrameReader
+from capture.timing import TimedCapture
+from tests.test_capture_latest_frame import FakeCapture
+
+
+class SlowSource:
+    """Each read blocks for 10 ms of fake time; frames were grabbed 25 ms ago."""
+
+    def __init__(self, clock, count=5):
+        self._clock = clock
+        self._count = count
+        self.frame_timestamp = None
+
+    def read(self):
+        if self._count == 0:
+            return False, None
+        self._count -= 1
+        self._clock.now += 0.010
+        self.frame_timestamp = self._clock.now - 0.025
+        return True, np.zeros((2, 2, 3), dtype=np.uint8)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_records_read_interval_and_age():
+    clock = FakeClock()
+    cap = TimedCapture(SlowSource(clock), clock=clock)
+    while cap.read()[0]:
+        clock.now += 0.023  # processing between reads
+
+    summary = cap.summary()
+    assert summary["read"]["count"] == 5
+    assert summary["read"]["p50"] == pytest.approx(10)
+    assert summary["interval"]["count"] == 4
+    assert summary["interval"]["p50"] == pytest.approx(33)
+    assert summary["age"]["p99"] == pytest.approx(25)
+
+
+def test_window_keeps_latest_samples():
+    clock = FakeClock()
+    cap = TimedCapture(SlowSource(clock, count=10), window=3, clock=clock)
+    for _ in range(10):
+        cap.read()
+    assert cap.summary()["read"]["count"] == 3
+
+
+def test_sources_without_timestamps_have_no_age():
+    cap = TimedCapture(FakeCapture(3))
+    while cap.read()[0]:
+        pass
+    assert "age" not in cap.summary()
+    assert cap.isOpened()
+
+
+def test_threaded_reader_reports_frame_age():
+    reader = LatestFrameReader(FakeCapture(50)).start()
+    cap = TimedCapture(reader)
+    try:
+        for _ in itertools.islice(iter(lambda: cap.read()[0], False), 10):
+            pass
+    finally:
+        cap.release()
+    ages = cap.samples["age"]
+    assert ages and all(age >= 0 for age in ages)
+    assert cap.dropped_frames == reader.dropped_frames
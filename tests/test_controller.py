@@ -242,6 +242,19 @@ def test_debounce_blocks_command_within_debounce_window(controller, sm, registry
     command.execute.assert_not_called()
 
 
+def test_debounce_uses_frame_time_without_a_clock(sm, registry, hook):
+    """Replays have no wall clock: the debounce starts at the frame's time."""
+    controller = GestureController(sm, registry, [hook], clock=None)
+
+    drive(controller, "closed_fist", now=100.0)
+    drive(controller, "closed_fist", now=101.1)   # enter command mode
+    drive(controller, "fingers_extended:index", now=101.2)
+    drive(controller, "fingers_extended:index", now=102.3)  # executes
+
+    assert registry.resolve.call_count == 1
+    assert controller._last_command_at == 102.3
+
+
 # ---------------------------------------------------------------------------
 # Wake gesture in command mode resets command tracking
 # ---------------------------------------------------------------------------
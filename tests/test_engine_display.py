@@ -0,0 +1,117 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from engine.display import DisplayStage
+from engine.processor import FramePacket, FrameProcessor
+from gestures.detector import HAND_CONNECTIONS, draw_hands
+from gestures.landmarks import Landmark
+from state_machine import StateMachine
+
+
+def _hand(x0=0.2):
+    return [Landmark(x0 + 0.02 * i, 0.8 - 0.03 * i) for i in range(21)]
+
+
+def test_draw_hands_draws_every_joint_and_connection():
+    frame = np.zeros((200, 300, 3), dtype=np.uint8)
+    hands = [_hand(0.1), _hand(0.5)]
+    draw_hands(frame, hands)
+    for hand in hands:
+        for lm in hand:
+            assert tuple(frame[int(lm.y * 200), int(lm.x * 300)]) == (0, 0, 255)
+        a, b = hand[HAND_CONNECTIONS[0][0]], hand[HAND_CONNECTIONS[0][1]]
+        mid_x, mid_y = (a.x + b.x) / 2 * 300, (a.y + b.y) / 2 * 200
+        assert frame[int(mid_y), int(mid_x)].any()
+
+
+def test_draw_hands_without_hands_is_a_no_op():
+    frame = np.zeros((4, 4, 3), dtype=np.uint8)
+    draw_hands(frame, [])
+    assert not frame.any()
+
+
+@pytest.fixture
+def highgui():
+    shown = []
+    release = threading.Event()
+    release.set()
+
+    def imshow(name, frame):
+        release.wait()
+        shown.append(frame.copy())
+
+    with patch("engine.display.cv2.imshow", side_effect=imshow), patch(
+        "engine.display.cv2.waitKey", return_value=-1
+    ) as wait_key, patch("engine.display.cv2.destroyAllWindows"):
+        yield shown, release, wait_key
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def test_submit_copies_and_mirrors(highgui):
+    shown, _, _ = highgui
+    stage = DisplayStage([]).start()
+    frame = np.zeros((2, 3, 3), dtype=np.uint8)
+    frame[:, 0] = 255
+    stage.submit(frame, [], False, mirror=True)
+    frame[:] = 7  # the caller may reuse its buffer right away
+    _wait_for(lambda: shown)
+    stage.close()
+    assert shown[0][0, 2].tolist() == [255, 255, 255]
+    assert shown[0][0, 0].tolist() == [0, 0, 0]
+
+
+def test_slow_display_drops_frames_instead_of_blocking(highgui):
+    shown, release, _ = highgui
+    release.clear()
+    stage = DisplayStage([], buffers=2).start()
+    frame = np.zeros((8, 8, 3), dtype=np.uint8)
+
+    start = time.monotonic()
+    for i in range(50):
+        frame[:] = i
+        stage.submit(frame, [], False)
+    assert time.monotonic() - start < 0.5
+
+    release.set()
+    _wait_for(lambda: shown)
+    stage.close()
+    assert stage.dropped > 0
+    assert len(shown) < 50
+
+
+def test_hooks_draw_on_display_thread(highgui):
+    shown, _, _ = highgui
+    threads = []
+
+    class Hook:
+        def on_frame(self, frame, in_command_mode):
+            threads.append(threading.current_thread().name)
+
+    stage = DisplayStage([Hook()]).start()
+    processor = FrameProcessor(
+        None, None, MagicMock(), StateMachine(), MagicMock(), [], True, display=stage
+    )
+    packet = FramePacket(0, 0.0, np.zeros((8, 8, 3), dtype=np.uint8))
+    assert processor.render(packet)
+    _wait_for(lambda: shown)
+    stage.close()
+    assert threads == ["display"]
+
+
+def test_q_requests_quit(highgui):
+    shown, _, wait_key = highgui
+    wait_key.return_value = ord("q")
+    stage = DisplayStage([]).start()
+    stage.submit(np.zeros((2, 2, 3), dtype=np.uint8), [], False)
+    _wait_for(lambda: stage.quit_requested)
+    stage.close()
+    assert stage.quit_requested
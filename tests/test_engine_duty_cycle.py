@@ -0,0 +1,147 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+import config
+from engine import serial
+from engine.duty_cycle import DutyCycler, DutyProfile, profiles_from_config
+from engine.processor import FramePacket, FrameProcessor
+from modes import start
+from state_machine import State, StateMachine
+from tests.test_engine_pipelined import (
+    FakeCapture,
+    FakeGate,
+    FakeHandDetector,
+    FakePoseDetector,
+)
+
+PROFILES = {
+    "idle": DutyProfile(fps=5, scale=0.5),
+    "hands": DutyProfile(fps=15),
+    "command": DutyProfile(),
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def _cycler(clock, downshift_seconds=2.0):
+    return DutyCycler(PROFILES, downshift_seconds, clock=clock, sleep=clock.sleep)
+
+
+def test_upshift_is_immediate_and_downshift_waits():
+    clock = FakeClock()
+    duty = _cycler(clock)
+    assert duty.update(State.IDLE, False) == PROFILES["command"]  # starts busy
+    clock.now = 2.0
+    assert duty.update(State.IDLE, False) == PROFILES["idle"]
+
+    assert duty.update(State.IDLE, True) == PROFILES["hands"]
+    assert duty.update(State.COMMAND_MODE, True) == PROFILES["command"]
+
+    clock.now = 3.0
+    assert duty.update(State.IDLE, True) == PROFILES["command"]
+    clock.now = 4.0
+    duty.update(State.COMMAND_MODE, True)  # busy again: resets the timer
+    clock.now = 5.5
+    assert duty.update(State.IDLE, True) == PROFILES["command"]
+    clock.now = 7.5
+    assert duty.update(State.IDLE, True) == PROFILES["hands"]
+
+
+def test_running_command_uses_command_profile():
+    duty = _cycler(FakeClock())
+    assert duty.update(State.RUNNING_COMMAND, False) == PROFILES["command"]
+
+
+def test_pace_sleeps_for_sources_without_grab():
+    clock = FakeClock()
+    duty = _cycler(clock, downshift_seconds=0)
+    duty.update(State.IDLE, False)
+    duty.update(State.IDLE, False)
+    times = []
+    for _ in range(3):
+        duty.pace(object())
+        times.append(clock.now)
+    assert times == pytest.approx([0.0, 0.2, 0.4])
+
+
+def test_pace_grabs_while_waiting():
+    clock = FakeClock()
+    duty = _cycler(clock, downshift_seconds=0)
+    duty.update(State.IDLE, False)
+    duty.update(State.IDLE, True)  # hands: 15 fps
+    cap = MagicMock()
+
+    def grab():
+        clock.now += 1 / 30
+        return True
+
+    cap.grab.side_effect = grab
+    duty.pace(cap)
+    duty.pace(cap)
+    assert cap.grab.call_count == 2
+
+
+def test_profiles_from_config_fills_defaults():
+    profiles = profiles_from_config({"idle": {"fps": 2, "scale": 0.25}})
+    assert profiles["idle"] == DutyProfile(2, 0.25)
+    assert profiles["command"] == DutyProfile()
+    with pytest.raises(ValueError):
+        profiles_from_config({"sleeping": {}})
+
+
+def test_processor_downscales_in_quiet_profile():
+    clock = FakeClock()
+    duty = _cycler(clock, downshift_seconds=0)
+    processor = FrameProcessor(
+        None, None, FakeGate(), StateMachine(), MagicMock(), [], False, duty_cycle=duty
+    )
+    processor.pace(object())
+    processor.pace(object())  # downshift to idle
+    packet = FramePacket(0, 0.0, np.zeros((40, 60, 3), dtype=np.uint8))
+    processor.prepare(packet)
+    assert packet.frame.shape == (20, 30, 3)
+
+
+def test_serial_engine_is_paced():
+    clock = FakeClock()
+    duty = _cycler(clock, downshift_seconds=0)
+    processor = FrameProcessor(
+        FakeHandDetector(),
+        FakePoseDetector(),
+        FakeGate(),
+        StateMachine(),
+        MagicMock(),
+        [],
+        False,
+        duty_cycle=duty,
+    )
+    serial.run(FakeCapture(20), processor, gui_enabled=False)
+    # Whether the cycler is in idle (5 fps) or hands (15 fps), the 18 frames
+    # after it leaves the initial command profile are at least 1/15 s apart.
+    assert clock.now > 18 / 15
+
+
+@pytest.mark.parametrize("engine, idle_scale", [("serial", 0.5), ("multiprocess", 1.0)])
+def test_build_duty_cycle_drops_scale_under_multiprocess(
+    monkeypatch, engine, idle_scale
+):
+    monkeypatch.setattr(config, "ENGINE", engine)
+    monkeypatch.setattr(config, "DUTY_CYCLE_ENABLED", True)
+    monkeypatch.setattr(config, "DUTY_CYCLE_DOWNSHIFT_SECONDS", 0.0)
+    monkeypatch.setattr(
+        config, "DUTY_CYCLE_PROFILES", {"idle": {"fps": 5, "scale": 0.5}}
+    )
+    duty = start.build_duty_cycle()
+    duty.update(State.IDLE, False)
+    assert duty.update(State.IDLE, False) == DutyProfile(fps=5, scale=idle_scale)
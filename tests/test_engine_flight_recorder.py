@@ -0,0 +1,122 @@
+import json
+import threading
+import time
+import zipfile
+
+import cv2
+import numpy as np
+import pytest
+
+import bus
+from engine import flight_recorder as flight_recorder_module
+from engine.flight_recorder import FlightRecorder
+from gestures.landmarks import Landmark
+from state_machine import State, StateMachine
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+def _hand(x):
+    return [Landmark(x, 0.5, 0.0)] * 21
+
+
+def _frame(value=0):
+    return np.full((48, 64, 3), value, dtype=np.uint8)
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    rec = FlightRecorder(str(tmp_path), seconds=5.0, post_seconds=0.05, fps=1000)
+    yield rec.start()
+    rec.close()
+
+
+def _read_dump(tmp_path):
+    (path,) = tmp_path.glob("*.zip")
+    with zipfile.ZipFile(path) as zf:
+        events = [json.loads(line) for line in zf.read("events.jsonl").splitlines()]
+        frames = [name for name in zf.namelist() if name.startswith("frames/")]
+    return path.name, events, frames
+
+
+def test_command_dumps_the_timeline(recorder, tmp_path):
+    sm = StateMachine()
+    hand = _hand(0.4)
+    recorder.add_frame(10.0, _frame())
+    assert _wait_for(lambda: recorder.buffered_bytes > 0)  # encoded
+    recorder.add_landmarks(10.3, [hand, _hand(0.8)], [hand])
+    bus.emit("gesture_changed", now=10.3, gesture="closed_fist")
+    sm.transition_to(State.COMMAND_MODE)
+    bus.emit("command_executed", now=10.4, gesture="fingers_extended:index", error=None)
+
+    assert _wait_for(lambda: recorder.dumps_written == 1)
+    name, events, frames = _read_dump(tmp_path)
+    assert name.endswith("-command.zip")
+    kinds = [e["kind"] for e in events]
+    assert kinds[0] == "trigger" and events[0]["reason"] == "command"
+    assert {"frame", "landmarks", "gesture", "state", "command"} <= set(kinds)
+    assert len(frames) == kinds.count("frame") >= 1
+    landmarks = next(e for e in events if e["kind"] == "landmarks")
+    assert landmarks["raised"] == [0] and len(landmarks["hands"]) == 2
+    state = next(e for e in events if e["kind"] == "state")
+    assert state == {"t": 10.3, "kind": "state", "old": "IDLE", "new": "COMMAND_MODE"}
+
+
+def test_timeout_triggers_a_dump(recorder, tmp_path):
+    bus.emit("command_mode_timed_out", now=3.0)
+    assert _wait_for(lambda: recorder.dumps_written == 1)
+    assert _read_dump(tmp_path)[0].endswith("-timeout.zip")
+
+
+def test_memory_cap_and_age_window(tmp_path):
+    rec = FlightRecorder(str(tmp_path), seconds=1.0, max_bytes=20_000)
+    hands = [_hand(0.5)] * 2  # ~500 bytes per frame
+    for i in range(200):
+        rec.add_landmarks(i / 100, hands, [])
+        assert rec.buffered_bytes <= 20_000
+    assert rec.buffered_bytes > 15_000
+
+    rec.add_landmarks(100.0, hands, [])  # everything else is now too old
+    assert rec.buffered_bytes < 1_000
+
+
+def test_late_frames_are_kept_in_time_order(tmp_path):
+    rec = FlightRecorder(str(tmp_path), seconds=1.0)
+    rec.add_landmarks(10.0, [], [])
+    rec.add_landmarks(10.5, [], [])
+    # Encoded after the landmarks that followed it.
+    rec._append(10.2, "frame", b"jpeg", 4)
+    rec._append(9.0, "frame", b"jpeg", 4)  # already outside the window
+    assert [e.t for e in rec._events] == [10.0, 10.2, 10.5]
+
+    rec.add_landmarks(11.1, [], [])
+    assert [e.t for e in rec._events] == [10.2, 10.5, 11.1]
+
+
+def test_frames_are_encoded_off_the_calling_thread(recorder, monkeypatch):
+    encoded_on = []
+    real_imencode = cv2.imencode
+
+    def spy(*args):
+        encoded_on.append(threading.current_thread().name)
+        return real_imencode(*args)
+
+    monkeypatch.setattr(flight_recorder_module.cv2, "imencode", spy)
+    recorder.add_frame(0.0, _frame())
+    assert _wait_for(lambda: encoded_on)
+    assert encoded_on == ["flight-encoder"]
+
+
+def test_close_writes_pending_dumps_and_unsubscribes(tmp_path):
+    rec = FlightRecorder(str(tmp_path), post_seconds=60.0).start()
+    rec.trigger()
+    rec.close()
+    assert rec.dumps_written == 1
+    bus.emit("command_mode_timed_out", now=0.0)
+    time.sleep(0.05)
+    assert len(list(tmp_path.glob("*.zip"))) == 1
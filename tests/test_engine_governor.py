@@ -0,0 +1,162 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+import config
+from engine.governor import GovernorSettings, LatencyGovernor
+from engine.processor import FramePacket, FrameProcessor
+from modes import start
+from state_machine import StateMachine
+from tests.test_engine_pipelined import FakeGate, FakeHandDetector, FakePoseDetector
+
+STEPS = [{"gate_model_max_age_frames": 60}, {"scale": 0.5}, {"max_hands": 1}]
+
+
+def _governor(window=3):
+    base = GovernorSettings(gate_model_max_age_frames=30, max_hands=4)
+    return LatencyGovernor(base, STEPS, budget_ms=50, window=window, headroom=0.6)
+
+
+def _feed(governor, latency_ms, frames):
+    for _ in range(frames):
+        governor.record(latency_ms)
+
+
+def test_degrades_one_step_per_window_and_logs(capsys):
+    governor = _governor()
+    _feed(governor, 80, 2)
+    assert governor.level == 0  # window not full yet
+    _feed(governor, 80, 1)
+    assert governor.level == 1
+    assert governor.settings.gate_model_max_age_frames == 60
+
+    _feed(governor, 80, 3)
+    assert governor.settings == GovernorSettings(60, scale=0.5, max_hands=4)
+    out = capsys.readouterr().out
+    assert (
+        "[governor] p95 80.0 ms over 50 ms budget: level 1 -> 2 (scale 1.0 -> 0.5)"
+        in out
+    )
+
+
+def test_stops_at_last_step():
+    governor = _governor()
+    _feed(governor, 200, 30)
+    assert governor.level == len(STEPS)
+    assert governor.settings.max_hands == 1
+
+
+def test_restores_only_with_headroom():
+    governor = _governor()
+    _feed(governor, 80, 6)
+    _feed(governor, 40, 3)  # under budget but not below 30 ms
+    assert governor.level == 2
+    _feed(governor, 10, 3)
+    assert governor.level == 1
+    _feed(governor, 10, 3)
+    assert governor.settings == GovernorSettings(30, max_hands=4)
+
+
+def test_rejects_unknown_knob():
+    with pytest.raises(ValueError, match="threads"):
+        LatencyGovernor(GovernorSettings(30), [{"threads": 1}], 50)
+
+
+def test_disabled_knobs_are_skipped():
+    base = GovernorSettings(gate_model_max_age_frames=30, max_hands=4)
+    steps = STEPS + [{"scale": 0.25, "frame_skip": 2}]
+    governor = LatencyGovernor(base, steps, 50, window=1, disabled_knobs=("scale",))
+    _feed(governor, 80, 1)
+    _feed(governor, 80, 1)  # straight past the scale-only step
+    assert governor.settings == GovernorSettings(60, max_hands=1)
+    _feed(governor, 80, 5)
+    assert governor.settings == GovernorSettings(60, max_hands=1, frame_skip=2)
+
+
+def test_processor_applies_knobs_where_they_are_used():
+    governor = _governor(window=1)
+    detector = FakeHandDetector()
+    detector.set_max_hands = MagicMock()
+    processor = FrameProcessor(
+        detector,
+        FakePoseDetector(),
+        FakeGate(),
+        StateMachine(),
+        MagicMock(),
+        [],
+        False,
+        governor=governor,
+    )
+    packet = FramePacket(0, 0.0, np.zeros((8, 8, 3), dtype=np.uint8))
+    processor.process(packet)
+    assert packet.frame.shape == (8, 8, 3)
+
+    for _ in range(3):
+        processor.control(0.0, [], captured_at=-1.0)  # 1 s latency
+    assert governor.level == 3
+
+    packet = FramePacket(1, 0.0, np.zeros((8, 8, 3), dtype=np.uint8))
+    processor.process(packet)
+    assert packet.frame.shape == (4, 4, 3)
+    detector.set_max_hands.assert_called_once_with(1)
+
+
+def test_detector_without_set_max_hands_is_an_error():
+    governor = _governor(window=1)
+    processor = FrameProcessor(
+        FakeHandDetector(),
+        FakePoseDetector(),
+        FakeGate(),
+        StateMachine(),
+        MagicMock(),
+        [],
+        False,
+        governor=governor,
+    )
+    processor.process(FramePacket(0, 0.0, np.zeros((8, 8, 3), dtype=np.uint8)))
+    for _ in range(3):
+        processor.control(0.0, [], captured_at=-1.0)
+    with pytest.raises(TypeError, match="max_hands"):
+        processor.process(FramePacket(1, 0.0, np.zeros((8, 8, 3), dtype=np.uint8)))
+
+
+@pytest.mark.parametrize(
+    "engine, skipped",
+    [
+        ("serial", set()),
+        ("live_stream", {"max_hands"}),
+        ("multiprocess", {"scale", "max_hands"}),
+    ],
+)
+def test_build_governor_skips_knobs_the_engine_cannot_apply(
+    monkeypatch, engine, skipped
+):
+    monkeypatch.setattr(config, "ENGINE", engine)
+    monkeypatch.setattr(config, "LATENCY_GOVERNOR_ENABLED", True)
+    monkeypatch.setattr(config, "GATE_MODEL_STALE_FRAMES", None)
+    monkeypatch.setattr(config, "LATENCY_GOVERNOR_STEPS", STEPS)
+    monkeypatch.setattr(config, "LATENCY_GOVERNOR_WINDOW", 1)
+    governor = start.build_governor()
+    _feed(governor, 1e6, len(STEPS))  # as degraded as it gets
+    final = governor.settings
+    assert (final.scale == 1.0) == ("scale" in skipped)
+    assert (final.max_hands == config.MEDIAPIPE_MAX_HANDS) == ("max_hands" in skipped)
+
+
+def test_frame_skip_discards_frames():
+    base = GovernorSettings(30, frame_skip=3)
+    governor = LatencyGovernor(base, [], 50)
+    processor = FrameProcessor(
+        None,
+        None,
+        FakeGate(),
+        StateMachine(),
+        MagicMock(),
+        [],
+        False,
+        governor=governor,
+    )
+    cap = MagicMock()
+    processor.pace(cap)
+    assert cap.grab.call_count == 2
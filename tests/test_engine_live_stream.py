@@ -0,0 +1,98 @@
+import queue
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from engine import live_stream
+from engine.processor import FrameProcessor
+from engine.queues import LatestSlot
+from state_machine import StateMachine
+from tests.test_engine_pipelined import FakeCapture, FakeGate, LM
+
+
+# ---------------------------------------------------------------------------
+# LatestSlot
+# ---------------------------------------------------------------------------
+
+def test_latest_slot_returns_newest_and_counts_overwrites():
+    slot = LatestSlot()
+    slot.put(1)
+    slot.put(2)
+    slot.put(3)
+    assert slot.get(timeout=0) == 3
+    assert slot.dropped == 2
+
+
+def test_latest_slot_get_waits_for_new_item():
+    slot = LatestSlot()
+    slot.put("a")
+    slot.get(timeout=0)
+    with pytest.raises(queue.Empty):
+        slot.get(timeout=0.01)
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+class AsyncFake:
+    """Delivers results on another thread, like MediaPipe LIVE_STREAM."""
+
+    instances = {}
+
+    def __init__(self, result_callback=None, **kwargs):
+        self._callback = result_callback
+        self.submitted = []
+        AsyncFake.instances[type(self).__name__] = self
+
+    def process_async(self, frame, timestamp_ms):
+        self.submitted.append(timestamp_ms)
+        threading.Thread(
+            target=self._callback, args=(self._result(), timestamp_ms)
+        ).start()
+        return timestamp_ms
+
+    def close(self):
+        pass
+
+
+class FakeAsyncHands(AsyncFake):
+    def _result(self):
+        return SimpleNamespace(hand_landmarks=[[LM(0.5, 0.5)]])
+
+
+class FakeAsyncPose(AsyncFake):
+    def _result(self):
+        return "pose"
+
+
+def test_live_stream_delivers_results_to_controller(monkeypatch):
+    monkeypatch.setattr(live_stream, "HandDetector", FakeAsyncHands)
+    monkeypatch.setattr(
+        live_stream, "build_gate_model", lambda kind, **kwargs: FakeAsyncPose(**kwargs)
+    )
+    delivered = threading.Event()
+    controller = MagicMock()
+    controller.handle_frame.side_effect = (
+        lambda now, hands: delivered.set() if hands else None
+    )
+    processor = FrameProcessor(
+        None, None, FakeGate(), StateMachine(), controller, [], False
+    )
+    rendered = []
+
+    def render(packet):
+        rendered.append(packet.index)
+        return not delivered.wait(timeout=0.5) if packet.index >= 40 else True
+
+    processor.render = render
+
+    live_stream.run(FakeCapture(1000), processor, {}, {}, gui_enabled=False)
+
+    assert delivered.is_set()
+    pose = AsyncFake.instances["FakeAsyncPose"]
+    # Scheduled on demand once the first hands have been gated.
+    assert pose.submitted and pose.submitted[0] > 0
+    assert rendered[0] == 0
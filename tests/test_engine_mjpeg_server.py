@@ -0,0 +1,142 @@
+import http.client
+import threading
+import time
+from unittest.mock import MagicMock
+
+import cv2
+import numpy as np
+import pytest
+
+from engine.mjpeg_server import MjpegPreview
+from engine.processor import FramePacket, FrameProcessor
+from state_machine import StateMachine
+
+
+@pytest.fixture
+def preview():
+    p = MjpegPreview([], port=0, fps=1000, quality=80).start()
+    yield p
+    p.close()
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+def _connect(preview):
+    host, port = preview.address
+    conn = http.client.HTTPConnection(host, port, timeout=2)
+    conn.request("GET", "/stream")
+    response = conn.getresponse()
+    assert response.status == 200
+    assert "multipart/x-mixed-replace" in response.getheader("Content-Type")
+    return conn, response
+
+
+def _read_part(response) -> bytes:
+    headers = {}
+    line = response.fp.readline()
+    while line.strip() != b"--frame":
+        line = response.fp.readline()
+    while True:
+        line = response.fp.readline().strip()
+        if not line:
+            break
+        key, value = line.decode().split(": ")
+        headers[key] = value
+    body = response.fp.read(int(headers["Content-Length"]))
+    response.fp.readline()
+    return body
+
+
+def _frame(value):
+    return np.full((48, 64, 3), value, dtype=np.uint8)
+
+
+def test_nothing_is_encoded_without_clients(preview):
+    for i in range(5):
+        preview.submit(_frame(i), [], False)
+    time.sleep(0.05)
+    assert preview.frames_encoded == 0
+
+
+def test_index_page(preview):
+    host, port = preview.address
+    conn = http.client.HTTPConnection(host, port, timeout=2)
+    conn.request("GET", "/")
+    assert b'src="/stream"' in conn.getresponse().read()
+    conn.close()
+
+
+def test_clients_share_one_encode_per_frame(preview):
+    first, first_response = _connect(preview)
+    second, second_response = _connect(preview)
+    assert _wait_for(lambda: preview.clients == 2)
+
+    preview.submit(_frame(200), [], False)
+    a = _read_part(first_response)
+    b = _read_part(second_response)
+
+    assert a == b
+    assert preview.frames_encoded == 1
+    decoded = cv2.imdecode(np.frombuffer(a, np.uint8), cv2.IMREAD_COLOR)
+    assert decoded.shape == (48, 64, 3)
+    assert abs(int(decoded[10, 10, 0]) - 200) < 5
+
+    for conn, response in ((first, first_response), (second, second_response)):
+        response.close()
+        conn.close()
+    assert _wait_for(lambda: _push(preview) == 0)
+
+
+def _push(preview):
+    # A disconnect is only noticed when writing the next frame.
+    preview.submit(_frame(1), [], False)
+    time.sleep(0.01)
+    return preview.clients
+
+
+def test_frame_rate_is_capped():
+    preview = MjpegPreview([], port=0, fps=2).start()
+    try:
+        conn, _ = _connect(preview)
+        assert _wait_for(lambda: preview.clients == 1)
+        for i in range(20):
+            preview.submit(_frame(i), [], False)
+        time.sleep(0.05)
+        assert preview.frames_encoded == 1
+        conn.close()
+    finally:
+        preview.close()
+
+
+def test_hooks_run_once_per_frame_on_the_encoder_thread():
+    threads = []
+
+    class Hook:
+        def on_frame(self, frame, in_command_mode):
+            threads.append(threading.current_thread().name)
+
+    hooks = [Hook()]
+    preview = MjpegPreview(hooks, port=0, fps=1000).start()
+    conn, response = _connect(preview)
+    assert _wait_for(lambda: preview.clients == 1)
+    processor = FrameProcessor(
+        None,
+        None,
+        MagicMock(),
+        StateMachine(),
+        MagicMock(),
+        hooks,
+        False,
+        preview=preview,
+    )
+    assert processor.render(FramePacket(0, 0.0, _frame(100)))
+    _read_part(response)
+    response.close()
+    conn.close()
+    preview.close()
+    assert threads == ["preview-encoder"]
@@ -0,0 +1,142 @@
+import queue
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from engine import multiprocess, serial
+from engine.processor import FrameProcessor
+from engine.shm_ring import SharedFrameRing
+from engine.workers import _serve
+from gestures.landmarks import HandResult, PoseResult, from_array, to_array
+from state_machine import StateMachine
+from tests.test_engine_pipelined import (
+    FakeCapture,
+    FakeGate,
+    FakeHandDetector,
+    FakePoseDetector,
+)
+
+
+@pytest.fixture
+def ring():
+    r = SharedFrameRing(3, 4, 4)
+    yield r
+    r.close()
+
+
+# ---------------------------------------------------------------------------
+# SharedFrameRing
+# ---------------------------------------------------------------------------
+
+def test_ring_attach_by_name_sees_same_pixels(ring):
+    ring.write(1, np.full((4, 4, 3), 7, dtype=np.uint8))
+    other = SharedFrameRing(3, 4, 4, name=ring.name)
+    try:
+        assert int(other.view(1)[2, 2, 0]) == 7
+        other.view(2)[:] = 9
+        assert int(ring.view(2)[0, 0, 0]) == 9
+    finally:
+        other.close()
+
+
+def test_ring_rejects_wrong_shape(ring):
+    with pytest.raises(ValueError):
+        ring.write(0, np.zeros((8, 8, 3), dtype=np.uint8))
+
+
+def test_ring_slot_for_wraps(ring):
+    assert [ring.slot_for(i) for i in range(5)] == [0, 1, 2, 0, 1]
+
+
+# ---------------------------------------------------------------------------
+# Worker loop
+# ---------------------------------------------------------------------------
+
+def test_serve_returns_compact_results(ring):
+    ring.write(0, np.full((4, 4, 3), 4, dtype=np.uint8))
+    jobs, results = queue.Queue(), queue.Queue()
+    jobs.put((11, 0))
+    jobs.put(None)
+    detector = MagicMock()
+    detector.process.side_effect = lambda view: int(view[0, 0, 0])
+
+    _serve(detector, lambda r: r * 2, ring.name, ring.shape, ring.slots, jobs, results)
+
+    assert results.get_nowait() == (11, "ok", 8)
+    detector.close.assert_called_once()
+
+
+def test_landmark_array_round_trip():
+    src = [[SimpleNamespace(x=0.1, y=0.2, z=0.3)] * 21]
+    back = from_array(to_array(src))
+    assert len(back) == 1 and len(back[0]) == 21
+    assert back[0][0].x == pytest.approx(0.1)
+    assert back[0][0].z == pytest.approx(0.3)
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+class InlineWorkers:
+    """Runs the fake detectors synchronously, reading frames from the ring."""
+
+    def __init__(self, ring):
+        self._ring = ring
+        self._hands = FakeHandDetector()
+        self.pose = FakePoseDetector()
+        self._pending = {}
+
+    def submit_hands(self, index, slot):
+        r = self._hands.process(self._ring.view(slot))
+        self._pending[("hands", index)] = HandResult(r.hand_landmarks)
+
+    def submit_gate_model(self, index, slot):
+        result = PoseResult(self.pose.process(self._ring.view(slot)))
+        self._pending[("gate_model", index)] = result
+
+    def hands_result(self, index):
+        return self._pending.pop(("hands", index))
+
+    def gate_model_result(self, index):
+        return self._pending.pop(("gate_model", index))
+
+
+def test_multiprocess_engine_matches_serial(ring):
+    def seen_by(controller):
+        return [
+            [lm[0].y for lm in c.args[1]] for c in controller.handle_frame.call_args_list
+        ]
+
+    serial_controller = MagicMock()
+    serial_pose = FakePoseDetector()
+    serial.run(
+        FakeCapture(70),
+        FrameProcessor(
+            FakeHandDetector(),
+            serial_pose,
+            FakeGate(),
+            StateMachine(),
+            serial_controller,
+            [],
+            False,
+        ),
+        False,
+    )
+
+    mp_controller = MagicMock()
+    workers = InlineWorkers(ring)
+    multiprocess.run(
+        FakeCapture(70),
+        FrameProcessor(
+            None, None, FakeGate(), StateMachine(), mp_controller, [], False
+        ),
+        workers,
+        ring,
+        False,
+    )
+
+    assert seen_by(mp_controller) == seen_by(serial_controller)
+    assert workers.pose.calls == serial_pose.calls
@@ -0,0 +1,140 @@
+"""Serial and pipelined engines must feed the controller identically."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from engine import pipelined, serial
+from engine.processor import FrameProcessor
+from engine.queues import BLOCK
+from state_machine import StateMachine
+
+
+class LM:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class FakeCapture:
+    def __init__(self, count):
+        self._i = 0
+        self._count = count
+
+    def read(self):
+        if self._i >= self._count:
+            return False, None
+        frame = np.full((4, 4, 3), self._i, dtype=np.uint8)
+        self._i += 1
+        return True, frame
+
+
+class FakeHandDetector:
+    def process(self, frame):
+        i = int(getattr(frame, "bgr", frame)[0, 0, 0])
+        # Wrist drifts up the frame; one hand on every other frame.
+        hands = [[LM(0.5, 1.0 - i / 100)]] if i % 2 == 0 else []
+        return SimpleNamespace(hand_landmarks=hands)
+
+    def draw_landmarks(self, frame, lm):
+        pass
+
+
+class FakePoseDetector:
+    def __init__(self):
+        self.calls = []
+
+    def process(self, frame):
+        i = int(getattr(frame, "bgr", frame)[0, 0, 0])
+        self.calls.append(i)
+        return i
+
+
+class FakeGate:
+    """Raises a hand once a gate-model result exists and the wrist is above 0.9."""
+
+    model_kind = "pose"
+
+    def raised_hands(self, hands, results, age=0):
+        if results is None:
+            return []
+        return [lm for lm in hands if lm[0].y < 0.9]
+
+
+def _run(engine_run, count=70):
+    controller = MagicMock()
+    pose = FakePoseDetector()
+    processor = FrameProcessor(
+        FakeHandDetector(),
+        pose,
+        FakeGate(),
+        StateMachine(),
+        controller,
+        [],
+        gui_enabled=False,
+    )
+    engine_run(FakeCapture(count), processor)
+    seen = [
+        [lm[0].y for lm in c.args[1]] for c in controller.handle_frame.call_args_list
+    ]
+    return seen, pose.calls
+
+
+def test_pipelined_matches_serial():
+    serial_seen, serial_pose = _run(lambda cap, p: serial.run(cap, p, False))
+    piped_seen, piped_pose = _run(lambda cap, p: pipelined.run(cap, p, 2, BLOCK))
+
+    assert len(serial_seen) == 70
+    assert piped_seen == serial_seen
+    assert piped_pose == serial_pose
+    # Re-run only as the wrist drifts, not on each of the 35 hand frames.
+    assert serial_pose[0] == 0 and len(serial_pose) < 10
+
+
+def test_pipelined_stops_when_render_quits():
+    controller = MagicMock()
+    processor = FrameProcessor(
+        FakeHandDetector(),
+        FakePoseDetector(),
+        FakeGate(),
+        StateMachine(),
+        controller,
+        [],
+        False,
+    )
+    processor.render = MagicMock(return_value=False)
+    pipelined.run(FakeCapture(1000), processor, 2, BLOCK)
+    processor.render.assert_called_once()
+
+
+class FakeRecording(FakeCapture):
+    """A recording at 10 fps: frame i is stamped i / 10 s."""
+
+    frame_time = None
+
+    def read(self):
+        ok, frame = super().read()
+        if ok:
+            self.frame_time = (self._i - 1) / 10
+        return ok, frame
+
+
+def test_recordings_drive_the_controller_on_their_timestamps():
+    for engine_run in (
+        lambda cap, p: serial.run(cap, p, False),
+        lambda cap, p: pipelined.run(cap, p, 2, BLOCK),
+    ):
+        controller = MagicMock()
+        processor = FrameProcessor(
+            FakeHandDetector(),
+            FakePoseDetector(),
+            FakeGate(),
+            StateMachine(),
+            controller,
+            [],
+            False,
+        )
+        engine_run(FakeRecording(5), processor)
+        seen = [c.args[0] for c in controller.handle_frame.call_args_list]
+        assert seen == [0.0, 0.1, 0.2, 0.3, 0.4]
@@ -0,0 +1,39 @@
+import queue
+
+import pytest
+
+from engine.queues import BLOCK, DROP_OLDEST, END, BoundedQueue
+
+
+def test_drop_oldest_discards_oldest_and_counts():
+    q = BoundedQueue(2, DROP_OLDEST)
+    for i in range(5):
+        assert q.put(i)
+    assert q.dropped == 3
+    assert [q.get(timeout=0), q.get(timeout=0)] == [3, 4]
+
+
+def test_block_times_out_when_full():
+    q = BoundedQueue(1, BLOCK)
+    assert q.put("a")
+    assert q.put("b", timeout=0.01) is False
+    assert q.dropped == 0
+    assert q.get(timeout=0) == "a"
+
+
+def test_get_raises_empty_on_timeout():
+    q = BoundedQueue(1)
+    with pytest.raises(queue.Empty):
+        q.get(timeout=0.01)
+
+
+def test_end_marker_passes_through():
+    q = BoundedQueue(1, DROP_OLDEST)
+    q.put("stale")
+    q.put(END)
+    assert q.get(timeout=0) is END
+
+
+def test_unknown_policy_rejected():
+    with pytest.raises(ValueError):
+        BoundedQueue(1, "drop_newest")
@@ -0,0 +1,96 @@
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+import config
+from controller import GestureController
+from engine.replay import ReplayRegistry, replay
+from gestures.gate_scheduler import GateModelScheduler
+from gestures.gating import PoseGate
+from gestures.landmarks import Landmark, PoseResult
+from gestures.recording import LandmarkRecorder, LandmarkRecording
+from modes import replay as replay_mode
+from state_machine import State, StateMachine
+
+
+@pytest.fixture(autouse=True)
+def fast_config(monkeypatch):
+    monkeypatch.setattr(config, "WAKE_HOLD_SECONDS", 1.0)
+    monkeypatch.setattr(config, "COMMAND_HOLD_SECONDS", 1.0)
+    monkeypatch.setattr(config, "COMMAND_TIMEOUT_SECONDS", 5.0)
+    monkeypatch.setattr(config, "COMMAND_DEBOUNCE_SECONDS", 2.0)
+
+
+def _hand(gesture_code):
+    """A raised hand; the wrist's z says which gesture it shows."""
+    return [Landmark(0.4, 0.3, gesture_code)] + [Landmark(0.4, 0.25)] * 20
+
+
+def _pose():
+    body = [Landmark(0.5, 0.2)] * 33
+    body[11], body[12] = Landmark(0.4, 0.5), Landmark(0.6, 0.5)
+    body[15], body[16] = Landmark(0.4, 0.3), Landmark(0.6, 0.8)
+    return PoseResult([body])
+
+
+def _recording(tmp_path):
+    """Fist for 1.5 s, then an index finger for 1.5 s, at 10 fps."""
+    recorder = LandmarkRecorder("pose")
+    for i in range(30):
+        recorder.add(100 + i / 10, [_hand(0.0 if i < 15 else 1.0)], ["Right"], _pose())
+    path = str(tmp_path / "session.npz")
+    recorder.save(path)
+    return LandmarkRecording.load(path)
+
+
+def _gesture(landmarks):
+    return "closed_fist" if landmarks[0].z == 0.0 else "fingers_extended:index"
+
+
+def test_replay_fires_commands_on_recorded_time(tmp_path):
+    recording = _recording(tmp_path)
+    sm = StateMachine()
+    registry = ReplayRegistry()
+    controller = GestureController(sm, registry, [], clock=None)
+
+    with patch("controller.recognize", side_effect=_gesture):
+        replay(recording, PoseGate(0.15), controller, GateModelScheduler(), registry)
+
+    assert [f.gesture for f in registry.fired] == ["fingers_extended:index"]
+    assert registry.fired[0].timestamp == pytest.approx(102.5)
+    assert sm.state == State.IDLE
+
+
+def test_replay_only_sees_gate_results_the_scheduler_would_run(tmp_path):
+    recording = _recording(tmp_path)
+    seen = []
+
+    class SpyGate(PoseGate):
+        def raised_hands(self, hands, results, age=0):
+            seen.append(age)
+            return super().raised_hands(hands, results, age)
+
+    controller = GestureController(StateMachine(), ReplayRegistry(), [], clock=None)
+    with patch("controller.recognize", side_effect=_gesture):
+        replay(recording, SpyGate(0.15), controller, GateModelScheduler(10, 0.1))
+    assert seen[:12] == list(range(10)) + [0, 1]
+
+
+def test_replay_loads_neither_mediapipe_nor_opencv():
+    code = (
+        "import sys, modes.replay; "
+        "print(sorted({'cv2', 'mediapipe'} & set(sys.modules)))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "[]"
+
+
+def test_replay_mode_rejects_zero_repeats(tmp_path):
+    _recording(tmp_path)
+    with pytest.raises(SystemExit) as exc:
+        replay_mode.run([str(tmp_path / "session.npz"), "--repeat", "0"])
+    assert exc.value.code == 2
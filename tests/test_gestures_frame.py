@@ -0,0 +1,143 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from engine.processor import FramePacket, FrameProcessor
+from gestures.frame import PreparedFrame
+from gestures.landmarks import FaceResult, Landmark
+from state_machine import StateMachine
+
+
+def _raw():
+    frame = np.zeros((2, 3, 3), dtype=np.uint8)
+    frame[:, 0] = (255, 0, 0)  # blue in BGR, left column
+    return frame
+
+
+def test_from_camera_mirrors_horizontally():
+    prepared = PreparedFrame.from_camera(_raw())
+    assert tuple(prepared.bgr[0, 2]) == (255, 0, 0)
+    assert tuple(prepared.bgr[0, 0]) == (0, 0, 0)
+
+
+def test_from_camera_writes_into_dst():
+    dst = np.empty((2, 3, 3), dtype=np.uint8)
+    prepared = PreparedFrame.from_camera(_raw(), dst=dst)
+    assert prepared.bgr is dst
+
+
+def test_rgb_is_converted_once():
+    prepared = PreparedFrame(_raw())
+    with patch("gestures.frame.cv2.cvtColor", wraps=__import__("cv2").cvtColor) as cvt:
+        first = prepared.rgb
+        second = prepared.rgb
+    assert first is second
+    assert cvt.call_count == 1
+    assert tuple(first[0, 0]) == (0, 0, 255)
+
+
+def test_mp_image_is_built_once():
+    prepared = PreparedFrame(_raw())
+    assert prepared.mp_image is prepared.mp_image
+
+
+def test_rgb_hooks_see_frame_before_overlays():
+    class DrawingHook:
+        def on_frame(self, frame, in_command_mode):
+            frame[:] = 1
+
+    class RgbHook:
+        def __init__(self):
+            self.seen = None
+
+        def on_frame(self, frame, in_command_mode):
+            pass
+
+        def on_rgb_frame(self, rgb, in_command_mode):
+            self.seen = rgb.copy()
+
+    rgb_hook = RgbHook()
+    processor = FrameProcessor(
+        None,
+        None,
+        MagicMock(),
+        StateMachine(),
+        MagicMock(),
+        [DrawingHook(), rgb_hook],
+        False,
+    )
+    packet = FramePacket(index=0, timestamp=0.0, frame=_raw())
+    processor.prepare(packet)
+
+    processor.render(packet)
+
+    assert tuple(rgb_hook.seen[0, 2]) == (0, 0, 255)
+    assert tuple(packet.frame[0, 2]) == (1, 1, 1)
+
+
+def test_from_camera_without_mirror_skips_the_copy():
+    raw = _raw()
+    assert PreparedFrame.from_camera(raw, mirror=False).bgr is raw
+
+    dst = np.empty_like(raw)
+    prepared = PreparedFrame.from_camera(raw, dst=dst, mirror=False)
+    assert prepared.bgr is dst
+    assert np.array_equal(dst, raw)
+
+
+class BlueColumnDetector:
+    """Reports one 'hand' whose wrist sits on the blue column."""
+
+    def process(self, frame):
+        cols = np.nonzero(frame.bgr[0, :, 0])[0]
+        x = (cols[0] + 0.5) / frame.bgr.shape[1]
+        return SimpleNamespace(hand_landmarks=[[Landmark(x, 0.5)]])
+
+
+def _mirror_processor(mirror_landmarks, gui_enabled=False):
+    return FrameProcessor(
+        BlueColumnDetector(),
+        None,
+        MagicMock(),
+        StateMachine(),
+        MagicMock(),
+        [],
+        gui_enabled,
+        mirror_landmarks=mirror_landmarks,
+    )
+
+
+def test_mirrored_landmarks_match_mirrored_pixels():
+    seen = []
+    for mirror_landmarks in (False, True):
+        processor = _mirror_processor(mirror_landmarks)
+        packet = FramePacket(index=0, timestamp=0.0, frame=_raw())
+        processor.prepare(packet)
+        seen.append(processor.detect_hands(packet.prepared)[0][0].x)
+    assert seen[0] == pytest.approx(seen[1])
+
+
+def test_mirrored_gate_results_match_mirrored_pixels():
+    processor = _mirror_processor(True)
+    pose = SimpleNamespace(pose_landmarks=[[Landmark(0.2, 0.3)]])
+    processor.store_gate_results(pose, 0)
+    assert processor.gate_results.result.pose_landmarks[0][0].x == pytest.approx(0.8)
+
+    processor.store_gate_results(FaceResult([(0.1, 0.2, 0.3, 0.4)]), 1)
+    x0, y0, x1, y1 = processor.gate_results.result.faces[0]
+    assert (x0, y0, x1, y1) == pytest.approx((0.7, 0.2, 0.9, 0.4))
+
+
+def test_pixels_are_flipped_only_for_display():
+    processor = _mirror_processor(True, gui_enabled=True)
+    packet = FramePacket(index=0, timestamp=0.0, frame=_raw())
+    processor.prepare(packet)
+    with patch("engine.processor.cv2.imshow") as imshow, patch(
+        "engine.processor.cv2.waitKey", return_value=-1
+    ):
+        processor.render(packet)
+    shown = imshow.call_args.args[1]
+    assert tuple(shown[0, 2]) == (255, 0, 0)
+    assert tuple(packet.frame[0, 0]) == (255, 0, 0)
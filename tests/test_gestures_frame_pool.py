@@ -0,0 +1,142 @@
+import tracemalloc
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from engine.pipelined import max_frames_in_flight
+from engine.processor import FramePacket, FrameProcessor
+from engine.queues import DROP_OLDEST, BoundedQueue
+from gestures.frame_pool import FramePool
+from state_machine import StateMachine
+
+SHAPE = (120, 160, 3)
+
+
+def _frames(count=4):
+    rng = np.random.default_rng(0)
+    return [rng.integers(0, 255, SHAPE, dtype=np.uint8) for _ in range(count)]
+
+
+def test_slots_are_reused_once_released():
+    pool = FramePool(2)
+    raw = _frames(1)[0]
+    a, b = pool.prepare(raw), pool.prepare(raw)
+    assert a.bgr is not b.bgr and a.rgb is not b.rgb
+    pool.release(a)
+    c = pool.prepare(raw)
+    assert a.bgr is c.bgr and a.rgb is c.rgb
+
+
+def test_held_frame_is_never_overwritten():
+    pool = FramePool(2)
+    first, *rest = _frames(4)
+    held = pool.prepare(first)
+    expected = held.bgr.copy()
+    # Later frames come and go, e.g. dropped while ``held`` is rendered.
+    for raw in rest * 3:
+        pool.release(pool.prepare(raw))
+    assert np.array_equal(held.bgr, expected)
+    assert pool.misses == 0
+
+
+def test_exhausted_pool_falls_back_to_fresh_buffers():
+    pool = FramePool(1)
+    raw = _frames(1)[0]
+    held = pool.prepare(raw)
+    extra = pool.prepare(raw)
+    assert extra.bgr is not held.bgr
+    assert pool.misses == 1
+    pool.release(extra)  # not pooled: ignored
+    assert pool.available == 0
+
+
+def test_pooled_frame_matches_unpooled():
+    raw = _frames(1)[0]
+    prepared = FramePool(1).prepare(raw)
+    assert np.array_equal(prepared.bgr, raw[:, ::-1])
+    assert np.array_equal(prepared.rgb, raw[:, ::-1, ::-1])
+
+
+def test_unmirrored_frames_are_not_copied():
+    raw = _frames(1)[0]
+    prepared = FramePool(1).prepare(raw, mirror=False)
+    assert prepared.bgr is raw
+    assert np.array_equal(prepared.rgb, raw[:, :, ::-1])
+
+
+def test_resolution_change_reallocates():
+    pool = FramePool(1)
+    pool.prepare(_frames(1)[0])
+    small = pool.prepare(np.zeros((10, 20, 3), dtype=np.uint8))
+    assert small.bgr.shape == (10, 20, 3)
+
+
+def test_rejects_empty_pool():
+    with pytest.raises(ValueError):
+        FramePool(0)
+
+
+def test_pipelined_pool_covers_every_packet():
+    assert max_frames_in_flight(2) == 13
+
+
+def test_dropped_packets_release_their_slot():
+    pool = FramePool(2)
+    processor = _processor(pool)
+    queue = BoundedQueue(1, DROP_OLDEST, on_drop=processor.release)
+    frames = _frames(3)
+    for i, frame in enumerate(frames):
+        packet = FramePacket(index=i, timestamp=0.0, frame=frame)
+        processor.prepare(packet)
+        queue.put(packet)
+    assert queue.dropped == 2
+    assert pool.misses == 0
+
+
+def _peak_growth(processor, frames, count):
+    """Peak traced bytes above the starting point while processing."""
+
+    def step(i):
+        packet = FramePacket(index=i, timestamp=0.0, frame=frames[i % len(frames)])
+        processor.prepare(packet)
+        packet.prepared.rgb
+        processor.release(packet)
+
+    step(0)  # warm up: the pool allocates on the first frame
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for i in range(1, count):
+            step(i)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current - base, peak - base
+
+
+def _processor(frame_pool):
+    return FrameProcessor(
+        None,
+        None,
+        MagicMock(),
+        StateMachine(),
+        MagicMock(),
+        [],
+        False,
+        frame_pool=frame_pool,
+    )
+
+
+def test_allocations_stay_flat_over_thousands_of_frames():
+    frames = _frames()
+    frame_bytes = frames[0].nbytes
+
+    growth, peak = _peak_growth(_processor(FramePool(1)), frames, 5000)
+    assert growth < frame_bytes
+    assert peak < frame_bytes  # not a single frame-sized allocation
+
+    # Sanity check: without the pool each frame allocates new buffers.
+    _, unpooled_peak = _peak_growth(_processor(None), frames, 50)
+    assert unpooled_peak >= frame_bytes
@@ -0,0 +1,57 @@
+from engine.processor import FrameProcessor
+from gestures.gate_scheduler import GateModelResult, GateModelScheduler
+from gestures.gating import PoseGate
+from gestures.landmarks import Landmark
+from gestures.pose_match import neck_y_for_hand
+from tests.test_gestures_gating import _hand, _pose
+
+
+def test_not_due_without_hands():
+    scheduler = GateModelScheduler()
+    assert not scheduler.due(0, [])
+    assert scheduler.due(0, [_hand(0.5, 0.5)])
+
+
+def test_fresh_result_is_reused_until_max_age():
+    scheduler = GateModelScheduler(max_age_frames=10, max_wrist_shift=0.1)
+    hands = [_hand(0.5, 0.5)]
+    scheduler.claim(0, hands)
+    assert not scheduler.due(9, hands)
+    assert scheduler.due(10, hands)
+
+
+def test_hand_count_change_invalidates():
+    scheduler = GateModelScheduler()
+    scheduler.claim(0, [_hand(0.3, 0.5)])
+    assert scheduler.due(1, [_hand(0.3, 0.5), _hand(0.7, 0.5)])
+
+
+def test_wrist_displacement_invalidates():
+    scheduler = GateModelScheduler(max_wrist_shift=0.1)
+    scheduler.claim(0, [_hand(0.3, 0.5), _hand(0.7, 0.5)])
+    # Order does not matter; each wrist is compared with its nearest.
+    assert not scheduler.due(1, [_hand(0.72, 0.5), _hand(0.3, 0.52)])
+    assert scheduler.due(2, [_hand(0.3, 0.5), _hand(0.7, 0.3)])
+
+
+def test_result_age():
+    assert GateModelResult("pose", 5).age(12) == 7
+
+
+def test_neck_match_refuses_stale_pose():
+    pose = _pose(0.5)
+    assert neck_y_for_hand(0.4, 0.3, pose, 0.15, age=10, max_age=10) is not None
+    assert neck_y_for_hand(0.4, 0.3, pose, 0.15, age=11, max_age=10) is None
+
+
+def test_processor_gates_with_result_age():
+    class Gate(PoseGate):
+        def raised_hands(self, hands, results, age=0):
+            self.seen = (results, age)
+            return []
+
+    gate = Gate(0.15)
+    processor = FrameProcessor(None, None, gate, None, None, [], False)
+    processor.store_gate_results("pose", 3)
+    processor.gate([[Landmark(0.5, 0.5)]], processor.gate_results, 8)
+    assert gate.seen == ("pose", 5)
@@ -0,0 +1,81 @@
+import pytest
+
+import config
+from gestures import gating
+from gestures.gating import FaceGate, HandHeuristicGate, PoseGate
+from gestures.landmarks import FaceResult, Landmark, PoseResult
+
+
+def _hand(wrist_x, wrist_y, size=0.2, z_spread=0.0):
+    """21 landmarks: wrist at the bottom, the rest spread above it."""
+    points = [Landmark(wrist_x, wrist_y, 0.0)]
+    for i in range(1, 21):
+        points.append(
+            Landmark(wrist_x + size * (i % 5) / 8, wrist_y - size * i / 20, z_spread)
+        )
+    return points
+
+
+def _pose(shoulder_y, x=0.5):
+    body = [Landmark(x, 0.2)] * 33
+    body[11] = Landmark(x - 0.1, shoulder_y)
+    body[12] = Landmark(x + 0.1, shoulder_y)
+    body[15] = Landmark(x - 0.1, shoulder_y - 0.2)  # left wrist raised
+    body[16] = Landmark(x + 0.1, shoulder_y + 0.3)
+    return PoseResult([body])
+
+
+def test_pose_gate_needs_a_matching_body_above_the_neck():
+    gate = PoseGate(match_threshold=0.15)
+    raised = _hand(0.4, 0.3)
+    assert gate.raised_hands([raised], _pose(0.5)) == [raised]
+    assert gate.raised_hands([raised], None) == []
+    assert gate.raised_hands([_hand(0.4, 0.3)], _pose(0.2)) == []
+
+
+def test_face_gate_compares_wrist_with_nearest_chin():
+    gate = FaceGate(max_face_widths=2.0)
+    faces = FaceResult([(0.45, 0.2, 0.55, 0.35)])
+    above, below, far = _hand(0.5, 0.3), _hand(0.5, 0.5), _hand(0.9, 0.3)
+    assert gate.raised_hands([above, below, far], faces) == [above]
+    assert gate.raised_hands([above], FaceResult([])) == []
+    assert gate.raised_hands([above], None) == []
+
+
+def test_heuristic_gate_needs_no_model_result():
+    gate = HandHeuristicGate(min_hand_size=0.12, max_wrist_y=0.65, max_depth_spread=0.2)
+    good = _hand(0.5, 0.5)
+    assert gate.raised_hands([good], None) == [good]
+    assert gate.raised_hands([_hand(0.5, 0.5, size=0.05)]) == []  # too far away
+    assert gate.raised_hands([_hand(0.5, 0.8)]) == []  # held low
+    assert gate.raised_hands([_hand(0.5, 0.5, z_spread=0.5)]) == []  # side-on
+
+
+def test_heuristic_gate_rejects_hanging_hand():
+    hanging = [Landmark(p.x, 1.0 - p.y) for p in _hand(0.5, 0.8)]
+    assert HandHeuristicGate(max_wrist_y=1.0).raised_hands([hanging]) == []
+
+
+@pytest.mark.parametrize(
+    "name, cls, kind",
+    [
+        ("pose", PoseGate, "pose"),
+        ("face", FaceGate, "face"),
+        ("heuristic", HandHeuristicGate, None),
+    ],
+)
+def test_build_from_config(monkeypatch, name, cls, kind):
+    monkeypatch.setattr(config, "HAND_GATE", name)
+    gate = gating.build_from_config()
+    assert isinstance(gate, cls)
+    assert gate.model_kind == kind
+
+
+def test_build_from_config_rejects_unknown(monkeypatch):
+    monkeypatch.setattr(config, "HAND_GATE", "telepathy")
+    with pytest.raises(ValueError, match="telepathy"):
+        gating.build_from_config()
+
+
+def test_heuristic_gate_has_no_model():
+    assert gating.build_gate_model(None) is None
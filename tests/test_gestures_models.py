@@ -0,0 +1,47 @@
+import pytest
+
+from gestures import models
+
+
+@pytest.fixture
+def models_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(models, "MODELS_DIR", str(tmp_path))
+    monkeypatch.setattr(models, "_buffers", {})
+    return tmp_path
+
+
+def test_model_path_unknown_variant_raises(models_dir):
+    with pytest.raises(ValueError):
+        models.model_path(models.POSE_MODELS, "ultra")
+
+
+def test_model_path_missing_file_mentions_download_url(models_dir):
+    with pytest.raises(FileNotFoundError, match="pose_landmarker_heavy"):
+        models.model_path(models.POSE_MODELS, "heavy")
+
+
+def test_model_path_returns_existing_file(models_dir):
+    (models_dir / "pose_landmarker_full.task").write_bytes(b"x")
+    path = models.model_path(models.POSE_MODELS, "full")
+    assert path == str(models_dir / "pose_landmarker_full.task")
+
+
+def test_load_buffer_reads_once_and_shares_bytes(models_dir):
+    path = models_dir / "hand_landmarker.task"
+    path.write_bytes(b"model-bytes")
+    first = models.load_buffer(str(path))
+    path.write_bytes(b"changed")
+    assert models.load_buffer(str(path)) is first
+
+
+def test_base_options_from_buffer(models_dir):
+    path = models_dir / "hand_landmarker.task"
+    path.write_bytes(b"model-bytes")
+    options = models.base_options(str(path), use_buffer=True)
+    assert options.model_asset_buffer == b"model-bytes"
+    assert options.model_asset_path is None
+
+
+def test_base_options_unknown_delegate_raises(models_dir):
+    with pytest.raises(ValueError):
+        models.base_options("x.task", delegate="tpu")
@@ -0,0 +1,98 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from engine.processor import FramePacket, FrameProcessor
+from gestures.gating import PoseGate
+from gestures.motion_gate import MotionGate
+from state_machine import State, StateMachine
+
+
+def _frame(value=0):
+    return np.full((120, 160, 3), value, dtype=np.uint8)
+
+
+def _moving(step):
+    frame = _frame()
+    frame[:, step * 10 : step * 10 + 20] = 255
+    return frame
+
+
+def test_first_frame_always_infers():
+    assert MotionGate().should_infer(_frame())
+
+
+def test_static_scene_is_skipped():
+    gate = MotionGate(recheck_frames=100)
+    gate.should_infer(_frame())
+    assert not any(gate.should_infer(_frame()) for _ in range(10))
+    assert gate.skipped_frames == 10
+
+
+def test_motion_triggers_inference():
+    gate = MotionGate(recheck_frames=100)
+    gate.should_infer(_moving(0))
+    assert gate.should_infer(_moving(3))
+
+
+def test_small_noise_is_ignored():
+    gate = MotionGate(pixel_threshold=12, recheck_frames=100)
+    gate.should_infer(_frame(100))
+    assert not gate.should_infer(_frame(105))
+
+
+def test_forced_recheck_interval():
+    gate = MotionGate(recheck_frames=4)
+    results = [gate.should_infer(_frame()) for _ in range(9)]
+    assert results == [True, False, False, False, True, False, False, False, True]
+
+
+def test_force_bypasses_gate():
+    gate = MotionGate(recheck_frames=100)
+    gate.should_infer(_frame())
+    assert gate.should_infer(_frame(), force=True)
+
+
+def test_hands_seen_keeps_inference_running():
+    gate = MotionGate(recheck_frames=100)
+    gate.should_infer(_frame())
+    gate.note_hands(True)
+    assert gate.should_infer(_frame())
+    gate.note_hands(False)
+    assert not gate.should_infer(_frame())
+
+
+def _processor(sm, gate):
+    detector = MagicMock()
+    detector.process.return_value.hand_landmarks = []
+    pose = MagicMock()
+    processor = FrameProcessor(
+        detector,
+        pose,
+        PoseGate(0.15),
+        sm,
+        MagicMock(),
+        [],
+        gui_enabled=False,
+        motion_gate=gate,
+    )
+    return processor, detector, pose
+
+
+def test_processor_skips_models_on_static_frames():
+    sm = StateMachine()
+    processor, detector, pose = _processor(sm, MotionGate(recheck_frames=100))
+    for i in range(5):
+        processor.process(FramePacket(index=i, timestamp=0.0, frame=_frame()))
+    assert detector.process.call_count == 1
+    assert pose.process.call_count == 0  # no hands, so no demand for pose
+
+
+def test_processor_bypasses_gate_in_command_mode():
+    sm = StateMachine()
+    processor, detector, _ = _processor(sm, MotionGate(recheck_frames=100))
+    processor.process(FramePacket(index=0, timestamp=0.0, frame=_frame()))
+    sm.transition_to(State.COMMAND_MODE)
+    for i in range(1, 5):
+        processor.process(FramePacket(index=i, timestamp=0.0, frame=_frame()))
+    assert detector.process.call_count == 5
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from gestures.landmarks import FaceResult, Landmark, PoseResult
+from gestures.recording import LandmarkRecorder, LandmarkRecording
+
+
+def _hand(x, y):
+    return [Landmark(x, y - i / 100, i / 1000) for i in range(21)]
+
+
+def _body(y):
+    return [Landmark(0.5, y, 0.0)] * 33
+
+
+def test_round_trip_pads_to_the_busiest_frame(tmp_path):
+    recorder = LandmarkRecorder("pose")
+    recorder.add(0.0, [], [])
+    recorder.add(
+        0.1,
+        [_hand(0.2, 0.5), _hand(0.7, 0.6)],
+        ["Left", "Right"],
+        PoseResult([_body(0.4)]),
+    )
+    recorder.add(0.2, [_hand(0.3, 0.5)], ["Right"], PoseResult([]))
+    path = str(tmp_path / "session.npz")
+    recorder.save(path)
+
+    recording = LandmarkRecording.load(path)
+    assert len(recording) == 3
+    assert recording.hands.shape == (3, 2, 21, 3)
+    assert recording.hands.dtype == np.float32
+    assert np.isnan(recording.hands[2, 1]).all()
+    assert recording.gate.shape == (3, 1, 33, 3)
+    assert recording.duration == pytest.approx(0.2)
+
+    frames = list(recording)
+    assert frames[0].hands == [] and frames[0].gate_result is None
+    assert frames[1].timestamp == pytest.approx(0.1)
+    assert frames[1].handedness == ["Left", "Right"]
+    assert frames[1].hands[1][0] == pytest.approx(_hand(0.7, 0.6)[0])
+    assert len(frames[1].gate_result.pose_landmarks) == 1
+    # Ran but found nobody is not the same as did not run.
+    assert frames[2].gate_result == PoseResult([])
+
+
+def test_face_boxes_round_trip(tmp_path):
+    recorder = LandmarkRecorder("face")
+    recorder.add(0.0, [_hand(0.5, 0.3)], ["Left"], FaceResult([(0.4, 0.1, 0.6, 0.3)]))
+    path = str(tmp_path / "faces.npz")
+    recorder.save(path)
+
+    recording = LandmarkRecording.load(path)
+    assert recording.gate_model == "face"
+    boxes = recording.frame(0).gate_result.faces
+    assert boxes == [pytest.approx((0.4, 0.1, 0.6, 0.3))]
+
+
+def test_recording_without_a_gate_model(tmp_path):
+    recorder = LandmarkRecorder(None)
+    recorder.add(0.0, [_hand(0.5, 0.3)], ["Left"], None)
+    path = str(tmp_path / "plain.npz")
+    recorder.save(path)
+
+    recording = LandmarkRecording.load(path)
+    assert recording.gate_model is None
+    assert recording.frame(0).gate_result is None
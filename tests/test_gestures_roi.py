@@ -0,0 +1,114 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from gestures.landmarks import Landmark
+from gestures.roi import RoiHandTracker, crop_box, to_full_frame
+
+W, H = 640, 480
+
+
+def _hand(cx, cy, size=0.1):
+    """21 landmarks spread over a square of ``size`` centred on (cx, cy)."""
+    pts = [Landmark(cx - size / 2, cy + size / 2)]  # wrist bottom-left
+    pts += [Landmark(cx + size / 2, cy - size / 2)] * 20
+    return pts
+
+
+class FakeDetector:
+    def __init__(self, results):
+        self._results = list(results)
+        self.shapes = []
+
+    def process(self, frame):
+        self.shapes.append(frame.bgr.shape[:2])
+        hands = self._results.pop(0)
+        return SimpleNamespace(hand_landmarks=hands, handedness=[[]] * len(hands))
+
+    def close(self):
+        pass
+
+
+def _frame():
+    return np.zeros((H, W, 3), dtype=np.uint8)
+
+
+# ---------------------------------------------------------------------------
+# Geometry
+# ---------------------------------------------------------------------------
+
+def test_crop_box_is_padded_square_inside_frame():
+    x0, y0, x1, y1 = crop_box(_hand(0.5, 0.5), W, H, padding=0.5, min_size=10)
+    assert x1 - x0 == y1 - y0
+    assert x1 - x0 == pytest.approx(0.1 * W * 2, abs=1)
+    assert 0 <= x0 and x1 <= W and 0 <= y0 and y1 <= H
+
+
+def test_crop_box_clamps_at_frame_edge():
+    x0, y0, x1, y1 = crop_box(_hand(0.01, 0.99), W, H, padding=0.5, min_size=10)
+    assert x0 == 0
+    assert y1 == H
+
+
+def test_to_full_frame_maps_crop_coordinates():
+    box = (100, 50, 300, 250)
+    [lm] = to_full_frame([Landmark(0.5, 0.25, 0.1)], box, W, H)
+    assert lm.x == pytest.approx(200 / W)
+    assert lm.y == pytest.approx(100 / H)
+    assert lm.z == pytest.approx(0.1 * 200 / W)
+
+
+# ---------------------------------------------------------------------------
+# Tracker
+# ---------------------------------------------------------------------------
+
+def test_tracked_hand_uses_crop_and_maps_back():
+    crop_hand = _hand(0.5, 0.5, size=0.5)
+    full = FakeDetector([[_hand(0.5, 0.5)]])
+    crop = FakeDetector([[crop_hand]])
+    tracker = RoiHandTracker(full, crop, max_hands=2, padding=0.5, min_crop_size=10)
+
+    tracker.process(_frame())
+    result = tracker.process(_frame())
+
+    assert tracker.full_frame_passes == 1
+    assert tracker.crop_passes == 1
+    side = crop.shapes[0][0]
+    assert crop.shapes[0] == (side, side) and side < H
+    assert result.hand_landmarks[0][0].x == pytest.approx(0.5 - 0.25 * side / W, abs=0.01)
+
+
+def test_lost_track_falls_back_to_full_frame():
+    full = FakeDetector([[_hand(0.5, 0.5)], [_hand(0.2, 0.2)]])
+    crop = FakeDetector([[]])
+    tracker = RoiHandTracker(full, crop, max_hands=2)
+
+    tracker.process(_frame())
+    result = tracker.process(_frame())
+
+    assert tracker.full_frame_passes == 2
+    assert result.hand_landmarks[0][0].x == pytest.approx(0.15)
+
+
+def test_no_tracks_always_runs_full_frame():
+    full = FakeDetector([[], []])
+    tracker = RoiHandTracker(full, FakeDetector([]), max_hands=2)
+    tracker.process(_frame())
+    tracker.process(_frame())
+    assert tracker.full_frame_passes == 2
+    assert tracker.crop_passes == 0
+
+
+def test_full_frame_forced_every_interval():
+    hand = _hand(0.5, 0.5)
+    full = FakeDetector([[hand]] * 3)
+    crop = FakeDetector([[_hand(0.5, 0.5, 0.5)]] * 4)
+    tracker = RoiHandTracker(full, crop, max_hands=1, full_frame_interval=2)
+
+    for _ in range(6):
+        tracker.process(_frame())
+
+    # full, crop, crop, full, crop, crop
+    assert tracker.full_frame_passes == 2
+    assert tracker.crop_passes == 4
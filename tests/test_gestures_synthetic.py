@@ -0,0 +1,67 @@
+import itertools
+import math
+import random
+
+import pytest
+
+from gestures import synthetic
+from gestures.gating import PoseGate
+from gestures.pose_match import neck_y_for_hand
+from gestures.recognizer import recognize
+
+ALL_GESTURES = ["closed_fist"] + [
+    "fingers_extended:" + "+".join(combo)
+    for n in range(1, 6)
+    for combo in itertools.combinations(synthetic.FINGERS, n)
+]
+
+
+@pytest.mark.parametrize("gesture", ALL_GESTURES)
+@pytest.mark.parametrize("mirror", [False, True])
+def test_recognize_reads_back_every_gesture(gesture, mirror):
+    rng = random.Random(0)
+    for _ in range(20):
+        lm = synthetic.hand(gesture, mirror=mirror, noise=0.002, rng=rng)
+        assert len(lm) == 21
+        assert recognize(lm) == gesture
+
+
+def test_sideways_hand_is_no_hand():
+    assert recognize(synthetic.hand("closed_fist", rotation=math.pi / 2)) == "no_hand"
+
+
+@pytest.mark.parametrize("gesture", ["no_hand", "fingers_extended:toe"])
+def test_unknown_gestures_are_rejected(gesture):
+    with pytest.raises(ValueError):
+        synthetic.hand(gesture)
+
+
+def test_person_wrist_matches_hand_and_sets_neck():
+    pose = synthetic.PoseResult([synthetic.person((0.3, 0.2), shoulder_y=0.5)])
+    assert len(pose.pose_landmarks[0]) == 33
+    assert neck_y_for_hand(0.3, 0.2, pose, 0.05) == pytest.approx(0.425)
+    assert neck_y_for_hand(0.9, 0.9, pose, 0.05) is None
+
+
+def test_stream_follows_the_script():
+    script = [("no_hand", 0.5), ("closed_fist", 1.0)]
+    frames = list(synthetic.stream(script, fps=10, hands=3))
+
+    assert len(frames) == 15
+    assert [f.timestamp for f in frames[:2]] == [0.0, 0.1]
+    assert len(frames[0].hands) == 2  # only the bystanders
+    assert frames[-1].gestures[0] == "closed_fist"
+    assert [recognize(lm) for lm in frames[-1].hands] == frames[-1].gestures
+    # Only the scripted hand is raised.
+    gate = PoseGate(0.15)
+    raised = gate.raised_hands(frames[-1].hands, frames[-1].pose_result)
+    assert raised == frames[-1].hands[:1]
+
+
+def test_stream_is_seeded_and_drops_hands():
+    script = [("closed_fist", 10.0)]
+    first = list(synthetic.stream(script, hands=2, dropout=0.25, seed=7))
+    again = list(synthetic.stream(script, hands=2, dropout=0.25, seed=7))
+    assert first == again
+    present = sum(len(f.hands) for f in first) / (2 * len(first))
+    assert 0.65 < present < 0.85
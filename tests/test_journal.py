@@ -0,0 +1,113 @@
+import os
+import time
+
+import pytest
+
+import bus
+import journal
+from modes import journal as journal_mode
+from state_machine import State, StateMachine
+
+
+@pytest.fixture
+def directory(tmp_path):
+    return str(tmp_path / "journal")
+
+
+def _segments(directory):
+    return sorted(os.listdir(directory))
+
+
+def test_controller_events_round_trip(directory):
+    j = journal.Journal(directory).start()
+    sm = StateMachine()
+    bus.emit("wake_started", now=1.0, gesture="closed_fist")
+    sm.transition_to(State.COMMAND_MODE)
+    bus.emit("gesture_hold_started", now=2.0, gesture="fingers_extended:index")
+    bus.emit("command_dispatched", now=3.0, gesture="fingers_extended:index")
+    bus.emit("command_executed", now=3.0, gesture="fingers_extended:index", error="x")
+    bus.emit("command_mode_timed_out", now=4.0)
+    j.close()
+
+    records = list(journal.read(directory))
+    assert [r.kind for r in records] == [
+        "wake", "state", "hold", "dispatch", "result", "timeout"
+    ]
+    assert records[0].gesture == "closed_fist"
+    assert (records[1].old, records[1].new) == (State.IDLE, State.COMMAND_MODE)
+    assert records[4].failed
+    assert [r.mono_ns for r in records] == sorted(r.mono_ns for r in records)
+    assert records[0].wall_time == pytest.approx(time.time(), abs=5)
+
+
+def test_closed_journal_stops_listening(directory):
+    j = journal.Journal(directory).start()
+    j.close()
+    bus.emit("command_mode_timed_out", now=0.0)
+    assert list(journal.read(directory)) == []
+
+
+def test_segments_are_fixed_size_and_rotate(directory):
+    # Four 64-byte slots per segment: a header and three records.
+    j = journal.Journal(directory, segment_bytes=256, max_segments=2).start()
+    for i in range(8):
+        j.append("hold", f"g{i}")
+    j.close()
+
+    names = _segments(directory)
+    assert names == ["journal-000001.bin", "journal-000002.bin"]
+    assert {os.path.getsize(os.path.join(directory, n)) for n in names} == {256}
+    gestures = [r.gesture for r in journal.read(directory)]
+    assert gestures == ["g3", "g4", "g5", "g6", "g7"]
+
+
+def test_every_run_starts_a_new_segment(directory):
+    for gesture in ("first", "second"):
+        j = journal.Journal(directory).start()
+        j.append("dispatch", gesture)
+        j.close()
+    assert len(_segments(directory)) == 2
+    assert [r.gesture for r in journal.read(directory)] == ["first", "second"]
+
+
+def test_long_gesture_names_are_truncated(directory):
+    j = journal.Journal(directory).start()
+    j.append("hold", "x" * 80)
+    j.close()
+    assert next(journal.read(directory)).gesture == "x" * 52
+
+
+def test_read_filters(directory):
+    j = journal.Journal(directory).start()
+    j.append("hold", "a")
+    j.append("dispatch", "a")
+    j.append("dispatch", "b")
+    j.close()
+
+    dispatches = journal.read(directory, kinds={"dispatch"})
+    assert [r.gesture for r in dispatches] == ["a", "b"]
+    for_a = journal.read(directory, gesture="a")
+    assert [r.kind for r in for_a] == ["hold", "dispatch"]
+    assert list(journal.read(directory, since=time.time() + 60)) == []
+
+
+def test_journal_mode_prints_the_tail(directory, capsys):
+    j = journal.Journal(directory).start()
+    for gesture in ("a", "b", "c"):
+        j.append("result", gesture, failed=gesture == "c")
+    j.close()
+
+    journal_mode.run(["--dir", directory, "--tail", "2"])
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 2
+    assert lines[0].endswith("result   b ok")
+    assert lines[1].endswith("result   c failed")
+
+
+def test_missing_directory_has_no_records(tmp_path, capsys):
+    missing = str(tmp_path / "missing")
+    assert list(journal.read(missing)) == []
+    with pytest.raises(SystemExit) as exc:
+        journal_mode.run(["--dir", missing])
+    assert exc.value.code == 1
+    assert "no journal" in capsys.readouterr().out
@@ -0,0 +1,25 @@
+import math
+
+from stats import percentile, summarize
+
+
+def test_percentile_nearest_rank():
+    samples = list(range(1, 101))
+    assert percentile(samples, 50) == 50
+    assert percentile(samples, 95) == 95
+    assert percentile(samples, 99) == 99
+    assert percentile(samples, 100) == 100
+
+
+def test_summarize_unsorted_samples():
+    result = summarize([3.0, 1.0, 2.0])
+    assert result["count"] == 3
+    assert result["mean"] == 2.0
+    assert result["p50"] == 2.0
+    assert result["p99"] == 3.0
+
+
+def test_summarize_empty():
+    result = summarize([])
+    assert result["count"] == 0
+    assert math.isnan(result["mean"])